@@ -9,11 +9,14 @@ import traceback
 from pathlib import Path
 from typing import List, NoReturn
 
+from spex.compression import COMPRESSIONS, strip_suffix
+from spex.jsonspec.figcache import DEFAULT_MAX_BYTES
 from spex.jsonspec.lint import Code
 from spex.jsonspec.parserargs import ParserArgs
 from spex.log import ULog, logger
 from spex.parse import parse_spec
 from spex.validate import validate_json
+from spex.writer import OUTPUT_FORMATS
 
 
 def arg_input(arg: str) -> Path:
@@ -35,6 +38,20 @@ def arg_output(arg: str) -> Path:
     return p
 
 
+def arg_jobs(arg: str) -> int:
+    jobs = int(arg)
+    if jobs < 1:
+        raise RuntimeError("number of jobs must be at least 1")
+    return jobs
+
+
+def arg_cache_size(arg: str) -> int:
+    size_mib = int(arg)
+    if size_mib < 1:
+        raise RuntimeError("cache size must be at least 1 MiB")
+    return size_mib * 1024 * 1024
+
+
 def arg_lintcode(arg: str) -> List[Code]:
     return [Code[c.strip().upper()] for c in arg.split(",")]
 
@@ -112,6 +129,111 @@ def main() -> None:
         "-v", "--verbose", action=argparse.BooleanOptionalAction, default=False
     )
     cli_parser.add_argument("--lint-ignore", type=arg_lintcode, default=[])
+    cli_parser.add_argument(
+        "--stream-docx",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Read the body of .docx specifications incrementally, processing each"
+            " table as soon as it is read, rather than loading the whole body."
+            " Figures are still extracted from an HTML model held in memory"
+        ),
+    )
+    cli_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=arg_jobs,
+        default=1,
+        help=(
+            "Number of worker processes to use when rendering .docx specifications"
+            " into HTML and when extracting figures (default: 1, no worker processes)"
+        ),
+    )
+    cli_parser.add_argument(
+        "--write-html",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Write the HTML model and CSS sheet of .docx specifications to the"
+            " output directory. Figures are extracted from the HTML model in"
+            " memory either way"
+        ),
+    )
+    cli_parser.add_argument(
+        "--compact-html",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Write the HTML model without indentation and line breaks, omitting"
+            " <span> wrappers of unformatted text. Figures extracted from a"
+            " compact HTML model are identical"
+        ),
+    )
+    cli_parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help=(
+            "Format of the NVMe model: a single JSON document (json), one entity"
+            " per line followed by a meta record (jsonl) or a compact binary file"
+            " with an entity index, see spex.binmodel (binary) (default: json)"
+        ),
+    )
+    cli_parser.add_argument(
+        "--compress",
+        dest="compression",
+        choices=COMPRESSIONS,
+        default="none",
+        help=(
+            "Compress the HTML model, CSS sheet and NVMe model written, appending"
+            " .gz (gzip) or .zst (zstd) to their file names. Compressed HTML"
+            " models and NVMe models are read transparently. Binary NVMe models"
+            " cannot be compressed (default: none)"
+        ),
+    )
+    cli_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory of a cache of extracted figures. Figures whose HTML is"
+            " unchanged since a previous run are served from the cache rather"
+            " than extracted again"
+        ),
+    )
+    cli_parser.add_argument(
+        "--cache-size",
+        type=arg_cache_size,
+        default=DEFAULT_MAX_BYTES,
+        metavar="MIB",
+        help=(
+            "Size bound of the figure cache in MiB, least recently used entries"
+            f" are evicted first (default: {DEFAULT_MAX_BYTES // (1024 * 1024)})"
+        ),
+    )
+    cli_parser.add_argument(
+        "--record-fingerprints",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Record a content fingerprint of each figure in the meta block of the"
+            " NVMe model, permitting later runs to build on it using"
+            " --incremental-from"
+        ),
+    )
+    cli_parser.add_argument(
+        "--incremental-from",
+        type=Path,
+        default=None,
+        metavar="MODEL",
+        help=(
+            "NVMe model of a previous revision of the specification, generated"
+            " with fingerprints recorded. Figures which are unchanged since are"
+            " taken from this model rather than extracted again. Implies"
+            " --record-fingerprints"
+        ),
+    )
 
     args = cli_parser.parse_args()
 
@@ -125,12 +247,24 @@ def main() -> None:
         lint_codes_ignore=args.lint_ignore,
         validate_json=args.validate_json,
         verbose=args.verbose,
+        stream_docx=args.stream_docx,
+        jobs=args.jobs,
+        write_html=args.write_html,
+        compact_html=args.compact_html,
+        output_format=args.output_format,
+        compression=args.compression,
+        cache_dir=args.cache_dir,
+        cache_size=args.cache_size,
+        incremental_from=args.incremental_from,
+        record_fingerprints=args.record_fingerprints,
     )
 
     try:
         for spec in args.input:
             logger.log(ULog.INFO, f"parsing '{spec}'...")
-            if spec.suffix == ".json":
+            # compressed HTML models are read as-is
+            suffix = strip_suffix(spec).suffix
+            if suffix == ".json":
                 # lint code filtering is applied at the point of writing the lint errors
                 # into the resulting NVMe (JSON) model.
                 sys.stderr.write(
@@ -140,7 +274,7 @@ def main() -> None:
                 sys.stderr.flush()
                 sys.exit(1)
 
-            if spec.suffix not in (".html", ".docx"):
+            if spec.suffix != ".docx" and suffix != ".html":
                 sys.stderr.write(
                     f"invalid input file ({spec!s}), "
                     "requires a HTML model or the docx specification file\n"
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compact binary container for the NVMe model.
+
+Layout:
+  * header: `MAGIC`
+  * one record per entity, each the compact UTF-8 JSON encoding of the entity
+  * the meta block, encoded like entities
+  * the index, a JSON object of the form
+    `{"meta": [off, len], "entities": [[fig_id, off, len], ...]}`
+  * footer: index offset and length (little-endian u64 each), followed by `MAGIC`
+
+Records are written as entities arrive, the index goes last. A file missing
+its footer was not completely written. `BinaryModelReader` memory-maps the
+file and decodes entities on demand, so reading a single figure does not
+require decoding the whole model.
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, cast
+
+from spex.jsonspec.defs import JSON
+
+MAGIC = b"SPEXS2M\x01"
+FOOTER = struct.Struct("<QQ")
+
+# (fig_id, offset, length)
+IndexEntry = Tuple[Optional[str], int, int]
+
+
+def encode(val: JSON) -> bytes:
+    return json.dumps(val, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_header(fh: BinaryIO) -> None:
+    fh.write(MAGIC)
+
+
+def write_trailer(
+    fh: BinaryIO, meta: Tuple[int, int], entities: List[IndexEntry]
+) -> None:
+    """write index and footer, `fh` must be positioned at the end of the records."""
+    index = encode({"meta": list(meta), "entities": [list(e) for e in entities]})
+    index_off = fh.tell()
+    fh.write(index)
+    fh.write(FOOTER.pack(index_off, len(index)))
+    fh.write(MAGIC)
+
+
+class BinaryModelReader:
+    """read NVMe model from a binary model file, decoding entities on demand."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._fh = open(path, "rb")
+        try:
+            self._buf = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file, cannot be mapped
+            self._fh.close()
+            raise ValueError(f"{path!s}: not a spex binary model")
+        try:
+            self._entities, self._meta_loc = self._read_index()
+        except ValueError:
+            self.close()
+            raise
+        # some figures yield several entities of the same ID, like
+        # `FigureIndex`, look-ups by ID return the first of these.
+        self._by_fig_id: Dict[str, int] = {}
+        for ndx, (fig_id, _, _) in enumerate(self._entities):
+            if fig_id is not None:
+                self._by_fig_id.setdefault(fig_id, ndx)
+        self._meta: Optional[Dict[str, JSON]] = None
+
+    def _read_index(self) -> Tuple[List[IndexEntry], Tuple[int, int]]:
+        buf = self._buf
+        magic_len = len(MAGIC)
+        footer_off = len(buf) - FOOTER.size - magic_len
+        magic_off = footer_off + FOOTER.size
+        if (
+            footer_off < magic_len
+            or buf[:magic_len] != MAGIC
+            or buf[magic_off:] != MAGIC
+        ):
+            raise ValueError(f"{self._path!s}: not a spex binary model, or truncated")
+        index_off, index_len = FOOTER.unpack_from(buf, footer_off)
+        index = json.loads(self._read(index_off, index_len))
+        entities = [(fig_id, off, ln) for fig_id, off, ln in index["entities"]]
+        meta_off, meta_len = index["meta"]
+        return entities, (meta_off, meta_len)
+
+    def _read(self, off: int, ln: int) -> bytes:
+        end = off + ln
+        return self._buf[off:end]
+
+    def _decode(self, off: int, ln: int) -> JSON:
+        return cast(JSON, json.loads(self._read(off, ln)))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def meta(self) -> Dict[str, JSON]:
+        if self._meta is None:
+            meta = self._decode(*self._meta_loc)
+            if not isinstance(meta, dict):
+                raise ValueError(f"{self._path!s}: meta block is not an object")
+            self._meta = meta
+        return self._meta
+
+    @property
+    def fig_ids(self) -> List[str]:
+        """figure IDs of entities, in model order."""
+        return [fig_id for fig_id, _, _ in self._entities if fig_id is not None]
+
+    def entity(self, fig_id: str) -> JSON:
+        """decode entity of figure `fig_id`.
+
+        If several entities have the ID `fig_id`, the first is returned.
+
+        Raises:
+            KeyError: if model has no entity for the figure."""
+        _, off, ln = self._entities[self._by_fig_id[fig_id]]
+        return self._decode(off, ln)
+
+    def entities(self) -> Iterator[JSON]:
+        """decode all entities, in model order."""
+        for _, off, ln in self._entities:
+            yield self._decode(off, ln)
+
+    def __contains__(self, fig_id: object) -> bool:
+        return fig_id in self._by_fig_id
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def close(self) -> None:
+        self._buf.close()
+        self._fh.close()
+
+    def __enter__(self) -> "BinaryModelReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
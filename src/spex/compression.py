@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Transparent compression of the files spex writes and reads.
+
+Compressed files are named by appending the suffix of the compression to the
+name of the uncompressed file, e.g. `nvme.html.gz` or `nvme.json.zst`. Files
+are opened with `open_file`, which (de)compresses their contents according to
+this suffix, such that readers need not know whether a file is compressed.
+
+gzip support is built into Python, zstd requires the `zstandard` package.
+"""
+
+import gzip
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, cast
+
+NONE = "none"
+GZIP = "gzip"
+ZSTD = "zstd"
+
+COMPRESSIONS = (NONE, GZIP, ZSTD)
+
+_SUFFIXES: Dict[str, str] = {GZIP: ".gz", ZSTD: ".zst"}
+_BY_SUFFIX: Dict[str, str] = {sfx: c for c, sfx in _SUFFIXES.items()}
+
+
+def suffix(compression: str) -> str:
+    """return file suffix of `compression`, empty if uncompressed."""
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"unknown compression {compression!r}")
+    return _SUFFIXES.get(compression, "")
+
+
+def compression_of(path: Path) -> str:
+    """return compression of `path`, as indicated by its suffix."""
+    return _BY_SUFFIX.get(path.suffix, NONE)
+
+
+def strip_suffix(path: Path) -> Path:
+    """return `path` without its compression suffix, if any.
+
+    E.g. `nvme.html.gz` -> `nvme.html`, such that `suffix` of the result is the
+    suffix of the uncompressed file."""
+    if compression_of(path) == NONE:
+        return path
+    return path.with_suffix("")
+
+
+def open_file(
+    path: Path, mode: str = "r", compression: Optional[str] = None
+) -> IO[Any]:
+    """open file, (de)compressing its contents.
+
+    Text is encoded as UTF-8.
+
+    Args:
+        path: file to open
+        mode: as for `open`, e.g. "r", "w", "rb" or "wb"
+        compression: compression of the file contents, by default derived from
+            the suffix of `path`, see `compression_of`.
+    """
+    if compression is None:
+        compression = compression_of(path)
+    binary = "b" in mode
+    if not binary and "t" not in mode:
+        # compressed streams default to binary mode
+        mode += "t"
+    encoding = None if binary else "utf-8"
+
+    if compression == NONE:
+        return open(path, mode, encoding=encoding)
+    elif compression == GZIP:
+        return cast(IO[Any], gzip.open(path, mode, encoding=encoding))
+    elif compression == ZSTD:
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(
+                "zstd compression requires the `zstandard` package to be installed"
+            )
+        return zstandard.open(path, mode, encoding=encoding)
+    raise ValueError(f"unknown compression {compression!r}")
+
+
+def read_text(path: Path) -> str:
+    """return the decompressed text of `path`."""
+    with open_file(path, "r") as fh:
+        return fh.read()
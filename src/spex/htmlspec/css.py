@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from typing import Dict, List, Optional, Protocol, Union
+from typing import Dict, List, Optional, Protocol, Union, cast
 
 from gcgen.api import Section
 
@@ -43,6 +43,17 @@ class CssCache:
         self.__cache[elem] = clsname
         return clsname
 
+    def merge(self, other: "CssCache") -> Dict[str, str]:
+        """register the entries of `other`, in the order `other` assigned them.
+
+        Returns:
+            mapping from class names in `other` to the class names in this cache.
+        """
+        return {
+            other_clsname: cast(str, self.get_clsname(css_obj))
+            for css_obj, other_clsname in other.__cache.items()
+        }
+
     def emit_rules(self, s: Section) -> None:
         for css_obj, clsname in self.__cache.items():
             css_block(s, f".{clsname}", css_obj.css_attrs)
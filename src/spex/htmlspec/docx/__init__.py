@@ -2,7 +2,8 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from spex.htmlspec.docx.document import Document
+from spex.htmlspec.docx.document import Document, TableInfo
+from spex.htmlspec.docx.docxutils import DocxPackage
 from spex.htmlspec.docx.numbering import AbstractNum, AbstractNumLvl, NumberingDocument
 from spex.htmlspec.docx.runproperties import RunProperties
 from spex.htmlspec.docx.tablewrap import TableWrap
@@ -10,10 +11,12 @@ from spex.htmlspec.docx.tags import Tag
 
 __all__ = [
     "Document",
+    "DocxPackage",
     "AbstractNum",
     "AbstractNumLvl",
     "NumberingDocument",
     "RunProperties",
+    "TableInfo",
     "TableWrap",
     "Tag",
 ]
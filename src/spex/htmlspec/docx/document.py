@@ -2,12 +2,14 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
 
+from lxml import etree
 from lxml.etree import _Element
 
-from spex.htmlspec.docx.docxutils import docx_extract_contents
+from spex.htmlspec.docx.docxutils import DocxPackage
 from spex.htmlspec.docx.header import Header
 from spex.htmlspec.docx.numbering import NumberingDocument
 from spex.htmlspec.docx.runproperties import RunProperties
@@ -16,22 +18,67 @@ from spex.htmlspec.docx.tags import Tag
 from spex.xml import Xpath
 
 
+@dataclass(frozen=True)
+class TableInfo:
+    """position of a table (w:tbl) within the document's table hierarchy."""
+
+    elem: _Element
+    # 0 for top-level tables, 1 for tables nested inside those and so on.
+    depth: int
+    # innermost table containing this table, if any.
+    parent: Optional[_Element]
+
+    @property
+    def is_nested(self) -> bool:
+        return self.parent is not None
+
+
 class Document:
     __numbering_xml: Optional[NumberingDocument]
     __header: Header
+    __package: Optional[DocxPackage]
+    __table_index: Optional[List[TableInfo]]
+    # run properties of paragraphs and runs, keyed on the serialized run
+    # properties element (w:rPr) and, for paragraphs, the paragraph style.
+    __p_rpr_cache: Dict[Tuple[Optional[str], bytes], Optional[RunProperties]]
+    __r_rpr_cache: Dict[bytes, Optional[RunProperties]]
+    # one shared instance per distinct set of run properties
+    __rpr_interned: Dict[Tuple[Any, ...], RunProperties]
 
-    def __init__(self, doc_path: Path):
+    def __init__(self, doc_path: Path, streaming: bool = False):
+        """open docx document.
+
+        Args:
+          * doc_path: path to the docx document.
+          * streaming: if True, the document body (word/document.xml) is not
+                loaded up-front. Instead, tables are parsed incrementally from
+                the archive as `iter_tables` is iterated and discarded again once
+                processed, keeping memory use flat regardless of document size.
+        """
         assert doc_path.exists(), "provided document does not exist"
-        self._elem = docx_extract_contents(doc_path, "word/document.xml")
         self.__path = doc_path
-        try:
-            self.__numbering_xml = NumberingDocument(doc_path)
-        except KeyError:
-            # not all documents have a numbering.xml file
-            # (presumably only if it contains lists)
-            self.__numbering_xml = None
-        self.__header = Header(doc_path)
-        self.__styles = StylesDocument(doc_path)
+        self.__streaming = streaming
+        self.__table_index = None
+        self.__p_rpr_cache = {}
+        self.__r_rpr_cache = {}
+        self.__rpr_interned = {}
+        pkg = DocxPackage(doc_path)
+        self._elem: Optional[_Element] = (
+            None if streaming else pkg.part("word/document.xml")
+        )
+        # not all documents have a numbering.xml file
+        # (presumably only if it contains lists)
+        self.__numbering_xml = (
+            NumberingDocument(pkg) if pkg.has_part("word/numbering.xml") else None
+        )
+        self.__header = Header(pkg)
+        self.__styles = StylesDocument(pkg)
+        if streaming:
+            # body is read from the archive on demand.
+            self.__package = pkg
+        else:
+            pkg.close()
+            self.__package = None
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}<path: {str(self.__path)}>"
@@ -45,9 +92,113 @@ class Document:
         """path to document."""
         return self.__path
 
+    @property
+    def streaming(self) -> bool:
+        """true if document body is parsed incrementally.
+
+        See `iter_top_level_tables`."""
+        return self.__streaming
+
+    @property
+    def table_index(self) -> List[TableInfo]:
+        """all tables (w:tbl) in document order, including nested tables.
+
+        NOTE: the index is built once, on first access."""
+        if self._elem is None:
+            raise RuntimeError(
+                "table index unavailable for streaming documents,"
+                " use `iter_top_level_tables`"
+            )
+        if self.__table_index is None:
+            self.__table_index = self.__build_table_index(self._elem)
+        return self.__table_index
+
     @property
     def tables(self) -> List[_Element]:
-        return Xpath.elems(self._elem, ".//w:tbl")
+        return [entry.elem for entry in self.table_index]
+
+    @staticmethod
+    def __build_table_index(root: _Element) -> List[TableInfo]:
+        index: List[TableInfo] = []
+        depths: Dict[_Element, int] = {}
+        for tbl in root.iter(Tag.tbl.value):
+            # tables are visited in document order, so any enclosing table
+            # has already been indexed.
+            parent = next(tbl.iterancestors(Tag.tbl.value), None)
+            depth = 0 if parent is None else depths[parent] + 1
+            depths[tbl] = depth
+            index.append(TableInfo(elem=tbl, depth=depth, parent=parent))
+        return index
+
+    @property
+    def num_tables(self) -> int:
+        """number of tables (w:tbl), including nested tables, in the document.
+
+        NOTE: for streaming documents, this requires a (memory-light) pass over
+              the document body."""
+        if self._elem is not None:
+            return len(self.table_index)
+        count = 0
+        with self.__open_body() as fh:
+            for _, elem in etree.iterparse(fh, events=("end",)):
+                if elem.tag == Tag.tbl.value:
+                    count += 1
+                if self.__is_body_child(elem):
+                    self.__discard(elem)
+        return count
+
+    def iter_top_level_tables(self) -> Iterator[_Element]:
+        """yield every top-level table (w:tbl) in document order.
+
+        Nested tables are not yielded, they are reached through their parent.
+
+        In streaming mode, each top-level table is yielded as soon as it is
+        fully read. Once the caller moves past it, it is cleared, so callers
+        must not retain references to the yielded elements beyond processing them.
+        """
+        if self._elem is not None:
+            yield from (entry.elem for entry in self.table_index if entry.depth == 0)
+            return
+
+        tbl_depth = 0
+        with self.__open_body() as fh:
+            for event, elem in etree.iterparse(fh, events=("start", "end")):
+                if elem.tag == Tag.tbl.value:
+                    if event == "start":
+                        tbl_depth += 1
+                        continue
+                    tbl_depth -= 1
+                    if tbl_depth == 0:
+                        yield elem
+                        elem.clear()
+                if event == "end" and self.__is_body_child(elem):
+                    self.__discard(elem)
+
+    def __open_body(self) -> IO[bytes]:
+        if self.__package is None:
+            raise RuntimeError(f"{self!r} is closed")
+        return self.__package.open("word/document.xml")
+
+    @staticmethod
+    def __is_body_child(elem: _Element) -> bool:
+        parent = elem.getparent()
+        return parent is not None and parent.tag == Tag.body.value
+
+    @staticmethod
+    def __discard(elem: _Element) -> None:
+        # free processed body elements, including all preceding siblings
+        # (already processed), to keep the partially built tree small.
+        elem.clear()
+        parent = elem.getparent()
+        assert parent is not None
+        while elem.getprevious() is not None:
+            del parent[0]
+
+    def close(self) -> None:
+        """release the underlying docx package (streaming mode only)."""
+        if self.__package is not None:
+            self.__package.close()
+            self.__package = None
 
     @property
     def numbering_xml(self) -> Optional[NumberingDocument]:
@@ -57,6 +208,11 @@ class Document:
     def styles(self) -> StylesDocument:
         return self.__styles
 
+    def __intern_rpr(self, rpr: Optional[RunProperties]) -> Optional[RunProperties]:
+        if rpr is None:
+            return None
+        return self.__rpr_interned.setdefault(rpr.fields, rpr)
+
     def extract_p_rpr(self, elem: _Element) -> Optional[RunProperties]:
         """extract run properties from paragraph's pStyle and rPr.
 
@@ -66,21 +222,39 @@ class Document:
               styling the text runs themselves."""
         assert elem.tag == Tag.p.value, f"expected paragraph (w:p) tag, got: {elem.tag}"
         style_id = Xpath.attr_first(elem, "./w:pPr/w:pStyle/@w:val")
-        pstyle = self.styles.get_pstyle(style_id) if style_id is not None else None
         p_rpr_elem = Xpath.elem_first(elem, "./w:pPr/w:rPr")
+        p_rpr_xml = (
+            etree.tostring(p_rpr_elem, with_tail=False)
+            if p_rpr_elem is not None
+            else b""
+        )
+        key = (style_id, p_rpr_xml)
+        try:
+            return self.__p_rpr_cache[key]
+        except KeyError:
+            pass
+        pstyle = self.styles.get_pstyle(style_id) if style_id is not None else None
         rpr = RunProperties.from_rpr_elem(p_rpr_elem)
-        if pstyle is None:
-            return rpr
-        return pstyle.merge(rpr) if rpr is not None else pstyle
+        if pstyle is not None:
+            rpr = pstyle.merge(rpr) if rpr is not None else pstyle
+        res = self.__p_rpr_cache[key] = self.__intern_rpr(rpr)
+        return res
 
     def extract_r_rpr(self, elem: _Element) -> Optional[RunProperties]:
         assert elem.tag == Tag.r.value, f"expected run (w:r) tag, got: {elem.tag}"
         r_rpr_elem = Xpath.elem_first(elem, "./w:rPr")
         if r_rpr_elem is None:
             return None
+        # the run's character style (w:rStyle) is part of its w:rPr element
+        key = etree.tostring(r_rpr_elem, with_tail=False)
+        try:
+            return self.__r_rpr_cache[key]
+        except KeyError:
+            pass
         r_rpr = RunProperties.from_rpr_elem(r_rpr_elem)
         rstyle_id = Xpath.attr_first(r_rpr_elem, "./w:rStyle/@w:val")
         rstyle = self.styles.get_cstyle(rstyle_id) if rstyle_id is not None else None
-        if rstyle is None:
-            return r_rpr
-        return rstyle.merge(r_rpr)
+        if rstyle is not None:
+            r_rpr = rstyle.merge(r_rpr)
+        res = self.__r_rpr_cache[key] = self.__intern_rpr(r_rpr)
+        return res
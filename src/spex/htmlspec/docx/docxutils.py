@@ -4,15 +4,80 @@
 
 import zipfile
 from pathlib import Path
-from typing import IO
+from types import TracebackType
+from typing import IO, Dict, Optional, Set
 
 from lxml import etree
 
 
+class DocxPackage:
+    """read-only view of a docx (zip) package.
+
+    The archive is opened, and its central directory read, exactly once.
+    XML parts are parsed on first request and cached, such that each part is
+    parsed at most once, regardless of how many readers request it."""
+
+    def __init__(self, docx_path: Path):
+        self.__path = docx_path
+        self.__zfile: Optional[zipfile.ZipFile] = zipfile.ZipFile(docx_path, "r")
+        self.__members: Set[str] = set(self.__zfile.namelist())
+        self.__parts: Dict[str, etree._Element] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<path: {str(self.__path)}>"
+
+    def __enter__(self) -> "DocxPackage":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        """path to docx package."""
+        return self.__path
+
+    def has_part(self, name: str) -> bool:
+        """true if the package contains a member named `name`."""
+        return name in self.__members
+
+    def open(self, name: str) -> IO[bytes]:
+        """open raw (uncompressed) byte-stream of part `name`.
+
+        Raises:
+            KeyError: if no part `name` exists in the package."""
+        if self.__zfile is None:
+            raise RuntimeError(f"{self!r} is closed")
+        if name not in self.__members:
+            raise KeyError(f"there is no item named {name!r} in the archive")
+        return self.__zfile.open(name)
+
+    def part(self, name: str) -> etree._Element:
+        """return parsed XML part `name`, parsing it on first access.
+
+        Raises:
+            KeyError: if no part `name` exists in the package."""
+        elem = self.__parts.get(name, None)
+        if elem is None:
+            with self.open(name) as fh:
+                elem = etree.fromstring(fh.read())
+            self.__parts[name] = elem
+        return elem
+
+    def close(self) -> None:
+        """close the underlying archive, already parsed parts remain valid."""
+        if self.__zfile is not None:
+            self.__zfile.close()
+            self.__zfile = None
+
+
 def docx_extract_contents(
     docx_path: Path, file: str = "word/document.xml"
 ) -> etree._Element:
-    with zipfile.ZipFile(docx_path, "r") as zfile:
-        fh: IO[bytes]
-        with zfile.open(file) as fh:
-            return etree.fromstring(fh.read())
+    with DocxPackage(docx_path) as pkg:
+        return pkg.part(file)
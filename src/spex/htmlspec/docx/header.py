@@ -2,20 +2,19 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from pathlib import Path
 from re import compile as re_compile
 from typing import Optional
 
-from spex.htmlspec.docx.docxutils import docx_extract_contents
+from spex.htmlspec.docx.docxutils import DocxPackage
 from spex.xml import Xpath
 
 _rgx_revision = re_compile(r".*[Rr]evision\s+(?P<rev>\S+).*")
 
 
 class Header:
-    def __init__(self, doc_path: Path):
-        self._elem = docx_extract_contents(doc_path, "word/header1.xml")
-        self._path = doc_path
+    def __init__(self, package: DocxPackage):
+        self._elem = package.part("word/header1.xml")
+        self._path = package.path
         self._header = "".join(
             e.text for e in Xpath.elems(self._elem, ".//w:t") if e.text is not None
         )
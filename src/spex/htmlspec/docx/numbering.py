@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterator, List, Type, TypeVar, Union
 
-from spex.htmlspec.docx.docxutils import docx_extract_contents
+from spex.htmlspec.docx.docxutils import DocxPackage
 from spex.xml import Xpath
 
 
@@ -101,9 +101,9 @@ class NumberingDocument:
     _abstract_nums: Dict[int, AbstractNum]
     _num_to_abs_num: Dict[int, int]
 
-    def __init__(self, doc_path: Path):
-        self._elem = docx_extract_contents(doc_path, "word/numbering.xml")
-        self._path = doc_path
+    def __init__(self, package: DocxPackage):
+        self._elem = package.part("word/numbering.xml")
+        self._path = package.path
         self.__parse_absnum()
 
     def has_num_id(self, num_id: Union[str, int]) -> bool:
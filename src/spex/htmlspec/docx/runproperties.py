@@ -4,7 +4,7 @@
 
 import copy
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
 
 from lxml.etree import _Element
 
@@ -66,7 +66,7 @@ class RunProperties:
             # disregard 'auto' and similar non-hex values.
             color = None
         self.__color = color
-        self.__css_attrs = self.__compute_css_attrs()
+        self.__set_css_attrs()
 
     @property
     def bold(self) -> bool:
@@ -114,11 +114,29 @@ class RunProperties:
     def css_attrs(self) -> Dict[str, str]:
         return self.__css_attrs
 
+    @property
+    def fields(self) -> Tuple[Any, ...]:
+        """properties as given, None for properties which are not set.
+
+        Unlike equality, which compares the resulting CSS, this tells apart
+        properties which behave differently when merged."""
+        return (
+            self.__bold,
+            self.__italics,
+            self.__underline,
+            self.__strikethrough,
+            self.__vert_align,
+            self.__size,
+            self.__color,
+        )
+
     def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
         return isinstance(other, type(self)) and self.__css_attrs == other.__css_attrs
 
     def __hash__(self) -> int:
-        return hash(frozenset(self.__css_attrs))
+        return hash(self.__css_key)
 
     def __repr__(self) -> str:
         return repr(self.__css_attrs)
@@ -159,10 +177,15 @@ class RunProperties:
 
         # CSS attrs are normally computed after object initialization.
         # trigger re-computation due to (potentially) updated entries
-        c.__css_attrs = c.__compute_css_attrs()
+        c.__set_css_attrs()
 
         return c
 
+    def __set_css_attrs(self) -> None:
+        self.__css_attrs = self.__compute_css_attrs()
+        # hashed for every lookup in a `CssCache`
+        self.__css_key: FrozenSet[str] = frozenset(self.__css_attrs)
+
     def __compute_css_attrs(self) -> Dict[str, str]:
         attrs = {}
         if self.__bold is not None:
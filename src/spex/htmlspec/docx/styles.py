@@ -2,13 +2,11 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from functools import lru_cache
-from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from lxml.etree import _Element
 
-from spex.htmlspec.docx.docxutils import docx_extract_contents
+from spex.htmlspec.docx.docxutils import DocxPackage
 from spex.htmlspec.docx.runproperties import RunProperties
 from spex.xml import Xpath
 
@@ -16,53 +14,75 @@ from spex.xml import Xpath
 class StyleResolver:
     # translate from potential alias to the canonical style id (name)
     _style_aliases: Dict[str, str]
+    # style elements (w:style) by style id
+    _styles: Dict[str, _Element]
+    # run properties of styles, with their w:basedOn chains resolved
+    _resolved: Dict[str, Optional[RunProperties]]
 
     def __init__(self, style_doc: _Element, style_type: str):
         self._style_doc = style_doc
         assert style_type in ("paragraph", "character")
         self._style_type = style_type
-        self._style_aliases = self.__init_alias_dct(style_doc, style_type)
-
-    @staticmethod
-    def __init_alias_dct(style_doc: _Element, style_type: str) -> Dict[str, str]:
-        alias_dct: Dict[str, str] = {}
+        self._styles = {}
+        self._style_aliases = {}
         for style in Xpath.elems(style_doc, f"./w:style[@w:type = '{style_type}']"):
             canonical_style_name = Xpath.attr_first_req(style, "@w:styleId")
-            alias_dct[canonical_style_name] = canonical_style_name
+            # on duplicate IDs, the first style wins
+            self._styles.setdefault(canonical_style_name, style)
+            self._style_aliases[canonical_style_name] = canonical_style_name
 
             aliases = Xpath.attr_first(style, "./w:aliases/@w:val") or ""
             for alias in (a.strip() for a in aliases.split(",")):
-                alias_dct[alias] = canonical_style_name
+                self._style_aliases[alias] = canonical_style_name
 
-        return alias_dct
+        self._resolved = {}
+        for style_id in self._styles:
+            try:
+                self.__resolve(style_id, ())
+            except (KeyError, ValueError):
+                # broken w:basedOn chain, raised again if style is looked up
+                pass
 
-    @lru_cache(maxsize=60)
-    def __get_style(self, style_id: str) -> Optional[RunProperties]:
-        # get entry
-        # if w:basedOn exists, resolv (using same fn, causing caching),
+    def __resolve(
+        self, style_id: str, derived: Tuple[str, ...]
+    ) -> Optional[RunProperties]:
+        # if w:basedOn exists, resolve it (recording the result),
         # return merge(<basedOn>, <this>)
-        style = Xpath.elem_first_req(
-            self._style_doc,
-            f"./w:style[@w:type = '{self._style_type}'][@w:styleId = '{style_id}']",
-        )
+        try:
+            return self._resolved[style_id]
+        except KeyError:
+            pass
+        if style_id in derived:
+            raise ValueError(
+                f"{self._style_type} style {style_id!r} is based on itself"
+                f" (via {', '.join(derived)})"
+            )
+        try:
+            style = self._styles[style_id]
+        except KeyError:
+            raise KeyError(f"no {self._style_type} style {style_id!r}") from None
         based_on = Xpath.attr_first(style, "./w:basedOn/@w:val")
         rpr = RunProperties.from_rpr_elem(Xpath.elem_first(style, "./w:rPr"))
-        if based_on is None:
-            # style is stand-alone
-            return rpr
-        # style extends some other base style
-        based_on_rpr = self.__get_style(based_on)
-        return based_on_rpr.merge(rpr) if based_on_rpr is not None else rpr
+        if based_on is not None:
+            # style extends some other base style
+            based_on_rpr = self.__resolve(based_on, (*derived, style_id))
+            if based_on_rpr is not None:
+                rpr = based_on_rpr.merge(rpr)
+        self._resolved[style_id] = rpr
+        return rpr
 
     def get_style(self, style_id: str) -> Optional[RunProperties]:
         canonical_style_name = self._style_aliases[style_id]
-        return self.__get_style(canonical_style_name)
+        try:
+            return self._resolved[canonical_style_name]
+        except KeyError:
+            return self.__resolve(canonical_style_name, ())
 
 
 class StylesDocument:
-    def __init__(self, doc_path: Path):
-        self._elem = docx_extract_contents(doc_path, "word/styles.xml")
-        self._path = doc_path
+    def __init__(self, package: DocxPackage):
+        self._elem = package.part("word/styles.xml")
+        self._path = package.path
         self._pstyles = StyleResolver(self._elem, "paragraph")
         self._cstyles = StyleResolver(self._elem, "character")
 
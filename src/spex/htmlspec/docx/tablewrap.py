@@ -4,11 +4,11 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 from lxml.etree import _Element
 
-from spex.xml import Xpath
+from spex.htmlspec.docx.tags import Attr, Tag
 
 
 class VerticalMergeState(Enum):
@@ -24,6 +24,8 @@ class GridElement:
     bottom: int
     left: int
     right: int
+    # w:fill value of the cell's shading (w:shd), if any
+    shd_fill: Optional[str] = None
 
     @property
     def colspan(self) -> int:
@@ -37,35 +39,59 @@ class GridElement:
 Matrix = List[List[GridElement]]
 
 
+@dataclass(frozen=True)
+class CellProps:
+    grid_span: int
+    vertical_merge: VerticalMergeState
+    shd_fill: Optional[str]
+
+
+def _cell_props(tc: _Element) -> CellProps:
+    """collect the properties (w:tcPr) of table cell `tc` in one pass."""
+    grid_span: Optional[str] = None
+    vertical_merge: Optional[VerticalMergeState] = None
+    shd_fill: Optional[str] = None
+    # should there be several, the first occurrence of each property wins
+    for tc_pr in tc.iterchildren(Tag.tcPr.value):
+        for prop in tc_pr.iterchildren():
+            tag = prop.tag
+            if tag == Tag.gridSpan.value:
+                if grid_span is None:
+                    grid_span = prop.get(Attr.val.value)
+            elif tag == Tag.vMerge.value:
+                if vertical_merge is None:
+                    row_val = prop.get(Attr.val.value)
+                    if row_val:
+                        assert row_val == "restart"
+                        vertical_merge = VerticalMergeState.RESTART
+                    else:
+                        vertical_merge = VerticalMergeState.MERGED
+            elif tag == Tag.shd.value:
+                if shd_fill is None:
+                    shd_fill = prop.get(Attr.fill.value)
+    return CellProps(
+        grid_span=int(grid_span) if grid_span is not None else 1,
+        vertical_merge=(
+            vertical_merge if vertical_merge is not None else VerticalMergeState.NONE
+        ),
+        shd_fill=shd_fill,
+    )
+
+
 class TableWrap:
     def __init__(self, elem: _Element):
         self._elem = elem
 
     def grid(self) -> Matrix:
-        def tc_grid_span(tc: _Element) -> int:
-            ret = Xpath.attr_first(tc, "./w:tcPr/w:gridSpan/@w:val")
-            return int(ret) if isinstance(ret, str) else 1
-
-        def cell_vertical_merge(tc: _Element) -> VerticalMergeState:
-            merge_elem = Xpath.elem_first(tc, "./w:tcPr/w:vMerge")
-            if merge_elem is None:
-                return VerticalMergeState.NONE
-            assert isinstance(merge_elem, _Element)
-            row_val = Xpath.attr_first(merge_elem, "@w:val")
-            if row_val:
-                assert row_val == "restart"
-                return VerticalMergeState.RESTART
-            else:
-                return VerticalMergeState.MERGED
-
+        tc_tag = Tag.tc.value
         matrix: Matrix = []
-        for row_index, row in enumerate(Xpath.elems(self._elem, "./w:tr")):
+        for row_index, row in enumerate(self._elem.iterchildren(Tag.tr.value)):
             cell_index = 0
             merge_row = []
-            for cell in row.findall("./w:tc", row.nsmap):  # type: ignore
-                grid_span = tc_grid_span(cell)
-                vertical_merge = cell_vertical_merge(cell)
-                if vertical_merge is VerticalMergeState.MERGED:
+            for cell in row.iterchildren(tc_tag):
+                props = _cell_props(cell)
+                grid_span = props.grid_span
+                if props.vertical_merge is VerticalMergeState.MERGED:
                     left_cell = matrix[-1][cell_index]
                     assert grid_span == left_cell.colspan, (
                         f"cell has grid_span {grid_span}, but parent has "
@@ -84,6 +110,7 @@ class TableWrap:
                         left=cell_index,
                         right=cell_index + grid_span - 1,
                         cell=cell,
+                        shd_fill=props.shd_fill,
                     )
 
                 for _ in range(grid_span):
@@ -34,9 +34,14 @@ def _expand(tag: str) -> str:
 
 
 class Tag(Enum):
+    body = _expand("w:body")  # document body
     tbl = _expand("w:tbl")  # table
     tr = _expand("w:tr")  # table row
     tc = _expand("w:tc")  # table cell
+    tcPr = _expand("w:tcPr")  # table cell properties
+    gridSpan = _expand("w:gridSpan")  # number of grid columns spanned
+    vMerge = _expand("w:vMerge")  # vertically merged cell
+    shd = _expand("w:shd")  # shading
     p = _expand("w:p")  # paragraph
     pPr = _expand("w:pPr")  # paragraph properties
     r = _expand("w:r")  # run
@@ -53,4 +58,9 @@ class Tag(Enum):
     fldSimple = _expand("w:fldSimple")
 
 
-__all__ = ["Tag"]
+class Attr(Enum):
+    val = _expand("w:val")
+    fill = _expand("w:fill")
+
+
+__all__ = ["Attr", "Tag"]
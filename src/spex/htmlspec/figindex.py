@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Index of the figures of a HTML model by their location in the file.
+
+`SpexHtmlRenderer` writes a sidecar file next to the HTML model (`nvme.html`
+-> `nvme.html.idx`), mapping the id of each top-level table to the offset and
+length, in bytes, of the table's HTML within the document. `FigureIndex` uses
+it to read and parse single figures, without parsing the entire document.
+
+Offsets refer to the uncompressed document. Reading figures of a compressed
+HTML model thus requires decompressing the document up to the figure, see
+`spex.compression`.
+
+The index records the size and modification time of the HTML file it was
+written for, the index of a HTML file which has since been replaced is rejected.
+Copies of the HTML model must thus preserve its modification time, e.g.
+`shutil.copy2`.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple, cast
+
+from spex.compression import open_file, strip_suffix
+from spex.xml import Element, etree
+
+FORMAT_VERSION = 2
+INDEX_SUFFIX = ".idx"
+
+
+def index_path(html_path: Path) -> Path:
+    """return path of the figure index of the HTML model at `html_path`."""
+    html_path = strip_suffix(html_path)
+    return html_path.with_name(html_path.name + INDEX_SUFFIX)
+
+
+def write_index(html_path: Path, tables: Dict[str, Tuple[int, int]]) -> Path:
+    """write figure index of the HTML model at `html_path`, return its path.
+
+    Args:
+        html_path: path of the HTML model, which must be completely written.
+        tables: maps table id -> (offset, length) of the table's HTML.
+    """
+    path = index_path(html_path)
+    st = html_path.stat()
+    data = json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "html_size": st.st_size,
+            "html_mtime_ns": st.st_mtime_ns,
+            "tables": {tbl_id: list(loc) for tbl_id, loc in tables.items()},
+        },
+        separators=(",", ":"),
+    )
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+class FigureIndex:
+    """look up figures of a HTML model by table id."""
+
+    def __init__(self, html_path: Path, tables: Dict[str, Tuple[int, int]]):
+        self._html_path = html_path
+        self._tables = tables
+
+    @classmethod
+    def load(cls, html_path: Path) -> "FigureIndex":
+        """load figure index of the HTML model at `html_path`.
+
+        Raises:
+            FileNotFoundError: if the HTML model or its index does not exist.
+            ValueError: if the index is invalid, or not that of the HTML model.
+        """
+        path = index_path(html_path)
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        st = html_path.stat()
+        try:
+            if data["version"] != FORMAT_VERSION:
+                raise ValueError(f"{path!s}: unsupported figure index version")
+            if (data["html_size"], data["html_mtime_ns"]) != (
+                st.st_size,
+                st.st_mtime_ns,
+            ):
+                raise ValueError(f"{path!s}: figure index does not match HTML model")
+            tables = {
+                tbl_id: (int(off), int(ln))
+                for tbl_id, (off, ln) in cast(
+                    Dict[str, List[int]], data["tables"]
+                ).items()
+            }
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"{path!s}: invalid figure index") from e
+        return cls(html_path, tables)
+
+    @property
+    def html_path(self) -> Path:
+        return self._html_path
+
+    @property
+    def fig_ids(self) -> List[str]:
+        """ids of indexed tables, in document order."""
+        return list(self._tables)
+
+    def locate(self, fig_id: str) -> Tuple[int, int]:
+        """return offset and length of the HTML of table `fig_id`.
+
+        Raises:
+            KeyError: if no table has the id `fig_id`."""
+        return self._tables[fig_id]
+
+    def read(self, fig_id: str) -> bytes:
+        """return the HTML of table `fig_id`.
+
+        Raises:
+            KeyError: if no table has the id `fig_id`."""
+        off, ln = self._tables[fig_id]
+        with open_file(self._html_path, "rb") as fh:
+            fh.seek(off)
+            return cast(bytes, fh.read(ln))
+
+    def figure(self, fig_id: str) -> Element:
+        """parse table `fig_id`.
+
+        Raises:
+            KeyError: if no table has the id `fig_id`."""
+        return etree.fromstring(self.read(fig_id))
+
+    def __contains__(self, fig_id: object) -> bool:
+        return fig_id in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
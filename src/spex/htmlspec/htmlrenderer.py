@@ -2,60 +2,94 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from html import escape as html_escape
 from pathlib import Path
-from typing import Any, Generator, Optional, Set, Tuple, TypeAlias
+from types import TracebackType
+from typing import Dict, Generator, Iterator, Optional, Tuple, TypeAlias
 
-from gcgen.api import Section, write_file
-from lxml.etree import _Element
+from gcgen.api import Section
 
 from spex import __version__
-from spex.htmlspec import css
+from spex.compression import suffix as compression_suffix
+from spex.htmlspec import css, figindex
 from spex.htmlspec.docx import Document
-from spex.htmlspec.parser import (
-    List,
-    ListElem,
-    Paragraph,
-    Point,
-    Span,
-    SpexParser,
-    Table,
-)
+from spex.htmlspec.parallel import render_tables
+from spex.htmlspec.parser import SpexParser, Table
+from spex.htmlspec.sectionwriter import SectionWriter
+from spex.htmlspec.tablerenderer import TableRenderer
+from spex.htmlspec.treebuilder import COMPACT_LAYOUT, LAYOUT_META, HtmlTreeBuilder
+from spex.xml import ElementTree
 
 ProgressStatus: TypeAlias = Tuple[int, int]  # processing figure X of Y figures
 
 
-# TODO: nicer way of using `write_file` ?
 class SpexHtmlRenderer:
-    def __init__(self, docx_path: Path, out_dir: Optional[Path] = None):
+    """render docx document to HTML.
+
+    Tables are written to the HTML file as they are rendered. The HTML and CSS
+    files replace any existing files at `html_path` and `css_path` once
+    `generate` has run to completion and the renderer is closed. Use the
+    renderer as a context manager, or call `close` explicitly.
+
+    If `compact`, the HTML document is written without line breaks and
+    indentation, see `TableRenderer` for the changes to its contents. The
+    document is marked as compact, text extracted from it is the same as from
+    the indented form, see `XmlUtils.to_text`.
+
+    Alongside the HTML document, a figure index is written, locating each
+    top-level table by byte offset, see `spex.htmlspec.figindex`.
+
+    If `build_tree`, the HTML document is also built as an lxml tree, see
+    `html_tree`. The tree holds the entire document in memory, renderers not
+    building it hold only the table being rendered.
+
+    The HTML and CSS files are compressed using `compression`, see
+    `spex.compression`, the names of compressed files are suffixed accordingly.
+    """
+
+    def __init__(
+        self,
+        docx_path: Path,
+        out_dir: Optional[Path] = None,
+        streaming: bool = False,
+        jobs: int = 1,
+        write_files: bool = True,
+        compact: bool = False,
+        compression: str = "none",
+        build_tree: bool = False,
+    ):
         self._fname = docx_path.name[: -len(docx_path.suffix)]
         self._docx_path = docx_path = docx_path.resolve()
-        self._document = Document(docx_path)
+        self._document = Document(docx_path, streaming=streaming)
         self._parser = SpexParser(self._document)
+        self._jobs = jobs
+        self._compact = compact
 
         if out_dir is None:
             out_dir = docx_path.parent
 
-        self._html_path = out_dir / f"{self._fname}.html"
-        self._html_writer = write_file(self._html_path)
-        self._html_head = Section()
-        self._html_body = Section()
-        self._html_doc: Optional[Section] = self._html_writer.__enter__()
-
-        self._css_path = out_dir / f"{self._fname}.css"
-        self._css_writer = write_file(self._css_path)
-        self._css_doc: Optional[Section] = self._css_writer.__enter__()
-        # from props -> name
-        self._css_txtfmt_cache = css.CssCache("txtfmt")
-
-        self.__css_tcell_cache = css.CssCache("tcell")
-        self._destroyed = False
+        sfx = compression_suffix(compression)
+        self._html_path = out_dir / f"{self._fname}.html{sfx}"
+        self._css_path = out_dir / f"{self._fname}.css{sfx}"
+        self._html_writer: Optional[SectionWriter] = None
+        self._css_writer: Optional[SectionWriter] = None
+        # table id -> (offset, length) of the table in the HTML document
+        self._fig_index: Dict[str, Tuple[int, int]] = {}
+        self._write_files = write_files
 
-        self.__tbls_seen: Set[_Element] = set()
+        self._table_renderer = r = TableRenderer(compact=compact)
+        self._tree_builder: Optional[HtmlTreeBuilder] = None
+        if build_tree:
+            self._tree_builder = HtmlTreeBuilder(
+                title=self._document.header.title,
+                revision=self._document.header.revision,
+                fname=self._fname,
+                txtfmt_cache=r.txtfmt_cache,
+                tcell_cache=r.tcell_cache,
+            )
+        self._complete = False
+        self._closed = False
 
-    def __write_css_prelude(self) -> None:
-        assert self._css_doc is not None
-        s = self._css_doc
+    def __write_css_prelude(self, s: Section) -> None:
         css.css_block(
             s,
             "body",
@@ -107,14 +141,12 @@ class SpexHtmlRenderer:
                 for ilvl in nstyle.ilvls:
                     s.emitln(ilvl.to_css())
 
-    def __write_css_epilog(self) -> None:
+    def __write_css_epilog(self, s: Section) -> None:
         # write out cached styles
-        assert self._css_doc is not None
-        s = self._css_doc
         s.emitln("/* text-formatting styles */")
-        self._css_txtfmt_cache.emit_rules(s)
+        self._table_renderer.txtfmt_cache.emit_rules(s)
         s.emitln("/* table cell formatting styles */")
-        self.__css_tcell_cache.emit_rules(s)
+        self._table_renderer.tcell_cache.emit_rules(s)
 
     def generate(self, yield_progress: bool = False) -> Generator[int, None, None]:
         """main entrypoint for generator.
@@ -123,12 +155,27 @@ class SpexHtmlRenderer:
           * yield_progress (bool): whether to progress status tuples.
                 Can be used to implement e.g. progress bars.
         """
+        if self._closed:
+            raise RuntimeError("renderer is closed")
         # TODO: really should not be called twice.
+        if not self._write_files:
+            for ndx, _ in enumerate(self.__render_tables(None)):
+                if yield_progress:
+                    yield ndx
+            self._complete = True
+            return
+
+        self._css_writer = css_w = SectionWriter(self._css_path)
+        self._html_writer = html_w = SectionWriter(
+            self._html_path, compact=self._compact
+        )
+
         # write prelude for CSS document
-        self.__write_css_prelude()
+        s = Section()
+        self.__write_css_prelude(s)
+        css_w.write(s)
 
-        assert self._html_doc is not None
-        s = self._html_doc
+        s = Section()
         s.emitln("<!DOCTYPE html>")
         s.emitln('<html lang="en">')
         s.emitln("<head>").indent()
@@ -139,119 +186,90 @@ class SpexHtmlRenderer:
             s.emit(f' data-revision="{revision}"')
         s.emitln("/>")
         s.emitln(f'<meta name="spexVersion" content="{__version__}" />')
+        if self._compact:
+            s.emitln(f'<meta name="{LAYOUT_META}" content="{COMPACT_LAYOUT}" />')
         s.emitln(f"<title>{self._fname}</title>")
-        s.add_section(self._html_head)
         s.emitln(f'<link rel="stylesheet" href="{self._fname}.css"/>')
         s.dedent().emitln("</head>")
-        s.emitln("<body>").indent()
-        s.add_section(self._html_body)
+        s.emitln("<body>")
+        html_w.write(s)
 
-        if yield_progress:
-            for ndx, tbl in enumerate(self._parser.parse()):
+        html_w.indent()
+        for ndx, _ in enumerate(self.__render_tables(html_w)):
+            if yield_progress:
                 yield ndx
-                self._render_table(s, tbl)
-        else:
-            for tbl in self._parser.parse():
-                self._render_table(s, tbl)
+        html_w.dedent()
 
-        s.dedent().emitln("</body>")
+        s = Section()
+        s.emitln("</body>")
         s.emitln("</html>")
+        html_w.write(s)
 
-        self.__write_css_epilog()
+        s = Section()
+        self.__write_css_epilog(s)
+        css_w.write(s)
+        self._complete = True
 
-    def _render_paragraph(self, s: Section, p: Paragraph) -> None:
-        s.emitln("<p>").indent()
-        for span in p.spans:
-            self._render_span(s, span)
-        s.dedent().emitln("</p>")
+    def __render_tables(self, w: Optional[SectionWriter]) -> Iterator[None]:
+        """render all tables, yielding once per table rendered.
 
-    def _render_span(self, s: Section, span: Span) -> None:
-        txt = html_escape(span.text)
-        if span.style is not None:
-            clsname = self._css_txtfmt_cache.get_clsname(span.style)
-        else:
-            clsname = None
-        if clsname is not None:
-            s.emit(f'<span class="{clsname}">{txt}</span>')
+        Tables are written to `w` unless it is None, and added to the HTML
+        tree if one is built."""
+        r = self._table_renderer
+        tb = self._tree_builder
+        if self._jobs > 1:
+            for frag in render_tables(self._document, self._jobs, self._compact):
+                if w is not None:
+                    s = Section()
+                    r.merge(s, frag)
+                    self.__index_table(frag.table, w.write(s))
+                if tb is not None:
+                    tb.add_table(frag.table)
+                yield
         else:
-            s.emit(f"<span>{txt}</span>")
-
-    def _render_list(self, s: Section, lst: List) -> None:
-        s.emitln(f'<{lst.tag} class="{lst.props.css_clsname}">').indent()
-        open_elem = False
-        for elem in lst.elems:
-            if isinstance(elem, ListElem):
-                if open_elem:
-                    s.dedent().emitln("</li>")
-                s.emitln("<li>").indent()
-                for span in elem.elems:
-                    self._render_span(s, span)
-                open_elem = True
-            elif isinstance(elem, List):
-                if not open_elem:
-                    s.emitln("<li>").indent()
-                self._render_list(s, elem)
-                s.dedent().emitln("</li>")
-                open_elem = False
-            else:
-                raise RuntimeError(f"unknown list element {type(elem)}")
-        if open_elem:
-            s.dedent().emitln("</li>")
-        s.dedent().emitln(f"</{lst.tag}>")
+            for tbl in self._parser.parse():
+                if w is not None:
+                    s = Section()
+                    r.render_table(s, tbl)
+                    self.__index_table(tbl, w.write(s))
+                if tb is not None:
+                    tb.add_table(tbl)
+                yield
 
-    def _render_table(self, s: Section, tbl: Table) -> None:
+    def __index_table(self, tbl: Table, loc: Tuple[int, int]) -> None:
+        # figures are looked up by the first table of the given id
         if tbl.id:
-            s.emitln(f"<table id='{tbl.id}'>").indent()
-        else:
-            s.emitln("<table>").indent()
-        for rndx, row in enumerate(tbl.rows):
-            s.emitln("<tr>").indent()
-            for cndx, cell in enumerate(row):
-                pos = Point(cndx, rndx)
-                if cell.origin != pos:
-                    # cells may span multiple columns and rows, render them only
-                    # the first time seen / at its origin point
-                    continue
-                if cell.tc_pr:
-                    clsname = self.__css_tcell_cache.get_clsname(cell.tc_pr)
-                else:
-                    clsname = None
-                s.emit(
-                    "<",
-                    cell.tag,
-                    f' colspan="{cell.span.x}"' if cell.span.x > 1 else "",
-                    f' rowspan="{cell.span.y}"' if cell.span.y > 1 else "",
-                    f' class="{clsname}"' if clsname else "",
-                    ">",
-                ).indent()
-                for elem in cell.elems:
-                    self._render_any(s, elem)
-                s.dedent().emitln(f"</{cell.tag}>")
-            s.dedent().emitln("</tr>")
-        s.dedent().emitln("</table>")
-
-    def _render_any(self, s: Section, o: Any) -> None:
-        if isinstance(o, Span):
-            self._render_span(s, o)
-        elif isinstance(o, Paragraph):
-            self._render_paragraph(s, o)
-        elif isinstance(o, List):
-            self._render_list(s, o)
-        elif isinstance(o, Table):
-            self._render_table(s, o)
-        else:
-            raise RuntimeError(f"render got element of type {type(o)} - cannot render")
+            self._fig_index.setdefault(tbl.id, loc)
 
     @property
     def html_path(self) -> Path:
         """output path of the HTML document resulting from parsing the specification."""
         return self._html_path
 
+    @property
+    def index_path(self) -> Path:
+        """output path of the figure index of the output HTML page."""
+        return figindex.index_path(self._html_path)
+
     @property
     def css_path(self) -> Path:
         """output path of the CSS sheet accompanying the output HTML page."""
         return self._css_path
 
+    @property
+    def html_tree(self) -> ElementTree:
+        """the HTML document as a tree, identical to parsing the written HTML file.
+
+        Raises:
+            RuntimeError: if the renderer does not build the tree, see
+                `build_tree`, or `generate` has not run to completion.
+        """
+        if self._tree_builder is None:
+            raise RuntimeError("renderer does not build the HTML tree")
+        if not self._complete:
+            raise RuntimeError("HTML tree is incomplete, generate has not completed")
+        return self._tree_builder.tree
+
     @property
     def num_figures(self) -> int:
         """return number of figures in the document being parsed.
@@ -259,12 +277,34 @@ class SpexHtmlRenderer:
         NOTE: some figures may be skipped during processing for various reasons.
               This thus represents an upper-bound on the number of figures to
               process."""
-        return len(self._document.tables)
+        return self._document.num_tables
+
+    def close(self) -> None:
+        """release the document and finish writing the HTML, CSS and index files.
 
-    def __del__(self) -> None:
-        if self._destroyed:
+        The files are only written if `generate` ran to completion, otherwise
+        any existing files are left untouched."""
+        if self._closed:
             return
-        self._css_writer.__exit__(None, None, None)
-        self._css_doc = None
-        self._html_writer.__exit__(None, None, None)
-        self._html_doc = None
+        self._closed = True
+        self._document.close()
+        for w in (self._css_writer, self._html_writer):
+            if w is None:
+                continue
+            if self._complete:
+                w.close()
+            else:
+                w.abort()
+        if self._complete and self._html_writer is not None:
+            figindex.write_index(self._html_path, self._fig_index)
+
+    def __enter__(self) -> "SpexHtmlRenderer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Render the tables of a docx document to HTML using a pool of worker processes.
+
+Top-level tables are independent of one another, so each worker renders whole
+tables into stand-alone `TableFragment`s. The fragments are returned in
+document order and merged into the output document by the main process, which
+also reconciles the CSS class names assigned by the individual workers.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Deque, Iterator, List, Optional
+
+from lxml import etree
+
+from spex.htmlspec.docx import Document
+from spex.htmlspec.parser import SpexParser
+from spex.htmlspec.stream import Stream
+from spex.htmlspec.tablerenderer import TableFragment, TableRenderer
+
+# tables sent to a worker at a time, amortizes the IPC overhead of small tables.
+CHUNKSIZE = 8
+# chunks submitted ahead per worker, keeps workers busy while bounding the
+# number of tables held in memory.
+MAX_PENDING_CHUNKS = 2
+
+# per-process parser and rendering mode, set by `_worker_init`
+_parser: Optional[SpexParser] = None
+_compact = False
+
+
+def _worker_init(docx_path: Path, compact: bool) -> None:
+    global _parser, _compact
+    # the document body is never read by workers, tables are passed to them.
+    _parser = SpexParser(Document(docx_path, streaming=True))
+    _compact = compact
+
+
+def _worker_render(tbls_xml: List[bytes]) -> List[TableFragment]:
+    assert _parser is not None, "worker process not initialized"
+    return [
+        TableRenderer.render_fragment(
+            _parser._parse_table(Stream(iter((etree.fromstring(tbl_xml),)))),
+            compact=_compact,
+        )
+        for tbl_xml in tbls_xml
+    ]
+
+
+def render_tables(
+    document: Document, jobs: int, compact: bool = False
+) -> Iterator[TableFragment]:
+    """render the document's top-level tables using `jobs` worker processes.
+
+    Fragments are yielded in document order, see `TableRenderer` for `compact`.
+    Tables are read and submitted to the workers as rendered fragments are
+    consumed, at most `MAX_PENDING_CHUNKS` chunks per worker are in flight at a
+    time, such that memory use remains bounded for streaming documents."""
+    tbls_xml = (etree.tostring(tbl) for tbl in document.iter_top_level_tables())
+    chunks = iter(lambda: list(islice(tbls_xml, CHUNKSIZE)), [])
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_worker_init, initargs=(document.path, compact)
+    ) as pool:
+        pending: Deque["Future[List[TableFragment]]"] = deque(
+            pool.submit(_worker_render, chunk)
+            for chunk in islice(chunks, jobs * MAX_PENDING_CHUNKS)
+        )
+        while pending:
+            frags = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(pool.submit(_worker_render, chunk))
+            yield from frags
@@ -5,7 +5,7 @@
 from dataclasses import dataclass
 from typing import Dict, Iterator
 from typing import List as TList
-from typing import Optional, Set, Union
+from typing import NamedTuple, Optional, Union
 
 from lxml.etree import _Element
 
@@ -15,7 +15,7 @@ from spex.jsonspec.extractors.regular_expressions import TABLE_ID_REGEX
 from spex.xml import Xpath
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TcPr:
     shd_fill: Optional[str]
 
@@ -26,23 +26,23 @@ class TcPr:
         return {"background-color": f"#{self.shd_fill}"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Span:
     style: Optional[RunProperties]
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Paragraph:
     spans: TList[Span]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListElem:
     elems: TList[Span]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class List:
     props: AbstractNumLvl
     elems: TList[Union[ListElem, "List"]]
@@ -52,8 +52,7 @@ class List:
         return self.props.tag
 
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
     x: int
     y: int
 
@@ -61,16 +60,28 @@ class Point:
 HTMLUnits = Union[List, Paragraph, Span, "Table"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableCell:
     tag: str
     elems: TList[HTMLUnits]
-    span: Point
-    origin: Point
+    # number of grid columns and rows spanned by the cell
+    colspan: int
+    rowspan: int
+    # grid position of the cell's top-left corner
+    left: int
+    top: int
     tc_pr: Optional[TcPr]
 
+    @property
+    def span(self) -> Point:
+        return Point(self.colspan, self.rowspan)
+
+    @property
+    def origin(self) -> Point:
+        return Point(self.left, self.top)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Table:
     rows: TList[TList[TableCell]]
     id: Optional[str] = None
@@ -102,15 +113,15 @@ def find_id(rows: TList[TList[TableCell]]) -> Optional[str]:
 class SpexParser:
     def __init__(self, document: Document):
         self._document = document
-        self.__tbls_seen: Set[_Element] = set()
+        # cell properties are shared by all cells of the same shading
+        self.__tc_pr_cache: Dict[str, TcPr] = {}
 
     def parse(self) -> Iterator[Table]:
-        self.__tbls_seen = set()
-        stream = Stream(t for t in self._document.tables)
-        while not stream.end():
-            tbl = self._parse_table(stream)
-            if tbl is not None:
-                yield tbl
+        # NOTE: nested tables are parsed as part of their parent table's cells.
+        # NOTE: tables are handed to `_parse_table` one at a time (no look-ahead),
+        #       streaming documents discard each table once we move past it.
+        for elem in self._document.iter_top_level_tables():
+            yield self._parse_table(Stream(iter((elem,))))
 
     def _parse_any(
         self, stream: Stream[_Element]
@@ -118,9 +129,7 @@ class SpexParser:
         while not stream.end():
             current = stream.peek()
             if current.tag == Tag.tbl.value:
-                tbl = self._parse_table(stream)
-                if tbl:
-                    yield tbl
+                yield self._parse_table(stream)
             elif current.tag == Tag.p.value:
                 if self.__p_is_list_paragraph(current):
                     yield self._parse_list(stream)
@@ -200,7 +209,7 @@ class SpexParser:
         current = stream.consume()
         spans = list(self._parse_spans(current))
         if len(spans) > 0:
-            return Paragraph(spans=list(self._parse_spans(current)))
+            return Paragraph(spans=spans)
         return None
 
     def _select_runs(self, p: _Element) -> Iterator[_Element]:
@@ -217,45 +226,54 @@ class SpexParser:
                 yield Xpath.elem_first_req(child, "./w:r")
 
     def _parse_spans(self, p: _Element) -> Iterator[Span]:
+        # Word frequently splits text into many runs of identical formatting,
+        # merge adjacent runs with the same formatting into a single span.
+        style: Optional[RunProperties] = None
+        texts: TList[str] = []
         for r in self._select_runs(p):
             txt = Xpath.elem_first(r, "./w:t")
             if txt is None or txt.text is None:
                 continue
             r_rpr = self._document.extract_r_rpr(r)
-            yield Span(style=r_rpr, text=txt.text)
-
-    def _parse_table(self, stream: Stream[_Element]) -> Optional[Table]:
+            if texts and r_rpr == style:
+                texts.append(txt.text)
+                continue
+            if texts:
+                yield Span(style=style, text="".join(texts))
+            style = r_rpr
+            texts = [txt.text]
+        if texts:
+            yield Span(style=style, text="".join(texts))
+
+    def __tc_pr(self, shd_fill: str) -> TcPr:
+        tc_pr = self.__tc_pr_cache.get(shd_fill, None)
+        if tc_pr is None:
+            tc_pr = self.__tc_pr_cache[shd_fill] = TcPr(shd_fill=shd_fill)
+        return tc_pr
+
+    def _parse_table(self, stream: Stream[_Element]) -> Table:
         tbl = stream.consume()
         assert tbl.tag == Tag.tbl.value, f"expected table (w:tbl), got {tbl.tag}"
-        if tbl in self.__tbls_seen:
-            # small hack. When we iterate over all figures (tables), we will
-            # also select the nested tables.
-            # This skips listing the table twice while ensuring that we can still
-            # use the selector which extracts tables regardless of how deeply
-            # nested they are.
-            return None
-        self.__tbls_seen.add(tbl)
         tw = TableWrap(tbl)
         rows: TList[TList[TableCell]] = []
-        cell_cache: Dict[Point, TableCell] = {}
-        for rndx, row in enumerate(tw.grid()):
+        # cells spanning several grid positions are parsed once, the grid
+        # repeats the same grid element at every position the cell covers.
+        cell_cache: Dict[int, TableCell] = {}
+        for row in tw.grid():
             cells: TList[TableCell] = []
-            for cndx, gridcell in enumerate(row):
-                p = Point(cndx, rndx)
-                tcell = cell_cache.get(p, None)
+            for gridcell in row:
+                tcell = cell_cache.get(id(gridcell), None)
                 if tcell is not None:
                     cells.append(tcell)
                     continue
 
-                shd_fill = Xpath.attr_first(gridcell.cell, "./w:tcPr/w:shd/@w:fill")
+                shd_fill = gridcell.shd_fill
                 tag = "td"
                 # could check for a color with a regex, but not yet necessary.
                 # require hex code (filters out 'auto' which we can ignore).
                 if shd_fill and shd_fill.lower() and len(shd_fill) == 6:
                     tcpr = (
-                        TcPr(shd_fill=shd_fill)
-                        if shd_fill.lower() != "ffffff"
-                        else None
+                        self.__tc_pr(shd_fill) if shd_fill.lower() != "ffffff" else None
                     )
                 else:
                     tcpr = None
@@ -272,12 +290,14 @@ class SpexParser:
                     elems=list(
                         self._parse_any(Stream(e for e in gridcell.cell.iterchildren()))
                     ),
-                    span=Point(gridcell.colspan, gridcell.rowspan),
-                    origin=Point(gridcell.left, gridcell.top),
+                    colspan=gridcell.colspan,
+                    rowspan=gridcell.rowspan,
+                    left=gridcell.left,
+                    top=gridcell.top,
                     tc_pr=tcpr,
                     tag=tag,
                 )
-                cell_cache[p] = tcell
+                cell_cache[id(gridcell)] = tcell
                 cells.append(tcell)
             rows.append(cells)
         table = Table(rows=rows, id=find_id(rows))
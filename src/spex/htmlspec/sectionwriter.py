@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Write gcgen sections to a file as they are completed.
+
+gcgen's `write_file` buffers the entire document as a `Section` and writes it
+out once, when its context manager exits. `SectionWriter` instead emits each
+section passed to `write` right away, carrying the emitter's state (indentation,
+pending newlines and padding) over from one section to the next. The result is
+identical to emitting one section containing all of them, but only the section
+being written is held in memory. As sections must balance their indentation,
+indentation spanning several sections is set on the writer itself.
+
+A compact writer drops all line breaks, padding and indentation, writing only
+the text of the sections.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Tuple
+
+from gcgen.api import Section
+from gcgen.emitter.section import SectionDedentError, SectionElem
+from gcgen.emitter.special_chars import CtrlChr, Padding
+
+from spex.compression import compression_of, open_file
+
+
+class SectionWriter:
+    """write sections to `path`, one at a time.
+
+    Like gcgen's `write_file`, output goes to a temporary file which replaces
+    `path` once closed, such that `path` is never partially written. Exiting the
+    context manager due to an exception, or calling `abort`, removes the
+    temporary file and leaves `path` untouched. If `path` has the suffix of a
+    compression, e.g. `.gz`, the written contents are compressed.
+    """
+
+    def __init__(self, path: Path, indent_by: str = " ", compact: bool = False):
+        self._path = path
+        self._indent_by = indent_by
+        self._compact = compact
+        fd, self._tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        # compress as indicated by the suffix of `path`, see `spex.compression`
+        try:
+            self._fh = open_file(Path(self._tmp_path), "wb", compression_of(path))
+        except BaseException:
+            os.unlink(self._tmp_path)
+            raise
+        # emitter state, see `gcgen.emitter.Emitter.emit`
+        self._started = False
+        self._fresh = True
+        self._padding = 0
+        self._nls = 0
+        self._level = 0
+        # bytes written, and offset of the first text of the section being written
+        self._offset = 0
+        self._start: Optional[int] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        return self._fh.closed
+
+    def write(self, s: Section) -> Tuple[int, int]:
+        """emit `s`, continuing where the previously written section left off.
+
+        Returns the offset and length, in bytes, of the text of `s` within the
+        (uncompressed) file, excluding any whitespace preceding it."""
+        self._start = None
+        for elem in s.iterator():
+            self._emit(elem)
+        start = self._offset if self._start is None else self._start
+        return start, self._offset - start
+
+    def indent(self) -> "SectionWriter":
+        """indent subsequently written sections by one more level."""
+        self._emit(CtrlChr.Indent)
+        return self
+
+    def dedent(self) -> "SectionWriter":
+        """indent subsequently written sections by one level less."""
+        if self._level == 0:
+            raise SectionDedentError
+        self._emit(CtrlChr.Dedent)
+        return self
+
+    def _emit(self, elem: SectionElem) -> None:
+        if self._compact:
+            if isinstance(elem, str):
+                self._write_text(elem)
+            elif elem == CtrlChr.Indent:
+                self._level += 1
+            elif elem == CtrlChr.Dedent:
+                self._level -= 1
+            return
+        started = self._started
+        self._started = True
+        if isinstance(elem, Padding):
+            if not started or elem.numlines < self._padding:
+                return
+            self._fresh = True
+            self._padding = elem.numlines
+        elif elem == CtrlChr.Newline:
+            self._nls += 1
+            self._fresh = True
+        elif elem == CtrlChr.Freshline:
+            if not self._fresh:
+                self._nls += 1
+                self._fresh = True
+        elif elem == CtrlChr.Indent:
+            self._level += 1
+            if not self._fresh:
+                self._nls = 1
+                self._fresh = True
+        elif elem == CtrlChr.Dedent:
+            self._level -= 1
+            if not self._fresh:
+                self._nls = 1
+        elif isinstance(elem, str):
+            w = self._write
+            if self._padding:
+                w("\n" * max(self._nls, self._padding + 1))
+                self._padding = self._nls = 0
+                self._fresh = True
+            elif self._nls:
+                w("\n" * self._nls)
+                self._padding = self._nls = 0
+                self._fresh = True
+
+            if self._fresh:
+                self._fresh = False
+                w(self._indent_by * self._level)
+            self._write_text(elem)
+
+    def _write(self, txt: str) -> None:
+        data = txt.encode("utf-8")
+        self._fh.write(data)
+        self._offset += len(data)
+
+    def _write_text(self, txt: str) -> None:
+        if self._start is None:
+            self._start = self._offset
+        self._write(txt)
+
+    def close(self) -> None:
+        """finish writing, replacing `path` with the written contents."""
+        if self._fh.closed:
+            return
+        try:
+            if self._nls:
+                self._write("\n" * self._nls)
+            self._fh.close()
+            os.replace(self._tmp_path, self._path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        """discard written contents, leaving `path` untouched."""
+        self._fh.close()
+        try:
+            os.unlink(self._tmp_path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SectionWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Optional[bool]:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+        return None
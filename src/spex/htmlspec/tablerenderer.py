@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from dataclasses import dataclass
+from html import escape as html_escape
+from itertools import groupby
+from re import Match
+from re import compile as re_compile
+from typing import Any, Iterable, Optional
+
+from gcgen.api import Section
+from gcgen.emitter.special_chars import CtrlChr, Padding
+
+from spex.htmlspec import css
+from spex.htmlspec.parser import List, ListElem, Paragraph, Span, Table
+
+TXTFMT_PREFIX = "txtfmt"
+TCELL_PREFIX = "tcell"
+
+# matches class attributes referring to cached CSS rules, see `TableRenderer.merge`.
+# Text is HTML-escaped, so this cannot match text contents.
+_rgx_cached_clsname = re_compile(
+    f'class="(?P<clsname>(?:{TXTFMT_PREFIX}|{TCELL_PREFIX})\\d+)"'
+)
+
+
+@dataclass(frozen=True)
+class TableFragment:
+    """table rendered in isolation, e.g. by a worker process.
+
+    Class names in `section` refer to the fragment's own CSS caches and
+    must be reconciled with those of the main document, see `TableRenderer.merge`.
+    """
+
+    table: Table
+    section: Section
+    txtfmt_cache: css.CssCache
+    tcell_cache: css.CssCache
+
+
+class TableRenderer:
+    """render parsed tables into HTML.
+
+    Text- and table cell-formatting is collected in CSS caches, assigning class
+    names in order of first use.
+
+    If `compact`, the text of adjacent spans sharing a CSS class is merged and
+    text without a class is rendered without a `<span>` wrapper. Class names
+    are assigned as they would be otherwise."""
+
+    def __init__(self, compact: bool = False) -> None:
+        self.compact = compact
+        # from props -> name
+        self.txtfmt_cache = css.CssCache(TXTFMT_PREFIX)
+        self.tcell_cache = css.CssCache(TCELL_PREFIX)
+
+    @classmethod
+    def render_fragment(cls, tbl: Table, compact: bool = False) -> TableFragment:
+        """render table into a stand-alone fragment."""
+        r = cls(compact=compact)
+        s = Section()
+        r.render_table(s, tbl)
+        return TableFragment(
+            table=tbl, section=s, txtfmt_cache=r.txtfmt_cache, tcell_cache=r.tcell_cache
+        )
+
+    def merge(self, s: Section, frag: TableFragment) -> None:
+        """write out fragment into `s`, as if the table had been rendered here.
+
+        Fragment CSS rules are registered, in the order in which the fragment
+        first used them, such that the resulting output is identical to that of
+        calling `render_table` directly."""
+        clsnames = {
+            **self.txtfmt_cache.merge(frag.txtfmt_cache),
+            **self.tcell_cache.merge(frag.tcell_cache),
+        }
+
+        def rename(m: Match[str]) -> str:
+            return f'class="{clsnames[m.group("clsname")]}"'
+
+        for elem in frag.section.iterator():
+            if isinstance(elem, str):
+                s.emit(_rgx_cached_clsname.sub(rename, elem))
+            elif isinstance(elem, Padding):
+                s.ensure_padding_lines(elem.numlines)
+            elif elem == CtrlChr.Newline:
+                s.newline()
+            elif elem == CtrlChr.Freshline:
+                s.freshline()
+            elif elem == CtrlChr.Indent:
+                s.indent()
+            elif elem == CtrlChr.Dedent:
+                s.dedent()
+            else:
+                raise RuntimeError(f"unexpected section element {elem!r}")
+
+    def render_paragraph(self, s: Section, p: Paragraph) -> None:
+        s.emitln("<p>").indent()
+        self.render_spans(s, p.spans)
+        s.dedent().emitln("</p>")
+
+    def __span_clsname(self, span: Span) -> Optional[str]:
+        if span.style is None:
+            return None
+        return self.txtfmt_cache.get_clsname(span.style)
+
+    def render_span(self, s: Section, span: Span) -> None:
+        txt = html_escape(span.text)
+        clsname = self.__span_clsname(span)
+        if clsname is not None:
+            s.emit(f'<span class="{clsname}">{txt}</span>')
+        else:
+            s.emit(f"<span>{txt}</span>")
+
+    def render_spans(self, s: Section, spans: Iterable[Span]) -> None:
+        if not self.compact:
+            for span in spans:
+                self.render_span(s, span)
+            return
+
+        for clsname, group in groupby(spans, key=self.__span_clsname):
+            txt = html_escape("".join(span.text for span in group))
+            if clsname is not None:
+                s.emit(f'<span class="{clsname}">{txt}</span>')
+            elif txt:
+                s.emit(txt)
+
+    def render_list(self, s: Section, lst: List) -> None:
+        s.emitln(f'<{lst.tag} class="{lst.props.css_clsname}">').indent()
+        open_elem = False
+        for elem in lst.elems:
+            if isinstance(elem, ListElem):
+                if open_elem:
+                    s.dedent().emitln("</li>")
+                s.emitln("<li>").indent()
+                self.render_spans(s, elem.elems)
+                open_elem = True
+            elif isinstance(elem, List):
+                if not open_elem:
+                    s.emitln("<li>").indent()
+                self.render_list(s, elem)
+                s.dedent().emitln("</li>")
+                open_elem = False
+            else:
+                raise RuntimeError(f"unknown list element {type(elem)}")
+        if open_elem:
+            s.dedent().emitln("</li>")
+        s.dedent().emitln(f"</{lst.tag}>")
+
+    def render_table(self, s: Section, tbl: Table) -> None:
+        if tbl.id:
+            s.emitln(f"<table id='{tbl.id}'>").indent()
+        else:
+            s.emitln("<table>").indent()
+        for rndx, row in enumerate(tbl.rows):
+            s.emitln("<tr>").indent()
+            for cndx, cell in enumerate(row):
+                if cell.left != cndx or cell.top != rndx:
+                    # cells may span multiple columns and rows, render them only
+                    # the first time seen / at its origin point
+                    continue
+                if cell.tc_pr:
+                    clsname = self.tcell_cache.get_clsname(cell.tc_pr)
+                else:
+                    clsname = None
+                s.emit(
+                    "<",
+                    cell.tag,
+                    f' colspan="{cell.colspan}"' if cell.colspan > 1 else "",
+                    f' rowspan="{cell.rowspan}"' if cell.rowspan > 1 else "",
+                    f' class="{clsname}"' if clsname else "",
+                    ">",
+                ).indent()
+                for elem in cell.elems:
+                    self.render_any(s, elem)
+                s.dedent().emitln(f"</{cell.tag}>")
+            s.dedent().emitln("</tr>")
+        s.dedent().emitln("</table>")
+
+    def render_any(self, s: Section, o: Any) -> None:
+        if isinstance(o, Span):
+            self.render_span(s, o)
+        elif isinstance(o, Paragraph):
+            self.render_paragraph(s, o)
+        elif isinstance(o, List):
+            self.render_list(s, o)
+        elif isinstance(o, Table):
+            self.render_table(s, o)
+        else:
+            raise RuntimeError(f"render got element of type {type(o)} - cannot render")
@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Build the HTML model directly as an lxml tree.
+
+The resulting tree is equivalent to parsing the HTML document written by
+`SpexHtmlRenderer`, including the whitespace between elements. This lets the
+docx -> JSON pipeline skip serializing the HTML model to text and parsing it
+back.
+
+HTML documents written in compact form (see `TableRenderer.compact`) lack this
+whitespace, `XmlUtils.to_text` ignores it such that the extracted text is the
+same either way.
+"""
+
+from typing import Optional
+
+from lxml.etree import SubElement
+
+from spex import __version__
+from spex.htmlspec import css
+from spex.htmlspec.parser import List, ListElem, Paragraph, Span, Table
+from spex.xml import Element, ElementTree, etree
+
+# mirrors the indentation of `gcgen.api.write_file`
+_INDENT = " "
+# tags rendered inline, all other tags open and close on lines of their own.
+_INLINE_TAGS = {"span"}
+
+# `<meta name=LAYOUT_META content=COMPACT_LAYOUT>` marks compact HTML documents
+LAYOUT_META = "spexHtmlLayout"
+COMPACT_LAYOUT = "compact"
+
+
+def _text(txt: str) -> str:
+    # mirror text as it is read back from the HTML document:
+    # `Section.emit` escapes newlines and XML parsers normalize carriage returns.
+    return txt.replace("\n", "\\n").replace("\r", "\n")
+
+
+def _layout(e: Element, level: int) -> None:
+    """insert the whitespace which the rendered HTML document would contain."""
+    children = list(e)
+    e.text = "\n" + _INDENT * (level + 1 if children else level)
+    for ndx, child in enumerate(children):
+        if child.tag not in _INLINE_TAGS:
+            _layout(child, level + 1)
+        if ndx == len(children) - 1:
+            child.tail = "\n" + _INDENT * level
+        elif child.tag in _INLINE_TAGS:
+            child.tail = None
+        else:
+            child.tail = "\n" + _INDENT * (level + 1)
+
+
+class HtmlTreeBuilder:
+    """build HTML model tree from parsed tables.
+
+    CSS class names are drawn from the provided caches, share these with the
+    `TableRenderer` writing the HTML document to get identical class names."""
+
+    def __init__(
+        self,
+        *,
+        title: str,
+        revision: Optional[str],
+        fname: str,
+        txtfmt_cache: css.CssCache,
+        tcell_cache: css.CssCache,
+    ):
+        self.__txtfmt_cache = txtfmt_cache
+        self.__tcell_cache = tcell_cache
+
+        html = etree.Element("html", lang="en")
+        html.text = "\n"
+        head = SubElement(html, "head")
+        meta = SubElement(head, "meta", charset="utf-8")
+        meta.set("data-spec", title)
+        if revision is not None:
+            meta.set("data-revision", revision)
+        SubElement(head, "meta", name="spexVersion", content=__version__)
+        SubElement(head, "title").text = fname
+        SubElement(head, "link", rel="stylesheet", href=f"{fname}.css")
+        head.text = "\n" + _INDENT
+        for child in head:
+            child.tail = "\n" + _INDENT
+        child.tail = head.tail = "\n"
+        self.__body = SubElement(html, "body")
+        self.__body.text = "\n"
+        self.__body.tail = "\n"
+        self.__tree = etree.ElementTree(html)
+
+    @property
+    def tree(self) -> ElementTree:
+        return self.__tree
+
+    def add_table(self, tbl: Table) -> None:
+        """append table to the document body."""
+        body = self.__body
+        e = self._build_table(body, tbl)
+        _layout(e, 1)
+        prev = e.getprevious()
+        if prev is not None:
+            prev.tail = "\n" + _INDENT
+        else:
+            body.text = "\n" + _INDENT
+        e.tail = "\n"
+
+    def _build_paragraph(self, parent: Element, p: Paragraph) -> None:
+        e = SubElement(parent, "p")
+        for span in p.spans:
+            self._build_span(e, span)
+
+    def _build_span(self, parent: Element, span: Span) -> None:
+        e = SubElement(parent, "span")
+        if span.style is not None:
+            clsname = self.__txtfmt_cache.get_clsname(span.style)
+            if clsname is not None:
+                e.set("class", clsname)
+        e.text = _text(span.text)
+
+    def _build_list(self, parent: Element, lst: List) -> None:
+        e = SubElement(parent, lst.tag, {"class": lst.props.css_clsname})
+        li: Optional[Element] = None
+        for elem in lst.elems:
+            if isinstance(elem, ListElem):
+                li = SubElement(e, "li")
+                for span in elem.elems:
+                    self._build_span(li, span)
+            elif isinstance(elem, List):
+                self._build_list(li if li is not None else SubElement(e, "li"), elem)
+                li = None
+            else:
+                raise RuntimeError(f"unknown list element {type(elem)}")
+
+    def _build_table(self, parent: Element, tbl: Table) -> Element:
+        e = SubElement(parent, "table")
+        if tbl.id:
+            e.set("id", tbl.id)
+        for rndx, row in enumerate(tbl.rows):
+            tr = SubElement(e, "tr")
+            for cndx, cell in enumerate(row):
+                if cell.left != cndx or cell.top != rndx:
+                    # cells may span multiple columns and rows, add them only
+                    # the first time seen / at its origin point
+                    continue
+                td = SubElement(tr, cell.tag)
+                if cell.colspan > 1:
+                    td.set("colspan", str(cell.colspan))
+                if cell.rowspan > 1:
+                    td.set("rowspan", str(cell.rowspan))
+                if cell.tc_pr:
+                    clsname = self.__tcell_cache.get_clsname(cell.tc_pr)
+                    if clsname:
+                        td.set("class", clsname)
+                for elem in cell.elems:
+                    self._build_any(td, elem)
+        return e
+
+    def _build_any(self, parent: Element, o: object) -> None:
+        if isinstance(o, Paragraph):
+            self._build_paragraph(parent, o)
+        elif isinstance(o, List):
+            self._build_list(parent, o)
+        elif isinstance(o, Table):
+            self._build_table(parent, o)
+        elif isinstance(o, Span):
+            self._build_span(parent, o)
+        else:
+            raise RuntimeError(f"cannot add element of type {type(o)} to tree")
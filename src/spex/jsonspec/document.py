@@ -12,10 +12,13 @@ from loguru import logger
 from spex.jsonspec.defs import JSON, Entity, EntityMeta, cast_json
 from spex.jsonspec.extractors.structtable import BitsTableExtractor, BytesTableExtractor
 from spex.jsonspec.extractors.valuetable import ValueTableExtractor
+from spex.jsonspec.figcache import FigureCache, figure_key
+from spex.jsonspec.incremental import FigureRecord, PreviousModel, figure_record
 from spex.jsonspec.lint import LintEntry, Linter, LintErr
+from spex.jsonspec.parallel import FigureResult, extract_figures
 from spex.jsonspec.parserargs import ParserArgs
 from spex.log import ULog
-from spex.xml import XmlUtils, Xpath
+from spex.xml import XmlUtils, Xpath, etree
 
 if TYPE_CHECKING:
     from spex.jsonspec.extractors.figure import FigureExtractor
@@ -74,6 +77,14 @@ class DocLinter:
         """
         return [*self._lint_issues]
 
+    def extend(self, entries: List[LintEntry]) -> None:
+        """Method to add linting issues recorded elsewhere, e.g. by a worker process
+
+        Args:
+            entries (List[LintEntry]): lint entries to add, in order
+        """
+        self._lint_issues.extend(entries)
+
 
 class DocumentParser:
     rgx_fig_id = re_compile(r"Figure\s+(?P<figid>[^\s^:]+).*")
@@ -85,6 +96,12 @@ class DocumentParser:
         self.__spec = spec
         self.__revision = revision
         self.__linter = DocLinter()
+        self.__cache: Optional[FigureCache] = None
+        if args.cache_dir is not None:
+            self.__cache = FigureCache(args.cache_dir, args.cache_size)
+        # loaded on parse, see `_lookup_fig`
+        self.__previous: Optional[PreviousModel] = None
+        self.__fig_records: List[FigureRecord] = []
         self.__post_init__()
         self._unwind_parse_error = False
         self.__fig_id_missing_counter = 0
@@ -148,6 +165,13 @@ class DocumentParser:
     def linter(self) -> Linter:
         return self.__linter
 
+    @property
+    def fig_records(self) -> List[FigureRecord]:
+        """Record of each top-level figure parsed so far, see `FigureRecord`.
+
+        Only recorded if `ParserArgs.record_fingerprints` is set."""
+        return [*self.__fig_records]
+
     def _on_extract_figure_title(self, fig_tr: "Element") -> Optional[str]:
         """Extract title from figure table."""
         title = XmlUtils.to_text(fig_tr)
@@ -343,11 +367,118 @@ class DocumentParser:
                         raise err
 
     def parse(self) -> Iterator[EntityMeta]:
+        if self.args.incremental_from is not None and self.__previous is None:
+            self.__previous = PreviousModel.load(self.args.incremental_from)
+
+        if self.args.jobs > 1:
+            yield from self._parse_parallel()
+            return
+
+        use_lookup = self.__cache is not None or self.args.record_fingerprints
         # for each eligible top-level figure
         for entity, tbl in self.iter_figures():
             # ... produce one or more entities (parsed figures)
             # depending on the figure type and whether it contains nested tables.
-            yield from self._on_parse_fig(entity, tbl)
+            if use_lookup:
+                yield from self._parse_fig_reusing(entity, tbl)
+            else:
+                yield from self._on_parse_fig(entity, tbl)
+
+    def _lookup_fig(
+        self, entity: EntityMeta, tbl_xml: bytes
+    ) -> Tuple[str, Optional[FigureResult]]:
+        """Look up result of parsing figure in the previous model or figure cache.
+
+        Returns:
+            The figure's key (fingerprint), and its previously extracted result,
+            if any.
+        """
+        fig_id = entity["fig_id"]
+        key = figure_key(self, entity, tbl_xml)
+        res = None
+        if self.__previous is not None:
+            res = self.__previous.figure(fig_id, key)
+        if res is None and self.__cache is not None:
+            res = self.__cache.get(key)
+        return key, res
+
+    def __record_fig(self, fig_id: FigId, key: str, res: FigureResult) -> None:
+        if self.args.record_fingerprints:
+            self.__fig_records.append(figure_record(fig_id, key, res))
+
+    def _parse_fig_reusing(
+        self, entity: EntityMeta, tbl: "Element"
+    ) -> Iterator[Entity]:
+        """Parse figure like `_on_parse_fig`, reusing the previous result if
+        the figure was extracted before, see `_lookup_fig`."""
+        key, res = self._lookup_fig(entity, etree.tostring(tbl, with_tail=False))
+        if res is not None:
+            self.__linter.extend(res.lint_entries)
+            self.__record_fig(entity["fig_id"], key, res)
+            yield from res.entities
+            return
+
+        num_lint_entries = len(self.__linter.lint_entries())
+        entities: List[Entity] = []
+        for e in self._on_parse_fig(entity, tbl):
+            entities.append(e)
+            yield e
+        res = FigureResult(
+            entities=entities,
+            lint_entries=self.__linter.lint_entries()[num_lint_entries:],
+        )
+        self.__record_fig(entity["fig_id"], key, res)
+        if self.__cache is not None:
+            self.__cache.put(key, res)
+
+    def _parse_parallel(self) -> Iterator[EntityMeta]:
+        """Parse figures using worker processes, see `spex.jsonspec.parallel`.
+
+        Produces the same entities and lint entries, in the same order, as
+        parsing the figures serially. Figures found in the previous model or
+        figure cache are not sent to the workers."""
+        linter = self.__linter
+        cache = self.__cache
+        use_lookup = cache is not None or self.args.record_fingerprints
+        jobs: List[Tuple[EntityMeta, bytes]] = []
+        # per figure: its key and previously extracted result, if any.
+        figures: List[Tuple[FigId, Optional[str], Optional[FigureResult]]] = []
+        # lint entries raised while locating each figure, these precede the
+        # entries from parsing the figure itself.
+        located: List[List[LintEntry]] = []
+        try:
+            self.__linter = DocLinter()
+            for entity, tbl in self.iter_figures():
+                tbl_xml = etree.tostring(tbl, with_tail=False)
+                key = hit = None
+                if use_lookup:
+                    key, hit = self._lookup_fig(entity, tbl_xml)
+                if hit is None:
+                    jobs.append((entity, tbl_xml))
+                figures.append((entity["fig_id"], key, hit))
+                located.append(self.__linter.lint_entries())
+                self.__linter = DocLinter()
+            trailing = self.__linter.lint_entries()
+        finally:
+            self.__linter = linter
+
+        results = extract_figures(self, jobs, self.args.jobs)
+        try:
+            for lint_entries, (fig_id, key, res) in zip(located, figures):
+                if res is None:
+                    res = next(results)
+                    if cache is not None and key is not None:
+                        cache.put(key, res)
+                if key is not None:
+                    self.__record_fig(fig_id, key, res)
+                linter.extend(lint_entries)
+                linter.extend(res.lint_entries)
+                yield from res.entities
+                if res.error is not None:
+                    raise RuntimeError(f"failed parsing figure in worker:\n{res.error}")
+        finally:
+            results.close()
+        linter.extend(trailing)
 
 
 __all__ = ["DocumentParser"]
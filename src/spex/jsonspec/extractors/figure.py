@@ -13,7 +13,7 @@ from spex.jsonspec.extractors.helpers import (
     mapping_incomplete,
 )
 from spex.jsonspec.lint import Linter, LintErr
-from spex.jsonspec.rowiter import row_iter
+from spex.jsonspec.rowiter import Row, row_iter
 from spex.xml import Element, Xpath
 
 if TYPE_CHECKING:
@@ -101,10 +101,8 @@ class FigureExtractor(ABC):
             ctx=ctx,
         )
 
-    def row_iter(self) -> Iterator[Element]:
-        # select first td where parent is a tr
-        # ... then select the parent (tr) again
-        # -> filters out header (th) rows
+    def row_iter(self) -> Iterator[Row]:
+        # rows with at least one td or th cell, see `row_iter`
         yield from row_iter(self.tbl)
 
     def extract_data_sub_table(
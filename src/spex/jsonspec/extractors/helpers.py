@@ -26,6 +26,15 @@ def extract_content(data: "Element") -> Optional[str]:
     return XmlUtils.to_text(paragraph)
 
 
+def content_brief_text(content: "Element") -> str:
+    """text of the content cell `content` to extract a brief from.
+
+    Sub-tables of the cell are left out, these are extracted separately."""
+    if content.find("table") is None:
+        return XmlUtils.to_text(content)
+    return XmlUtils.to_text(*(e for e in content if e.tag != "table"))
+
+
 def content_extract_brief(content: str, brief_maxlen: int = 60) -> Optional[str]:
     """Extract brief from a string
 
@@ -43,7 +52,7 @@ def content_extract_brief(content: str, brief_maxlen: int = 60) -> Optional[str]
     match = STRUCT_LABEL_REGEX.regex.match(txt)
     if match is None or match.group("brief") is None:
         return None
-    brief = match.group("brief").rstrip(".").lstrip(" ")
+    brief = match.group("brief").rstrip(".").strip()
 
     if len(brief) <= brief_maxlen:
         return brief
@@ -32,6 +32,7 @@ from spex.jsonspec.exceptions import XPathElementNotFoundException
 from spex.jsonspec.extractors.figure import FigureExtractor, RowErrPolicy
 from spex.jsonspec.extractors.helpers import (
     StructTableMapping,
+    content_brief_text,
     content_extract_brief,
     generate_acronym,
     normalize_label,
@@ -43,7 +44,8 @@ from spex.jsonspec.extractors.regular_expressions import (
     STRUCT_LABEL_REGEX,
 )
 from spex.jsonspec.lint import LintErr
-from spex.jsonspec.queries import contains_th, extract_possible_colspan
+from spex.jsonspec.queries import extract_possible_colspan
+from spex.jsonspec.rowiter import Row
 from spex.log import logger
 from spex.xml import Element, XmlUtils, Xpath
 
@@ -106,8 +108,8 @@ class StructTableExtractor(FigureExtractor, ABC):
 
     def row_err_handler(
         self,
-        row_it: Iterator[Element],
-        row: Element,
+        row_it: Iterator[Row],
+        row: Row,
         fields: List[StructField],
         err: Exception,
     ) -> Generator["Entity", None, RowErrPolicy]:
@@ -116,7 +118,7 @@ class StructTableExtractor(FigureExtractor, ABC):
 
         This hook is useful only for individual table overrides to catch special cases.
         """
-        if len(Xpath.elems(row, "./td")) == 1:
+        if len(row.cells) == 1:
             # There is only one column in the whole row
             return RowErrPolicy.Continue
         yield from ()  # To turn method into a generator
@@ -127,8 +129,8 @@ class StructTableExtractor(FigureExtractor, ABC):
         is_dynamic_table_mode = False
         row_it = self.row_iter()
         for row in row_it:
-            if contains_th(row):
-                if colspan := extract_possible_colspan(row):
+            if row.is_header:
+                if colspan := extract_possible_colspan(row.elem):
                     # Identify if rows denote a dynamic list table
                     # and set the dynamic mode to true.
                     if "List" in colspan and not is_dynamic_table_mode:
@@ -141,7 +143,7 @@ class StructTableExtractor(FigureExtractor, ABC):
             try:
                 range_field, content_field, label_field = self._extract_fields(row)
             except XPathElementNotFoundException as e:
-                row_txt = XmlUtils.to_text(row).lower()
+                row_txt = row.text.lower()
                 if row_txt.startswith(ELLIPSIS):
                     # revisit ranges here once we have normalized field order
                     # (bits fields are in desc order, bytes are in asc)
@@ -159,7 +161,7 @@ class StructTableExtractor(FigureExtractor, ABC):
                     if out == RowErrPolicy.Stop:
                         break
                     elif out == RowErrPolicy.Raise:
-                        logger.bind(range=XmlUtils.to_text(row).lower()).exception(
+                        logger.bind(range=row.text.lower()).exception(
                             "failed to parse row"
                         )
                         raise e
@@ -189,7 +191,9 @@ class StructTableExtractor(FigureExtractor, ABC):
 
             row_key = self._range_to_row_key(range)
             label = self._parse_label(label=label_field, row_key=row_key)
-            brief = self._parse_brief(content_field, row_key=row_key)
+            brief = self._parse_brief(
+                content_brief_text(self.content_elem(row)), row_key=row_key
+            )
 
             sub_table_entity: "EntityMeta" = {
                 "fig_id": f"""{self.fig_id}_{row_key}""",
@@ -284,43 +288,43 @@ class StructTableExtractor(FigureExtractor, ABC):
                 # skip next range check
                 prev_range = None
 
-    def range_elem(self, row: Element) -> Element:
+    def range_elem(self, row: Row) -> Element:
         """Query row to find range element
 
         Args:
-            row (Element): The row to query
+            row (Row): The row to query
 
         Returns:
             Element: If label element is found return it, this method can raise
             an XPathElementNotFoundException
         """
 
-        return Xpath.elem_first_req(row, f"./td[{self._col_ndx_range + 1}]")
+        return row.cell(self._col_ndx_range)
 
-    def content_elem(self, row: Element) -> Element:
+    def content_elem(self, row: Row) -> Element:
         """Query row to find content element
 
         Args:
-            row (Element): The row to query
+            row (Row): The row to query
 
         Returns:
             Element: If label element is found return it, this method can raise
             an XPathElementNotFoundException
         """
 
-        return Xpath.elem_first_req(row, f"./td[{self._col_ndx_content + 1}]")
+        return row.cell(self._col_ndx_content)
 
-    def label_elem(self, row: Element) -> Element:
+    def label_elem(self, row: Row) -> Element:
         """Query row to find label element
 
         Args:
-            row (Element): The row to query
+            row (Row): The row to query
 
         Returns:
             Element: If label element is found return it, this method can raise
             an XPathElementNotFoundException
         """
-        return Xpath.elem_first_req(row, f"./td[{self._col_ndx_label + 1}]/p[1]")
+        return Xpath.elem_first_req(row.cell(self._col_ndx_label), "./p[1]")
 
     def _struct_field(
         self, maybe_range: MaybeRange, label: str, brief: Optional[str] = None
@@ -337,13 +341,13 @@ class StructTableExtractor(FigureExtractor, ABC):
                 "range": maybe_range,
             }
 
-    def _extract_fields(self, row: Element) -> Tuple[str, str, str]:
+    def _extract_fields(self, row: Row) -> Tuple[str, str, str]:
         """Extract the range/content/label elements from row
 
         Will return a tuple containing strings
 
         Args:
-            row (Element): A row element to extract the inner elements of the
+            row (Row): A row to extract the inner elements of the
             range, label and content columns.
 
         Returns:
@@ -10,6 +10,7 @@ from spex.jsonspec.exceptions import LabelExtractionError
 from spex.jsonspec.extractors.figure import FigureExtractor, RowErrPolicy
 from spex.jsonspec.extractors.helpers import (
     ValueTableMapping,
+    content_brief_text,
     content_extract_brief,
     extract_content,
     mapping_incomplete,
@@ -19,7 +20,7 @@ from spex.jsonspec.extractors.helpers import (
 )
 from spex.jsonspec.extractors.regular_expressions import VALUE_LABEL_REGEX
 from spex.jsonspec.lint import LintErr
-from spex.jsonspec.queries import contains_th
+from spex.jsonspec.rowiter import Row
 from spex.xml import Element, XmlUtils, Xpath
 
 if TYPE_CHECKING:
@@ -71,7 +72,7 @@ class ValueTableExtractor(FigureExtractor):
         for row in row_it:
             row_val: Element
             row_data: Element
-            if contains_th(row):
+            if row.is_header:
                 # Skip this row, its the table header.
                 # In any case, it is handled before getting here.
                 continue
@@ -79,7 +80,7 @@ class ValueTableExtractor(FigureExtractor):
                 row_val = self.val_elem(row)
                 row_data = self.content_elem(row)
             except Exception as e:
-                row_txt = XmlUtils.to_text(row).lower()
+                row_txt = row.text.lower()
                 if row_txt.startswith(ELLIPSIS):
                     # revisit ranges here once we have normalized field order
                     # (bits fields are in desc order, bytes are in asc)
@@ -176,8 +177,8 @@ class ValueTableExtractor(FigureExtractor):
 
     def row_err_handler(
         self,
-        row_it: Iterator[Element],
-        row: Element,
+        row_it: Iterator[Row],
+        row: Row,
         fields: List[ValueField],
         err: Exception,
     ) -> Generator["Entity", None, RowErrPolicy]:
@@ -220,19 +221,19 @@ class ValueTableExtractor(FigureExtractor):
                 )
             values.add(field_value)
 
-    def val_elem(self, row: Element) -> Element:
-        return Xpath.elem_first_req(row, f"./td[{self._col_ndx_value + 1}]")
+    def val_elem(self, row: Row) -> Element:
+        return row.cell(self._col_ndx_value)
 
-    def val_clean(self, row: Element, val_cell: Element) -> Union[str, int]:
+    def val_clean(self, row: Row, val_cell: Element) -> Union[str, int]:
         return XmlUtils.to_text(val_cell).lower()
 
-    def content_elem(self, row: Element) -> Element:
-        return Xpath.elem_first_req(row, f"./td[{self._col_ndx_content + 1}]")
+    def content_elem(self, row: Row) -> Element:
+        return row.cell(self._col_ndx_content)
 
-    def _extract_label_dedicated_col(self, row: Element, row_key: str) -> str:
+    def _extract_label_dedicated_col(self, row: Row, row_key: str) -> str:
         # if we hit this, some document actually has a value table with a
         # dedicated 'attribute' column
-        p1 = Xpath.elem_first_req(row, f"./td[{self._col_ndx_label + 1}]/p[1]")
+        p1 = Xpath.elem_first_req(row.cell(self._col_ndx_label), "./p[1]")
         txt = XmlUtils.to_text(p1).lower()
         if txt == "reserved":
             return RESERVED
@@ -247,7 +248,7 @@ class ValueTableExtractor(FigureExtractor):
             pass
         return txt_parts[0].replace(" ", "_").upper()
 
-    def _extract_label(self, row: Element, row_key: str, data: Element) -> str:
+    def _extract_label(self, row: Row, row_key: str, data: Element) -> str:
         if self._col_ndx_content != self._col_ndx_label:
             label = self._extract_label_dedicated_col(row, row_key)
             if label.upper() == RESERVED:
@@ -274,7 +275,7 @@ class ValueTableExtractor(FigureExtractor):
         return label
 
     def _content_extract_brief(
-        self, row: Element, row_key: str, data: Element
+        self, row: Row, row_key: str, data: Element
     ) -> Optional[str]:
         content = self.content_elem(row)
-        return content_extract_brief(XmlUtils.to_text(content), self.BRIEF_MAXLEN)
+        return content_extract_brief(content_brief_text(content), self.BRIEF_MAXLEN)
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+On-disk cache of extracted figures.
+
+Figures are keyed by a hash of everything which determines the result of
+extracting them: the figure's HTML subtree and metadata, the document parser
+(quirks) class, the extractor classes it may apply and the spex version.
+Each entry stores the entities and lint entries produced for the figure, such
+that unchanged figures need not be extracted again.
+
+The cache is bounded in size, evicting the least recently used entries first.
+It is safe to share a cache directory between concurrent runs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple, cast
+
+from loguru import logger
+
+from spex import __version__
+from spex.jsonspec.defs import Entity, EntityMeta
+from spex.jsonspec.lint import LintEntry
+from spex.jsonspec.parallel import FigureResult
+from spex.log import ULog
+
+if TYPE_CHECKING:
+    from spex.jsonspec.document import DocumentParser
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# when evicting, shrink the cache well below its bound, such that eviction,
+# which scans the entire cache, is not triggered by every insertion.
+EVICT_TARGET_RATIO = 0.8
+
+FORMAT_VERSION = 1
+
+
+def _qualname(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def figure_key(parser: "DocumentParser", entity: EntityMeta, tbl_xml: bytes) -> str:
+    """return cache key for extracting figure `tbl_xml` using `parser`."""
+    override = parser.fig_extractor_overrides.get(entity["fig_id"], None)
+    extractors = [override] if override is not None else parser.extractors
+    h = hashlib.sha256()
+    for part in (
+        f"spex:{__version__}:{FORMAT_VERSION}",
+        _qualname(type(parser)),
+        ",".join(_qualname(e) for e in extractors),
+        json.dumps(entity, sort_keys=True),
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    h.update(tbl_xml)
+    return h.hexdigest()
+
+
+class FigureCache:
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._dir = cache_dir
+        self._max_bytes = max_bytes
+        # total size of cache entries, computed on first insertion
+        self._size: Optional[int] = None
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[FigureResult]:
+        """return cached result of extracting figure, None if not cached."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            res = FigureResult(
+                entities=cast(List[Entity], data["entities"]),
+                lint_entries=[LintEntry.from_json(e) for e in data["lint"]],
+            )
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, AssertionError):
+            logger.log(ULog.WARNING, f"ignoring invalid figure cache entry {path!s}")
+            return None
+        try:
+            # mark as recently used, see `_evict`
+            os.utime(path)
+        except OSError:
+            pass
+        return res
+
+    def put(self, key: str, res: FigureResult) -> None:
+        """store result of extracting figure.
+
+        Figures which failed to parse are not cached."""
+        if res.failed:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = json.dumps(
+            {
+                "entities": res.entities,
+                "lint": [e.to_json() for e in res.lint_entries],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        # write atomically, concurrent readers must never see partial entries
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self._max_bytes:
+            self._evict()
+
+    def _entries(self) -> List[Tuple[float, Path, int]]:
+        """return (mtime, path, size) of all cache entries."""
+        entries = []
+        for path in self._dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                # evicted by a concurrent run
+                continue
+            entries.append((st.st_mtime, path, st.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        """evict least recently used entries until below the target size."""
+        entries = sorted(self._entries())
+        size = sum(size for _, _, size in entries)
+        target = int(self._max_bytes * EVICT_TARGET_RATIO)
+        for _, path, entry_size in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        self._size = size
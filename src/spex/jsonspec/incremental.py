@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Reuse figures of a previously generated NVMe model.
+
+A model generated with fingerprints recorded (see `ParserArgs.record_fingerprints`)
+lists each top-level figure in its meta block, with a fingerprint of its
+contents, the number of entities it produced and the lint entries raised while
+parsing it. Entities are written in figure order, so these counts identify the
+entities of each figure. When processing a new revision of the specification,
+figures whose fingerprint is unchanged are taken from the previous model rather
+than extracted again.
+
+The lint entries of a record are unfiltered, unlike those of the model's "lint"
+meta block, which omits codes ignored by `--lint-ignore`.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, TypedDict, cast
+
+from spex.jsonspec.defs import JSON, Entity
+from spex.jsonspec.lint import LintEntry
+from spex.jsonspec.parallel import FigureResult
+from spex.writer import S2Model, read_model
+
+FIGURES_META_KEY = "figures"
+
+
+class FigureRecord(TypedDict):
+    fig_id: str
+    fingerprint: str
+    entities: int
+    # True if the figure failed to parse
+    failed: bool
+    # all lint entries raised parsing the figure, see `LintEntry.to_json`
+    lint: List[JSON]
+
+
+def figure_record(fig_id: str, fingerprint: str, res: FigureResult) -> FigureRecord:
+    """return record of the top-level figure `fig_id`, extracted as `res`."""
+    return {
+        "fig_id": fig_id,
+        "fingerprint": fingerprint,
+        "entities": len(res.entities),
+        "failed": res.failed,
+        "lint": [e.to_json() for e in res.lint_entries],
+    }
+
+
+class PreviousModel:
+    """index of a previous model's entities and lint entries by top-level figure."""
+
+    def __init__(self, model: S2Model):
+        meta = model["meta"]
+        records = cast(List[FigureRecord], meta.get(FIGURES_META_KEY, None) or [])
+        entities = cast(List[Entity], model["entities"])
+        # fig_id -> (fingerprint, result)
+        self._figures: Dict[str, Tuple[str, FigureResult]] = {}
+        seen: Set[str] = set()
+        duplicates: Set[str] = set()
+        ndx = 0
+        for rec in records:
+            fig_id = rec["fig_id"]
+            end = ndx + rec["entities"]
+            if fig_id in seen:
+                duplicates.add(fig_id)
+            seen.add(fig_id)
+            # records of models predating failure tracking are not reused
+            if not rec.get("failed", True):
+                res = FigureResult(
+                    entities=entities[ndx:end],
+                    lint_entries=[
+                        LintEntry.from_json(cast(Dict[str, JSON], e))
+                        for e in rec["lint"]
+                    ],
+                )
+                self._figures[fig_id] = (rec["fingerprint"], res)
+            ndx = end
+
+        if ndx != len(entities):
+            # records do not describe this model's entities, reuse nothing
+            self._figures = {}
+        # cannot tell duplicate figures apart
+        for fig_id in duplicates:
+            self._figures.pop(fig_id, None)
+
+    @classmethod
+    def load(cls, path: Path) -> "PreviousModel":
+        return cls(read_model(path))
+
+    def figure(self, fig_id: str, fingerprint: str) -> Optional[FigureResult]:
+        """return entities and lint entries of the top-level figure, if unchanged.
+
+        Returns None if the figure's fingerprint differs from `fingerprint`, or
+        if the figure failed to parse in the previous model."""
+        fig = self._figures.get(fig_id, None)
+        if fig is None or fig[0] != fingerprint:
+            return None
+        return fig[1]
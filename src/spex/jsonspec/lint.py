@@ -4,7 +4,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, cast
 
 from spex.jsonspec.defs import JSON
 
@@ -105,6 +105,17 @@ class LintEntry:
             ret["row"] = self.row
         return ret
 
+    @classmethod
+    def from_json(cls, val: Dict[str, JSON]) -> "LintEntry":
+        """inverse of `to_json`."""
+        return cls(
+            err=LintErr(Code[cast(str, val["code"])]),
+            fig=cast(str, val["fig"]),
+            msg=cast(str, val["msg"]),
+            row=cast(Optional[str], val.get("row", None)),
+            ctx=cast(Dict[str, JSON], val["context"]),
+        )
+
     @property
     def code(self) -> str:
         return self.err.value.name
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Extract figures using a pool of worker processes.
+
+Top-level figures are independent of one another. Each worker runs
+`DocumentParser._on_parse_fig` on one figure using its own `DocumentParser`
+instance and returns the produced entities and lint entries, which the main
+process merges back in figure order.
+"""
+
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generator, Iterable, List, Optional, Tuple, Type
+
+from spex.jsonspec.defs import Entity, EntityMeta
+from spex.jsonspec.lint import LintEntry, LintErr
+from spex.xml import etree
+
+if TYPE_CHECKING:
+    from spex.jsonspec.document import DocumentParser
+    from spex.jsonspec.parserargs import ParserArgs
+
+# figures sent to a worker at a time, amortizes the IPC overhead of small figures.
+CHUNKSIZE = 4
+
+FigureJob = Tuple[EntityMeta, bytes]
+
+
+@dataclass(frozen=True)
+class FigureResult:
+    entities: List[Entity]
+    lint_entries: List[LintEntry]
+    # set if extraction raised, entities then holds the entities produced
+    # before the error.
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        """True if the figure could not be parsed."""
+        return self.error is not None or any(
+            e.err == LintErr.TBL_PARSE_ERR for e in self.lint_entries
+        )
+
+
+@dataclass(frozen=True)
+class _WorkerConfig:
+    parser_cls: Type["DocumentParser"]
+    args: "ParserArgs"
+    spec: str
+    revision: str
+
+
+# per-process configuration, set by `_worker_init`
+_config: Optional[_WorkerConfig] = None
+
+
+def _worker_init(config: _WorkerConfig) -> None:
+    global _config
+    _config = config
+
+
+def _worker_parse(job: FigureJob) -> FigureResult:
+    assert _config is not None, "worker process not initialized"
+    entity, tbl_xml = job
+    tbl = etree.fromstring(tbl_xml)
+    # fresh parser per figure, such that lint entries are tracked per figure.
+    parser = _config.parser_cls(
+        _config.args, etree.ElementTree(tbl), _config.spec, _config.revision
+    )
+    entities: List[Entity] = []
+    error = None
+    try:
+        entities.extend(parser._on_parse_fig(entity, tbl))
+    except Exception:
+        error = traceback.format_exc()
+    return FigureResult(
+        entities=entities, lint_entries=parser.linter.lint_entries(), error=error
+    )
+
+
+def extract_figures(
+    parser: "DocumentParser", jobs: Iterable[FigureJob], num_workers: int
+) -> Generator[FigureResult, None, None]:
+    """extract figures using `num_workers` worker processes.
+
+    Results are yielded in the order of `jobs`."""
+    config = _WorkerConfig(
+        parser_cls=type(parser),
+        args=parser.args,
+        spec=parser.spec,
+        revision=parser.revision,
+    )
+    with ProcessPoolExecutor(
+        max_workers=num_workers, initializer=_worker_init, initargs=(config,)
+    ) as pool:
+        yield from pool.map(_worker_parse, jobs, chunksize=CHUNKSIZE)
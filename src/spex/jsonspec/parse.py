@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from spex.compression import read_text
 from spex.jsonspec.document import DocumentParser
 from spex.jsonspec.parserargs import ParserArgs
 from spex.jsonspec.quirks import QUIRKS_MAP, QuirksMap
@@ -34,7 +35,8 @@ class SpecDocument:
 
 # TODO determine what to return
 def open_doc(spec: Path) -> SpecDocument:
-    return html_to_spec_doc(spec.absolute().read_text())
+    """open HTML model, which may be compressed, see `spex.compression`."""
+    return html_to_spec_doc(read_text(spec.absolute()))
 
 
 def html_to_spec_doc(html_doc: str) -> SpecDocument:
@@ -50,8 +52,22 @@ def html_to_spec_doc(html_doc: str) -> SpecDocument:
         SpecDocument: A wrapper that returns a parser and holds meta data on the
         specification
     """
-    doc = etree.parse(io.StringIO(html_doc))
+    return tree_to_spec_doc(etree.parse(io.StringIO(html_doc)))
 
+
+def tree_to_spec_doc(doc: ElementTree) -> SpecDocument:
+    """HTML tree to SpecDocument
+
+    Like `html_to_spec_doc`, but from an already parsed HTML document, such as
+    the tree built directly while rendering a docx specification.
+
+    Args:
+        doc (ElementTree): HTML document tree
+
+    Returns:
+        SpecDocument: A wrapper that returns a parser and holds meta data on the
+        specification
+    """
     doc_spec = Xpath.attr_first_req(doc, "./head/meta/@data-spec").lower()
     doc_rev = Xpath.attr_first_req(doc, "./head/meta/@data-revision").lower()
     return SpecDocument(tree=doc, key=doc_spec, rev=doc_rev)
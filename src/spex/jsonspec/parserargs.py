@@ -4,7 +4,10 @@
 from pathlib import Path
 from typing import List, Optional
 
+from spex.compression import COMPRESSIONS
+from spex.jsonspec.figcache import DEFAULT_MAX_BYTES
 from spex.jsonspec.lint import Code
+from spex.writer import OUTPUT_FORMATS
 
 
 class ParserArgs:
@@ -20,6 +23,16 @@ class ParserArgs:
     lint_codes_ignore: List[Code]
     validate_json: bool
     verbose: bool
+    stream_docx: bool
+    jobs: int
+    write_html: bool
+    compact_html: bool
+    output_format: str
+    compression: str
+    cache_dir: Optional[Path]
+    cache_size: int
+    incremental_from: Optional[Path]
+    record_fingerprints: bool
 
     def __init__(
         self,
@@ -29,6 +42,16 @@ class ParserArgs:
         skip_fig_on_error: bool = False,
         validate_json: bool = False,
         verbose: bool = False,
+        stream_docx: bool = False,
+        jobs: int = 1,
+        write_html: bool = True,
+        compact_html: bool = False,
+        output_format: str = "json",
+        compression: str = "none",
+        cache_dir: Optional[Path] = None,
+        cache_size: int = DEFAULT_MAX_BYTES,
+        incremental_from: Optional[Path] = None,
+        record_fingerprints: bool = False,
     ):
         if not isinstance(output_dir, Path):
             raise ValueError("output_dir is not a Path instance")
@@ -43,8 +66,53 @@ class ParserArgs:
         if not isinstance(skip_fig_on_error, bool):
             raise ValueError("skip_fig_on_err must be a boolean")
 
+        if not isinstance(stream_docx, bool):
+            raise ValueError("stream_docx must be a boolean")
+
+        if not isinstance(jobs, int) or jobs < 1:
+            raise ValueError("jobs must be a positive integer")
+
+        if not isinstance(write_html, bool):
+            raise ValueError("write_html must be a boolean")
+
+        if not isinstance(compact_html, bool):
+            raise ValueError("compact_html must be a boolean")
+
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {', '.join(OUTPUT_FORMATS)}"
+            )
+
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {', '.join(COMPRESSIONS)}")
+        elif compression != "none" and output_format == "binary":
+            raise ValueError("binary output cannot be compressed")
+
+        if cache_dir is not None and not isinstance(cache_dir, Path):
+            raise ValueError("cache_dir is not a Path instance")
+
+        if not isinstance(cache_size, int) or cache_size < 1:
+            raise ValueError("cache_size must be a positive integer")
+
+        if incremental_from is not None and not isinstance(incremental_from, Path):
+            raise ValueError("incremental_from is not a Path instance")
+
+        if not isinstance(record_fingerprints, bool):
+            raise ValueError("record_fingerprints must be a boolean")
+
         self.output_dir = output_dir
         self.lint_codes_ignore = lint_codes_ignore or []
         self.skip_fig_on_error = skip_fig_on_error
         self.validate_json = validate_json
         self.verbose = verbose
+        self.stream_docx = stream_docx
+        self.jobs = jobs
+        self.write_html = write_html
+        self.compact_html = compact_html
+        self.output_format = output_format
+        self.compression = compression
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+        self.incremental_from = incremental_from
+        # fingerprints are required to build on the resulting model incrementally
+        self.record_fingerprints = record_fingerprints or incremental_from is not None
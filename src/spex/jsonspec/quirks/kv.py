@@ -8,20 +8,20 @@ from spex.jsonspec.defs import Entity, StructField
 from spex.jsonspec.document import DocumentParser
 from spex.jsonspec.extractors.figure import RowErrPolicy
 from spex.jsonspec.extractors.structtable import BytesTableExtractor
-from spex.xml import Element, XmlUtils
+from spex.jsonspec.rowiter import Row
 
 
 class KvFig41(BytesTableExtractor):
     def row_err_handler(
         self,
-        row_it: Iterator[Element],
-        row: Element,
+        row_it: Iterator[Row],
+        row: Row,
         fields: List[StructField],
         err: Exception,
     ) -> Generator["Entity", None, RowErrPolicy]:
         # Figure has a row spanning all columns with a comment which we can ignore
         yield from ()
-        row_txt = XmlUtils.to_text(row)
+        row_txt = row.text
         if not row_txt.endswith("(refer to Figure 39)."):
             return RowErrPolicy.Raise
         return RowErrPolicy.Continue
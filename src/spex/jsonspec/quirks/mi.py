@@ -10,7 +10,8 @@ from spex.jsonspec.defs import Entity, EntityMeta, StructField
 from spex.jsonspec.document import DocumentParser
 from spex.jsonspec.extractors.figure import RowErrPolicy
 from spex.jsonspec.extractors.structtable import BitsTableExtractor
-from spex.xml import Element, XmlUtils
+from spex.jsonspec.rowiter import Row
+from spex.xml import Element
 
 
 class MiFig64(BitsTableExtractor):
@@ -23,20 +24,20 @@ class MiFig64(BitsTableExtractor):
 
     def row_err_handler(
         self,
-        row_it: Iterator[Element],
-        row: Element,
+        row_it: Iterator[Row],
+        row: Row,
         fields: List[StructField],
         err: Exception,
     ) -> Generator["Entity", None, RowErrPolicy]:
-        row_txt = XmlUtils.to_text(row).lstrip().lower()
+        row_txt = row.text.lstrip().lower()
         if not row_txt.startswith("figure 65"):
             return RowErrPolicy.Raise
 
         extra_fig = etree.Element("table")
-        for extra_fig_row in row.itersiblings():
+        for extra_fig_row in row.elem.itersiblings():
             extra_fig.append(extra_fig_row)
         entity_meta: EntityMeta = {"fig_id": "65"}
-        title = self.doc_parser._on_extract_figure_title(row)
+        title = self.doc_parser._on_extract_figure_title(row.elem)
         if isinstance(title, str):
             entity_meta["title"] = title
 
@@ -10,7 +10,8 @@ from spex.jsonspec.defs import Entity, EntityMeta, StructField
 from spex.jsonspec.document import DocumentParser
 from spex.jsonspec.extractors.figure import RowErrPolicy
 from spex.jsonspec.extractors.structtable import BitsTableExtractor, BytesTableExtractor
-from spex.xml import Element, XmlUtils
+from spex.jsonspec.rowiter import Row
+from spex.xml import Element
 
 
 class NvmFig23(BitsTableExtractor):
@@ -23,8 +24,8 @@ class NvmFig23(BitsTableExtractor):
 
     def row_err_handler(
         self,
-        row_it: Iterator[Element],
-        row: Element,
+        row_it: Iterator[Row],
+        row: Row,
         fields: List[StructField],
         err: Exception,
     ) -> Generator["Entity", None, RowErrPolicy]:
@@ -37,15 +38,15 @@ class NvmFig23(BitsTableExtractor):
         # From there, we construct a table and meta element, save both and override
         # the normal __call__ implementation to first process the (figure 23) struct
         # table as usual, then yield Figure 24.
-        row_txt = XmlUtils.to_text(row).lstrip().lower()
+        row_txt = row.text.lstrip().lower()
         if not row_txt.startswith("figure 24"):
             return RowErrPolicy.Raise
 
         f24_tbl = etree.Element("table")
-        for f24_row in row.itersiblings():
+        for f24_row in row.elem.itersiblings():
             f24_tbl.append(f24_row)
         entity_meta: EntityMeta = {"fig_id": "24"}
-        title = self.doc_parser._on_extract_figure_title(row)
+        title = self.doc_parser._on_extract_figure_title(row.elem)
         if isinstance(title, str):
             entity_meta["title"] = title
 
@@ -20,116 +20,189 @@ This is complicated by two facts:
   cells, summing their colspan value (1 if omitted), returning the element
   corresponding to the requested offset.
 """
-import copy
-from typing import Iterator, List, Optional, Tuple
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Iterator, List, Tuple
 
 from lxml import etree
 
+from spex.jsonspec.exceptions import XPathElementNotFoundException
 from spex.jsonspec.queries import contains_th
-from spex.xml import Element, Xpath
+from spex.xml import Element, XmlUtils, Xpath
 
-ALST = Tuple[int, Tuple[Element, int]]
+# (column offset, last row spanned, cell)
+AlstEntry = Tuple[int, int, Element]
+
+
+def _entry_offset(entry: AlstEntry) -> int:
+    return entry[0]
+
+
+@dataclass(frozen=True)
+class RowCell:
+    elem: Element
+    # logical column offset of the cell, the sum of the colspans of the
+    # cells before it
+    col: int
+    # True if the cell belongs to a row above, spanning into this row
+    carried: bool = False
+
+
+@dataclass(frozen=True)
+class Row:
+    """View of a table row, including the cells spanning into it from above.
+
+    Cells are referenced, not copied, `elem` is the row's element in the table.
+    """
+
+    elem: Element
+    cells: List[RowCell]
+    is_header: bool = False
+
+    @property
+    def text(self) -> str:
+        if not any(cell.carried for cell in self.cells):
+            return XmlUtils.to_text(self.elem)
+        # text of the cells, as if the row had been rebuilt from them
+        return XmlUtils.to_text(*(cell.elem for cell in self.cells))
+
+    def cell(self, ndx: int) -> Element:
+        """Return the `ndx`'th (0-indexed) cell of the row.
+
+        Raises:
+            XPathElementNotFoundException: if the row has fewer cells.
+        """
+        if 0 <= ndx < len(self.cells):
+            return self.cells[ndx].elem
+        query = f"./td[{ndx + 1}]"
+        raise XPathElementNotFoundException(
+            message="failed to find required element, with query"
+            f' "{query}" in\n {XmlUtils.fmt(self.elem)}',
+            query=query,
+        )
 
 
 def repr_elem(elem: Element) -> str:
     return etree.tostring(elem, encoding="unicode").strip()
 
 
-def alst_count_decr(alst: List[ALST]) -> List[ALST]:
-    res = [(ndx, (elem, count - 1)) for ndx, (elem, count) in alst if count > 1]
-    return res
-
+class ActiveList:
+    """Active list (alst) of cells spanning into subsequent rows.
+
+    Cells are kept ordered by their column offset, cells at the same offset in
+    order of insertion. Each cell is removed once the last row it spans is
+    processed, see `expire`.
+    """
+
+    def __init__(self) -> None:
+        # (offset, last row, cell), ordered by offset
+        self._entries: List[AlstEntry] = []
+        # (last row, insertion number, entry), a min-heap for `expire`
+        self._expiry: List[Tuple[int, int, AlstEntry]] = []
+        self._inserted = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, ndx: int) -> AlstEntry:
+        return self._entries[ndx]
+
+    def insert(self, offset: int, elem: Element, last_row: int) -> None:
+        """insert cell at column `offset`, spanning rows up to `last_row`."""
+        entry = (offset, last_row, elem)
+        insort(self._entries, entry, key=_entry_offset)
+        heappush(self._expiry, (last_row, self._inserted, entry))
+        self._inserted += 1
+
+    def expire(self, row: int) -> None:
+        """remove cells whose last row is `row` or earlier."""
+        expiry = self._expiry
+        entries = self._entries
+        while expiry and expiry[0][0] <= row:
+            entry = heappop(expiry)[2]
+            ndx = bisect_left(entries, entry[0], key=_entry_offset)
+            while entries[ndx] is not entry:
+                ndx += 1
+            del entries[ndx]
+
+    def __repr__(self) -> str:
+        return repr(
+            [
+                (off, (etree.tostring(elem, encoding="unicode").strip(), last_row))
+                for (off, last_row, elem) in self._entries
+            ]
+        )
 
-def alst_insert(alst: List[ALST], ndx: int, elem: Element, count: int) -> None:
-    entry = (ndx, (elem, count))
-    for iter_ndx, (e_ndx, _) in enumerate(alst):
-        if ndx < e_ndx:
-            alst.insert(iter_ndx, entry)
-            return
-    alst.append(entry)
 
+def sorted_row_children(
+    row: Element, alst: ActiveList
+) -> Iterator[Tuple[Element, bool]]:
+    """Yield cells of `row` and the cells of `alst` spanning into it, in order.
 
-def sorted_row_children(row: Element, alst: List[ALST]) -> Iterator[Element]:
-    elem_off: Optional[int]
+    Yields (cell, carried) tuples, `carried` is True for cells from `alst`."""
+    ndx = 0
+    end = len(alst)
     col_off = 0
-    rest = alst
-    (elem_off, (elem, _)), rest = rest[0], rest[1:]
     for td in Xpath.elems(row, "./td"):
-        while elem_off is not None and elem_off == col_off:
-            yield elem
+        while ndx < end and alst[ndx][0] == col_off:
+            elem = alst[ndx][2]
+            yield elem, True
             col_off += int(elem.get("colspan", 1))
-            if rest:
-                (elem_off, (elem, _)), rest = rest[0], rest[1:]
-            else:
-                elem_off = None
+            ndx += 1
 
-        yield td
+        yield td, False
         colspan = int(td.get("colspan", 1))
         col_off += colspan
-    if elem_off is not None and elem_off == col_off:
-        yield elem
-    if rest:
-        yield from (elem for (_, (elem, __)) in rest)
+    if ndx < end:
+        if alst[ndx][0] == col_off:
+            yield alst[ndx][2], True
+        yield from ((alst[i][2], True) for i in range(ndx + 1, end))
 
 
-def alst_repr(alst: List[ALST]) -> str:
-    return repr(
-        [
-            (ndx, (etree.tostring(elem, encoding="unicode").strip(), count))
-            for (ndx, (elem, count)) in alst
-        ]
-    )
+def _row_cells(cells: Iterator[Tuple[Element, bool]]) -> List[RowCell]:
+    res = []
+    col_off = 0
+    for elem, carried in cells:
+        res.append(RowCell(elem, col_off, carried))
+        col_off += int(elem.get("colspan", 1))
+    return res
 
 
-def row_iter(tbl: Element) -> Iterator[Element]:
+def row_iter(tbl: Element) -> Iterator[Row]:
     it = Xpath.elems(tbl, "./tr/td[1]/parent::tr | ./tr/th[1]/parent::tr")
     # it = Xpath.elems(tbl, "./tr/td[1]/parent::tr")
-    alst: List[ALST] = []
+    alst = ActiveList()
 
-    row_cnt = 1
+    # number of the row, not counting header rows
+    row_no = 0
     for row in it:
         if contains_th(row):
-            yield row
+            cells = _row_cells((c, False) for c in Xpath.elems(row, "./td|./th"))
+            yield Row(row, cells, is_header=True)
             continue
         if alst:
-            row_ = row
             # There's one or more cells to re-insert. Insert while respecting
-            # the colspan's of every cell.
-            row = etree.Element(row.tag)
-            for key, val in row_.attrib.items():
-                row.attrib[key] = val
-            for td in sorted_row_children(row_, alst):
-                # lxml elements can have _exactly_ one parent, this action
-                # would re-parent the element, causing it to disappear from the
-                # original XML tree.
-                row.append(copy.deepcopy(td))
+            # the colspan's of every cell. The cells are referenced, not copied,
+            # lxml elements can have _exactly_ one parent.
+            cells = _row_cells(sorted_row_children(row, alst))
+        else:
+            cells = _row_cells((td, False) for td in Xpath.elems(row, "./td"))
 
         # Find and store any cells with a rowspan attribute so that we can
         # re-insert these later.
-        column_offset = 0
-        for td in Xpath.elems(row, "./td"):
-            row_span = int(td.get("rowspan", 1))
+        for cell in cells:
+            # cells from rows above are already stored
+            if cell.carried:
+                continue
+            row_span = int(cell.elem.get("rowspan", 1))
             if row_span > 1:
-                elem = copy.copy(td)
-                # avoid repeatedly processing this elem in subsequent rows
-                del elem.attrib["rowspan"]
-                alst_insert(alst, column_offset, elem, row_span)
-            column_offset += int(td.get("colspan", 1))
+                alst.insert(cell.col, cell.elem, row_no + row_span - 1)
 
-        yield row
+        yield Row(row, cells)
 
-        alst = alst_count_decr(alst)
-        row_cnt += 1
-
-
-def get_cell_of(row: etree._Element, col: int) -> etree._Element:
-    col_off = 0
-    for td in Xpath.elems(row, "./td"):
-        if col_off == col:
-            return td
-        col_off += int(td.get("colspan", 1))
-    if col > col_off:
-        raise IndexError(
-            f"index out of range (requested {col} in row with columns [0;{col_off}])"
-        )
-    raise KeyError(f"requested {col}, no element starting at this index")
+        alst.expire(row_no)
+        row_no += 1
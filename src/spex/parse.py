@@ -9,16 +9,11 @@ from spex import __version__
 from spex.htmlspec.htmlrenderer import SpexHtmlRenderer
 from spex.jsonspec import parse
 from spex.jsonspec.defs import JSON
+from spex.jsonspec.incremental import FIGURES_META_KEY
 from spex.jsonspec.parserargs import ParserArgs
 from spex.log import ULog, logger
 from spex.progressbar import ParseProgressStatus
-from spex.writer import FileWriter, StdoutWriter, Writer
-
-
-def get_writer(src: Path, out_path: Optional[Path]) -> Writer:
-    if out_path:
-        return FileWriter(out_path, src)
-    return StdoutWriter(src)
+from spex.writer import get_writer
 
 
 def parse_spec(
@@ -27,9 +22,17 @@ def parse_spec(
     ignore_lint_codes: Set[str] = set(c.name for c in args.lint_codes_ignore)
 
     if spec.suffix == ".docx":
-        sp = SpexHtmlRenderer(docx_path=spec, out_dir=args.output_dir)
-        spec = sp.html_path
-        try:
+        with SpexHtmlRenderer(
+            docx_path=spec,
+            out_dir=args.output_dir,
+            streaming=args.stream_docx,
+            jobs=args.jobs,
+            write_files=args.write_html,
+            compact=args.compact_html,
+            compression=args.compression,
+            build_tree=True,
+        ) as sp:
+            spec = sp.html_path
             gen = sp.generate(yield_progress=yield_progress)
             if yield_progress:
                 num_figures = sp.num_figures
@@ -38,11 +41,13 @@ def parse_spec(
             else:
                 for _ in gen:
                     pass
-        finally:
-            del sp
-
-    with get_writer(spec, args.output_dir) as w:
+            # extract from the HTML tree directly, skipping a round-trip
+            # through the HTML document written to disk.
+            sdoc = parse.tree_to_spec_doc(sp.html_tree)
+    else:
         sdoc = parse.open_doc(spec)
+
+    with get_writer(spec, args.output_dir, args.output_format, args.compression) as w:
         w.write_meta("specification", sdoc.key)
         w.write_meta("revision", sdoc.rev)
         w.write_meta("format version", 1)  # TODO define elsewhere
@@ -77,4 +82,6 @@ def parse_spec(
                 f"{err_prefix}, {err_msg}",
             )
         w.write_meta("lint", reported_lint_errs)
+        if args.record_fingerprints:
+            w.write_meta(FIGURES_META_KEY, cast(JSON, dparser.fig_records))
         return w.path  # return path to output JSON
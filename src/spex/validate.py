@@ -8,10 +8,11 @@ from pathlib import Path
 
 from jsonschema import validate
 
+from spex.writer import read_model
+
 
 def validate_json(document_path: Path) -> None:
     schema = (
         resources.files("spex.resources").joinpath("stage2.schema.json").read_text()
     )
-    document = document_path.read_text()
-    validate(json.loads(document), json.loads(schema))
+    validate(read_model(document_path), json.loads(schema))
@@ -3,13 +3,32 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import json
-from io import TextIOWrapper
 from pathlib import Path
 from types import TracebackType
-from typing import Dict, List, Optional, Protocol, TypedDict
+from typing import (
+    IO,
+    BinaryIO,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypedDict,
+    cast,
+)
 
+from spex import binmodel, compression
 from spex.jsonspec.defs import JSON
 
+# output formats of the NVMe model, see `get_writer`
+OUTPUT_FORMATS = ("json", "jsonl", "binary")
+
+
+def _fname(src: Path) -> str:
+    """return file name of `src`, without its suffixes, for naming outputs."""
+    src = compression.strip_suffix(src)
+    return src.name[: -len(src.suffix)]
+
 
 class S2Model(TypedDict):
     meta: Dict[str, JSON]
@@ -69,21 +88,130 @@ class StdoutWriter(Writer):
 
 
 class FileWriter:
+    """write NVMe model to file, streaming entities to disk as they are written.
+
+    Entities are written out immediately, the meta block is held until the
+    writer is closed (lint entries are only known at the end) and is thus
+    written after the entities. The result is an ordinary `S2Model` document."""
+
+    def __init__(self, output: Path, src: Path, compress: str = compression.NONE):
+        self._output = output / f"{_fname(src)}.json{compression.suffix(compress)}"
+        self._src = src
+        self._dst: Optional[IO[str]] = compression.open_file(self._output, "w")
+        self._meta: Dict[str, JSON] = {}
+        self._num_entities = 0
+        self._dst.write('{\n  "entities": [')
+
+    def write_meta(self, key: str, val: JSON) -> None:
+        self._meta[key] = val
+
+    def write_entity(self, entity: JSON) -> None:
+        assert self._dst is not None, "writer is closed"
+        sep = ",\n    " if self._num_entities else "\n    "
+        # entities are nested two levels down, indent accordingly
+        txt = json.dumps(entity, indent=2, ensure_ascii=False)
+        self._dst.write(sep + txt.replace("\n", "\n    "))
+        self._num_entities += 1
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._output
+
+    def __enter__(self) -> "Writer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._dst is not None:
+            try:
+                meta = json.dumps(self._meta, indent=2, ensure_ascii=False)
+                self._dst.write("\n  ]," if self._num_entities else "],")
+                self._dst.write('\n  "meta": ' + meta.replace("\n", "\n  ") + "\n}")
+            finally:
+                self._dst.close()
+        self._dst = None
+        if exc_val is not None:
+            raise exc_val
+
+
+class JsonlWriter:
+    """write NVMe model to file as JSON lines.
+
+    Each entity is written on a line of its own, as it is passed to
+    `write_entity`. The meta block is written as the final line, wrapped
+    as `{"meta": {...}}`, once the writer is closed. See `read_jsonl`."""
+
+    def __init__(self, output: Path, src: Path, compress: str = compression.NONE):
+        self._output = output / f"{_fname(src)}.jsonl{compression.suffix(compress)}"
+        self._src = src
+        self._dst: Optional[IO[str]] = compression.open_file(self._output, "w")
+        self._meta: Dict[str, JSON] = {}
+
+    def write_meta(self, key: str, val: JSON) -> None:
+        self._meta[key] = val
+
+    def write_entity(self, entity: JSON) -> None:
+        assert self._dst is not None, "writer is closed"
+        self._dst.write(json.dumps(entity, ensure_ascii=False))
+        self._dst.write("\n")
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._output
+
+    def __enter__(self) -> "Writer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._dst is not None:
+            try:
+                self._dst.write(json.dumps({"meta": self._meta}, ensure_ascii=False))
+                self._dst.write("\n")
+            finally:
+                self._dst.close()
+        self._dst = None
+        if exc_val is not None:
+            raise exc_val
+
+
+class BinaryWriter:
+    """write NVMe model to file in the compact binary format of `spex.binmodel`.
+
+    Entities are written out as they are passed to `write_entity`, the meta
+    block and the entity index once the writer is closed. Read the model with
+    `binmodel.BinaryModelReader`."""
+
     def __init__(self, output: Path, src: Path):
-        fname = src.name[: -len(src.suffix)]
-        self._output = output / f"{fname}.json"
+        self._output = output / f"{_fname(src)}.s2b"
         self._src = src
-        self._dst: Optional[TextIOWrapper] = open(self._output, "w")
-        self._doc: S2Model = {
-            "meta": {},
-            "entities": [],
-        }
+        self._dst: Optional[BinaryIO] = open(self._output, "wb")
+        self._meta: Dict[str, JSON] = {}
+        self._index: List[binmodel.IndexEntry] = []
+        binmodel.write_header(self._dst)
+
+    def _write_record(self, val: JSON) -> Tuple[int, int]:
+        assert self._dst is not None, "writer is closed"
+        rec = binmodel.encode(val)
+        off = self._dst.tell()
+        self._dst.write(rec)
+        return off, len(rec)
 
     def write_meta(self, key: str, val: JSON) -> None:
-        self._doc["meta"][key] = val
+        self._meta[key] = val
 
     def write_entity(self, entity: JSON) -> None:
-        self._doc["entities"].append(entity)
+        fig_id = entity.get("fig_id") if isinstance(entity, dict) else None
+        off, ln = self._write_record(entity)
+        self._index.append((cast(Optional[str], fig_id), off, ln))
 
     @property
     def path(self) -> Optional[Path]:
@@ -100,9 +228,68 @@ class FileWriter:
     ) -> None:
         if self._dst is not None:
             try:
-                json.dump(self._doc, self._dst, indent=2, ensure_ascii=False)
+                meta = self._write_record(cast(JSON, self._meta))
+                binmodel.write_trailer(self._dst, meta, self._index)
             finally:
                 self._dst.close()
         self._dst = None
         if exc_val is not None:
             raise exc_val
+
+
+def read_binary(path: Path) -> S2Model:
+    """read NVMe model written by `BinaryWriter` into a regular model document."""
+    with binmodel.BinaryModelReader(path) as r:
+        return {"meta": r.meta, "entities": list(r.entities())}
+
+
+def read_jsonl(path: Path) -> S2Model:
+    """read NVMe model written by `JsonlWriter` into a regular model document."""
+    doc: S2Model = {"meta": {}, "entities": []}
+    with compression.open_file(path, "r") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            if isinstance(rec, dict) and rec.keys() == {"meta"}:
+                doc["meta"] = rec["meta"]
+            else:
+                doc["entities"].append(rec)
+    return doc
+
+
+def read_model(path: Path) -> S2Model:
+    """read NVMe model in any of the output formats, by file extension.
+
+    JSON and JSON lines models may be compressed, see `spex.compression`."""
+    sfx = compression.strip_suffix(path).suffix
+    if sfx == ".jsonl":
+        return read_jsonl(path)
+    elif sfx == ".s2b":
+        return read_binary(path)
+    with compression.open_file(path, "r") as fh:
+        return cast(S2Model, json.load(fh))
+
+
+def get_writer(
+    src: Path,
+    out_path: Optional[Path],
+    fmt: str = "json",
+    compress: str = compression.NONE,
+) -> Writer:
+    """return writer for the NVMe model of `src` in the given output format.
+
+    If no output path is given, the model is written to stdout. JSON and JSON
+    lines models are compressed using `compress`, see `spex.compression`,
+    binary models cannot be compressed as they are memory-mapped when read."""
+    if not out_path:
+        return StdoutWriter(src)
+    if fmt == "binary" and compress != compression.NONE:
+        raise ValueError("binary models cannot be compressed")
+    if fmt == "jsonl":
+        return JsonlWriter(out_path, src, compress)
+    elif fmt == "binary":
+        return BinaryWriter(out_path, src)
+    elif fmt == "json":
+        return FileWriter(out_path, src, compress)
+    raise ValueError(f"unknown output format {fmt!r}")
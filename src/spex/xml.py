@@ -2,7 +2,8 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from typing import List, Mapping, Optional, Union, cast
+from functools import lru_cache
+from typing import List, Mapping, NamedTuple, Optional, Tuple, Union, cast
 
 from lxml import etree
 from lxml.etree import _Element, _ElementTree
@@ -16,6 +17,38 @@ Element = _Element
 ElementTree = _ElementTree
 XmlElem = Union[_Element, _ElementTree]
 
+# upper bound on the number of distinct compiled queries retained.
+# Spex itself issues a few dozen distinct queries, but some (e.g. `./td[N]`)
+# are parameterized, so leave plenty of headroom.
+XPATH_CACHE_SIZE = 512
+
+NsKey = Tuple[Tuple[str, str], ...]
+
+# elements of the HTML model holding text directly, see `XmlUtils.to_text`
+_TEXT_TAGS = frozenset(("p", "li", "span"))
+
+
+def _is_layout(parent: Element, txt: str) -> bool:
+    """whether `txt`, a text or tail within `parent`, is layout whitespace."""
+    # text of paragraphs and list items written in compact form is not wrapped
+    # in spans, but never contains a raw line break, unlike the indentation of
+    # the indented form.
+    return txt.isspace() and (parent.tag not in _TEXT_TAGS or "\n" in txt)
+
+
+class XpathCacheInfo(NamedTuple):
+    """statistics of the compiled query cache, see `Xpath.cache_info`."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+@lru_cache(maxsize=XPATH_CACHE_SIZE)
+def _xpath_compile(query: str, ns: NsKey) -> etree.XPath:
+    return etree.XPath(query, namespaces=dict(ns))
+
 
 class XmlUtils:
     @staticmethod
@@ -35,24 +68,56 @@ class XmlUtils:
             fh.write(XmlUtils.fmt(elem))
 
     @staticmethod
-    def to_text(elem: XmlElem) -> str:
-        if isinstance(elem, _ElementTree):
-            elem = elem.getroot()
+    def to_text(*elems: XmlElem) -> str:
+        """return text of the HTML model elements `elems`, in order.
+
+        The whitespace laying out the HTML model is ignored, such that the text
+        is the same whether the model is written indented or in compact form.
+        Text of different paragraphs, cells and other block elements is
+        separated by a line break."""
+        parts: List[str] = []
+        for elem in elems:
+            if isinstance(elem, _ElementTree):
+                elem = elem.getroot()
+            for event, e in etree.iterwalk(elem, events=("start", "end")):
+                if event == "start":
+                    if e.tag != "span" and parts and parts[-1][-1] != "\n":
+                        parts.append("\n")
+                    txt = e.text
+                    if txt and not _is_layout(e, txt):
+                        parts.append(txt)
+                elif e is not elem:
+                    txt = e.tail
+                    if txt and not _is_layout(cast(Element, e.getparent()), txt):
+                        parts.append(txt)
+        return "".join(parts).strip()
 
-        def to_str(v: str | bytes) -> str:
-            if isinstance(v, bytes):
-                return v.decode("utf-8")
-            return v
 
-        return "".join(to_str(e) for e in elem.itertext()).strip()
+class Xpath:
+    @staticmethod
+    def _eval(e: Element, query: str) -> object:
+        """evaluate query against `e`, re-using a compiled query if possible.
 
+        Compiled queries are cached by (query, namespace map) - see
+        `Xpath.cache_info` for cache statistics."""
+        nsmap = cast(Mapping[str, str], e.nsmap)
+        return _xpath_compile(query, tuple(nsmap.items()))(e)
+
+    @staticmethod
+    def cache_info() -> XpathCacheInfo:
+        """return hit/miss statistics for the compiled query cache."""
+        return XpathCacheInfo(*_xpath_compile.cache_info())
+
+    @staticmethod
+    def cache_clear() -> None:
+        """drop all compiled queries and reset cache statistics."""
+        _xpath_compile.cache_clear()
 
-class Xpath:
     @classmethod
     def elems(cls, e: XmlElem, query: str) -> List[Element]:
         if isinstance(e, _ElementTree):
             e = e.getroot()
-        res = e.xpath(query, namespaces=cast(Mapping[str, str], e.nsmap))
+        res = cls._eval(e, query)
         assert isinstance(res, list)
         # cannot use type Element with isinstance
         if len(res) > 0 and not isinstance(res[0], (_Element, _ElementTree)):
@@ -90,7 +155,7 @@ class Xpath:
     def attrs_option(cls, e: XmlElem, query: str) -> List[Element]:
         if isinstance(e, _ElementTree):
             e = e.getroot()
-        res = e.xpath(query, namespaces=cast(Mapping[str, str], e.nsmap))
+        res = cls._eval(e, query)
         assert isinstance(res, list)
         # if len(res) > 0 and not isinstance(res[0], str):
         #     return None
@@ -100,7 +165,7 @@ class Xpath:
     def attrs(cls, e: XmlElem, query: str) -> List[str]:
         if isinstance(e, _ElementTree):
             e = e.getroot()
-        res = e.xpath(query, namespaces=cast(Mapping[str, str], e.nsmap))
+        res = cls._eval(e, query)
         assert isinstance(res, list)
         if len(res) > 0 and not isinstance(res[0], str):
             raise RuntimeError(
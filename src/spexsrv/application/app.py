@@ -6,6 +6,7 @@
 import hashlib
 import json
 import logging
+import os
 import shutil
 import tempfile
 from contextlib import contextmanager
@@ -18,13 +19,31 @@ from quart import Quart, abort, make_response, request, url_for
 from quart.wrappers.response import Response
 
 from spex import __version__
+from spex.htmlspec.figindex import index_path
 from spex.jsonspec.defs import JSON
 from spex.jsonspec.lint import Code
 from spex.jsonspec.parserargs import ParserArgs
-from spex.parse import parse_spec
+from spexsrv.application.parsepool import ParsePool
 from spexsrv.application.report_view import get_erroneous_figures
 
+
+def env_num_workers(name: str, default: int) -> int:
+    """read a number of workers, at least 1, from environment variable `name`."""
+    val = environ.get(name)
+    if val is None:
+        return default
+    try:
+        workers = int(val)
+    except ValueError:
+        raise RuntimeError(f"{name} must be a number of workers, got '{val}'") from None
+    if workers < 1:
+        raise RuntimeError(f"{name} must be at least 1, got {workers}")
+    return workers
+
+
 SPEX_CACHE = environ.get("SPEX_CACHE", "true").lower() in ("1", "y", "yes", "true")
+# number of specifications parsed concurrently
+SPEX_WORKERS = env_num_workers("SPEX_WORKERS", os.cpu_count() or 1)
 
 
 async def render_template(tpl: str, **ctx: str) -> str:
@@ -71,6 +90,7 @@ app = Quart("spexsrv")
 app.config["MAX_CONTENT_LENGTH"] = 50 * 1024 * 1024
 SPEX_CACHE_TMPDIR = "SPEX_CACHE_TMPDIR"
 SPEX_CACHE_LOOKUP = "SPEX_CACHE_LOOKUP"
+SPEX_PARSE_POOL = "SPEX_PARSE_POOL"
 
 logger = logging.getLogger("spexsrv.server")
 logger.setLevel(logging.DEBUG)
@@ -85,8 +105,14 @@ async def _app_init() -> None:
     print(f"Cache reports? {SPEX_CACHE}")
     if SPEX_CACHE:
         print("export SPEX_CACHE=n to disable (n, no, false or 0 is acceptable)")
+    print(f"Parsing up to {SPEX_WORKERS} specification(s) concurrently")
+    print("export SPEX_WORKERS=<n> to change")
     app.config.update(
-        {SPEX_CACHE_TMPDIR: tempfile.TemporaryDirectory(), SPEX_CACHE_LOOKUP: {}}
+        {
+            SPEX_CACHE_TMPDIR: tempfile.TemporaryDirectory(),
+            SPEX_CACHE_LOOKUP: {},
+            SPEX_PARSE_POOL: ParsePool(max_workers=SPEX_WORKERS),
+        }
     )
     assert app.template_folder is not None, "expected templates_folder to be set"
     assert app.static_folder is not None, "expected static_folder to be set"
@@ -100,6 +126,8 @@ async def _app_shutdown() -> None:
     app.config[SPEX_CACHE_TMPDIR].cleanup
     del app.config[SPEX_CACHE_TMPDIR]
     del app.config[SPEX_CACHE_LOOKUP]
+    app.config[SPEX_PARSE_POOL].shutdown()
+    del app.config[SPEX_PARSE_POOL]
 
 
 @app.route("/")
@@ -183,32 +211,42 @@ async def spec_parse() -> Response | Tuple[str, int, Dict[Any, Any]]:
     )
 
     async def sse_events() -> AsyncIterator[bytes]:
+        job = None
         try:
-            gen = parse_spec(destination, pargs, yield_progress=True)
-            try:
-                while True:
-                    phase, fig_ndx, num_figs = next(gen)
-                    yield json_to_sse(
-                        {
-                            "type": "progress-update",
-                            "phase": phase,
-                            "fig_ndx": fig_ndx,
-                            "num_figs": num_figs,
-                        }
-                    )
-            except StopIteration as e:
-                json_fpath = e.value
-                html_path = Path(json_fpath.with_suffix(".html"))
-
-                cache_entry = Path(app.config[SPEX_CACHE_TMPDIR].name) / json_fpath.name
-                shutil.copy(json_fpath, cache_entry)
+            # parse in a worker process, keeping the event loop responsive
+            job = app.config[SPEX_PARSE_POOL].submit(destination, pargs)
+            async for phase, fig_ndx, num_figs in job.progress():
+                yield json_to_sse(
+                    {
+                        "type": "progress-update",
+                        "phase": phase,
+                        "fig_ndx": fig_ndx,
+                        "num_figs": num_figs,
+                    }
+                )
+            json_fpath = await job.result()
+            html_path = Path(json_fpath.with_suffix(".html"))
+
+            cache_entry = Path(app.config[SPEX_CACHE_TMPDIR].name) / json_fpath.name
+            shutil.copy(json_fpath, cache_entry)
+            # preserve the modification time, checked by the figure index
+            shutil.copy2(
+                html_path, Path(app.config[SPEX_CACHE_TMPDIR].name) / html_path.name
+            )
+            idx_path = index_path(html_path)
+            if idx_path.exists():
                 shutil.copy(
-                    html_path, Path(app.config[SPEX_CACHE_TMPDIR].name) / html_path.name
+                    idx_path, Path(app.config[SPEX_CACHE_TMPDIR].name) / idx_path.name
                 )
-                app.config[SPEX_CACHE_LOOKUP][hash] = cache_entry
-                yield json_to_sse({"type": "report-completed", "url": report_url})
+            app.config[SPEX_CACHE_LOOKUP][hash] = cache_entry
+            yield json_to_sse({"type": "report-completed", "url": report_url})
         finally:
-            temp_dir.cleanup()
+            if job is None or job.done() or job.cancel():
+                temp_dir.cleanup()
+            else:
+                # client disconnected mid-parse, the worker still writes to the
+                # temporary directory
+                job.add_done_callback(temp_dir.cleanup)
 
     # skip parsing..
     # then generate, then return big ass report doc
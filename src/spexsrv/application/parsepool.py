@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Parse specifications in a pool of worker processes.
+
+`parse_spec` is CPU-bound, driving it from a request handler would block the
+event loop, and with it every other request, for the duration of the parse.
+`ParsePool` instead runs it in a bounded pool of worker processes. Workers
+report progress through a queue, which `ParseJob.progress` relays to the event
+loop without blocking it. Waiting on these queues blocks a thread, the pool
+keeps threads of its own for this, rather than tying up the default executor
+of the event loop, which the server relies on for file I/O.
+
+A worker which dies abruptly, e.g. killed for running out of memory, breaks
+the entire `ProcessPoolExecutor`. The pool is then replaced, failing only the
+jobs submitted to the broken pool.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from queue import Empty, Queue
+from typing import AsyncIterator, Callable, List, Optional
+
+from spex.jsonspec.parserargs import ParserArgs
+from spex.parse import parse_spec
+from spex.progressbar import ParseProgressStatus
+
+# seconds to wait for progress before checking whether the worker has exited
+# without signalling completion, e.g. because it was killed.
+POLL_INTERVAL_S = 0.5
+
+ProgressQueue = Queue[Optional[ParseProgressStatus]]
+
+
+def _parse(spec: Path, args: ParserArgs, progress: ProgressQueue) -> Optional[Path]:
+    """parse `spec` in a worker process, return path of the NVMe model.
+
+    Progress is put on `progress`, followed by None once done."""
+    try:
+        gen = parse_spec(spec, args, yield_progress=True)
+        while True:
+            try:
+                status = next(gen)
+            except StopIteration as e:
+                return e.value
+            progress.put(status)
+    finally:
+        progress.put(None)
+
+
+class ParseJob:
+    """specification being parsed by a `ParsePool` worker."""
+
+    def __init__(
+        self,
+        fut: "Future[Optional[Path]]",
+        progress: ProgressQueue,
+        on_broken: Callable[[], None],
+        poll_executor: ThreadPoolExecutor,
+    ) -> None:
+        self._fut = fut
+        self._progress = progress
+        self._on_broken = on_broken
+        self._poll_executor = poll_executor
+
+    async def progress(self) -> AsyncIterator[ParseProgressStatus]:
+        """yield progress updates as they are reported, until parsing is done."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._fut.running() and not self._fut.done():
+                # waiting for a worker, nothing to report yet. Jobs only occupy
+                # a polling thread while being parsed.
+                await asyncio.sleep(POLL_INTERVAL_S)
+                continue
+            updates = await loop.run_in_executor(self._poll_executor, self._get_updates)
+            if not updates and self._fut.done():
+                return
+            for status in updates:
+                if status is None:
+                    return
+                yield status
+
+    def _get_updates(self) -> List[Optional[ParseProgressStatus]]:
+        """wait for progress updates, return all those reported since the last call.
+
+        Returns an empty list if none were reported within `POLL_INTERVAL_S`."""
+        updates: List[Optional[ParseProgressStatus]] = []
+        try:
+            updates.append(self._progress.get(timeout=POLL_INTERVAL_S))
+            while True:
+                updates.append(self._progress.get_nowait())
+        except Empty:
+            pass
+        return updates
+
+    async def result(self) -> Optional[Path]:
+        """wait for parsing to finish, return path of the NVMe model.
+
+        Raises any exception raised while parsing the specification, or
+        `BrokenProcessPool` if the worker parsing it died."""
+        try:
+            return await asyncio.wrap_future(self._fut)
+        except BrokenProcessPool:
+            self._on_broken()
+            raise
+
+    def done(self) -> bool:
+        return self._fut.done()
+
+    def cancel(self) -> bool:
+        """cancel the job if it has not started, return True if cancelled."""
+        return self._fut.cancel()
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        """call `fn` once the job is done, immediately if it is already done.
+
+        `fn` may be called from another thread."""
+        self._fut.add_done_callback(lambda _: fn())
+
+
+class ParsePool:
+    """bounded pool of worker processes parsing specifications.
+
+    At most `max_workers` specifications are parsed at a time, jobs submitted
+    beyond that wait for a worker to become available."""
+
+    def __init__(self, max_workers: int):
+        # start workers from a clean interpreter rather than forking the server
+        self._ctx = multiprocessing.get_context("spawn")
+        self._max_workers = max_workers
+        self._manager = self._ctx.Manager()
+        self._pool = self._new_pool()
+        # polls the progress queues of running jobs, see `ParseJob.progress`.
+        # `ProcessPoolExecutor` marks one job more than it has workers running.
+        self._poll_executor = ThreadPoolExecutor(
+            max_workers=max_workers + 1, thread_name_prefix="spex-progress"
+        )
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self._max_workers, mp_context=self._ctx)
+
+    def _replace(self, broken: ProcessPoolExecutor) -> None:
+        """replace `broken` pool, unless already replaced."""
+        if self._pool is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._new_pool()
+
+    def submit(self, spec: Path, args: ParserArgs) -> ParseJob:
+        """start parsing `spec`, must be called from the event loop."""
+        progress: ProgressQueue = self._manager.Queue()
+        pool = self._pool
+        try:
+            fut = pool.submit(_parse, spec, args, progress)
+        except BrokenProcessPool:
+            self._replace(pool)
+            pool = self._pool
+            fut = pool.submit(_parse, spec, args, progress)
+        return ParseJob(
+            fut, progress, partial(self._replace, pool), self._poll_executor
+        )
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+        self._poll_executor.shutdown(cancel_futures=True)
+        self._manager.shutdown()
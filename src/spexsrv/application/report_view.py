@@ -8,11 +8,33 @@ from typing import Dict, List
 import lxml
 import lxml.etree
 
+from spex.compression import open_file
+from spex.htmlspec.figindex import FigureIndex
 from spex.xml import XmlUtils, Xpath, etree
 
 
 def get_erroneous_figures(figures: List[str], html_doc: Path) -> Dict[str, str]:
-    doc = etree.parse(html_doc)
+    try:
+        index = FigureIndex.load(html_doc)
+    except (FileNotFoundError, ValueError):
+        # no (valid) figure index, search the entire document
+        return _find_erroneous_figures(figures, html_doc)
+
+    _err_figures: Dict[str, str] = {}
+    try:
+        for figure in figures:
+            figure_id = figure.split("_")[0]
+            if figure_id in index:
+                _err_figures[figure] = XmlUtils.fmt(index.figure(figure_id))
+    except etree.XMLSyntaxError:
+        # index does not locate the figures of this document after all
+        return _find_erroneous_figures(figures, html_doc)
+    return _err_figures
+
+
+def _find_erroneous_figures(figures: List[str], html_doc: Path) -> Dict[str, str]:
+    with open_file(html_doc, "rb") as fh:
+        doc = etree.parse(fh)
     _err_figures: Dict[str, str] = {}
     for figure in figures:
         figure_id = figure.split("_")[0]
@@ -20,7 +42,7 @@ def get_erroneous_figures(figures: List[str], html_doc: Path) -> Dict[str, str]:
             p = Xpath.elem_first(doc, f"./body/table[@id={figure_id}]")
             if p is not None:
                 _err_figures[figure] = XmlUtils.fmt(p)
-        except lxml.etree.XPathEvalError:
+        except lxml.etree.XPathError:
             ...
 
     return _err_figures
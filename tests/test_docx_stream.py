@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from spex.htmlspec.docx import Document
+from spex.htmlspec.parser import SpexParser, Table
+
+from .utility import docx_p, docx_run, docx_tbl, write_docx
+
+
+def parse(path, streaming):
+    doc = Document(path, streaming=streaming)
+    try:
+        tables = list(SpexParser(doc).parse())
+        top_level = len(list(doc.iter_top_level_tables()))
+        return tables, top_level, doc.num_tables
+    finally:
+        doc.close()
+
+
+def test_streaming_matches_in_memory(tmp_path):
+    nested = docx_tbl(
+        [docx_p(docx_run("Value")), docx_p(docx_run("Definition"))],
+        [docx_p(docx_run("00b")), docx_p(docx_run("zero"))],
+    )
+    body = "".join(
+        [
+            docx_p(docx_run("before")),
+            docx_tbl(
+                [docx_p(docx_run("Figure 1: First", "<w:b/>"))],
+                [docx_p(docx_run("a")) + nested + docx_p(docx_run("b"))],
+            ),
+            docx_p(docx_run("between")),
+            docx_tbl(
+                [docx_p(docx_run("Figure 2: Second"))],
+                [docx_p(docx_run("c"))],
+            ),
+            docx_p(docx_run("after")),
+        ]
+    )
+    path = write_docx(tmp_path / "spec.docx", body)
+
+    tables, top_level, num_tables = parse(path, streaming=False)
+    s_tables, s_top_level, s_num_tables = parse(path, streaming=True)
+
+    assert len(tables) == top_level == 2
+    assert num_tables == 3
+    assert s_tables == tables
+    assert (s_top_level, s_num_tables) == (top_level, num_tables)
+    # the nested table is part of its enclosing table's cell
+    assert any(
+        isinstance(e, Table)
+        for row in tables[0].rows
+        for cell in row
+        for e in cell.elems
+    )
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+from pathlib import Path
+
+from spex.jsonspec.defs import Entity
+from spex.jsonspec.figcache import FigureCache
+from spex.jsonspec.lint import LintEntry, LintErr
+from spex.jsonspec.parallel import FigureResult
+from spex.jsonspec.parse import open_doc
+from spex.jsonspec.parserargs import ParserArgs
+
+SPEC = Path(
+    "example/stage1/"
+    "NVM Express NVM Command Set Specification 1.0c 2022.10.03 Ratified.html"
+)
+
+
+def parse(tmp_path: Path, jobs: int = 1):
+    args = ParserArgs(
+        output_dir=tmp_path,
+        skip_fig_on_error=True,
+        jobs=jobs,
+        cache_dir=tmp_path / "cache",
+    )
+    parser = open_doc(SPEC).get_parser(args)
+    entities = list(parser.parse())
+    return entities, [entry.to_json() for entry in parser.linter.lint_entries()]
+
+
+def test_cached_extraction_matches_uncached(tmp_path: Path):
+    args = ParserArgs(output_dir=tmp_path, skip_fig_on_error=True)
+    parser = open_doc(SPEC).get_parser(args)
+    expected = (
+        list(parser.parse()),
+        [entry.to_json() for entry in parser.linter.lint_entries()],
+    )
+
+    assert parse(tmp_path) == expected
+    assert any((tmp_path / "cache").iterdir())
+    # served from cache, in serial and parallel mode
+    assert parse(tmp_path) == expected
+    assert parse(tmp_path, jobs=2) == expected
+
+
+def test_cache_roundtrip(tmp_path: Path):
+    cache = FigureCache(tmp_path)
+    res = FigureResult(
+        entities=[
+            {"type": "struct", "fig_id": "1", "title": "Figure 1: x", "fields": []}
+        ],
+        lint_entries=[LintEntry(err=LintErr.LBL_EMPTY, fig="1", row="0")],
+    )
+    assert cache.get("ab12") is None
+    cache.put("ab12", res)
+    assert cache.get("ab12") == res
+
+
+def test_cache_skips_failed_figures(tmp_path: Path):
+    cache = FigureCache(tmp_path)
+    cache.put("ab12", FigureResult(entities=[], lint_entries=[], error="boom"))
+    assert cache.get("ab12") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    entity: Entity = {"type": "struct", "fig_id": "1", "title": "x" * 60, "fields": []}
+    res = FigureResult(entities=[entity], lint_entries=[])
+    cache = FigureCache(tmp_path, max_bytes=500)
+    for ndx, key in enumerate(("aa", "bb", "cc")):
+        cache.put(key, res)
+        os.utime(tmp_path / key[:2] / f"{key}.json", (ndx, ndx))
+    # "aa" is the oldest entry, using it makes "bb" the least recently used
+    assert cache.get("aa") is not None
+    cache.put("dd", res)
+
+    assert cache.get("bb") is None
+    assert cache.get("aa") is not None
+    assert cache.get("dd") is not None
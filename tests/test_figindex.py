@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import os
+
+import pytest
+from gcgen.api import Section
+
+from spex.compression import open_file
+from spex.htmlspec.figindex import FigureIndex, index_path, write_index
+from spex.htmlspec.sectionwriter import SectionWriter
+from spex.xml import etree
+from spexsrv.application.report_view import get_erroneous_figures
+
+
+def write_doc(path):
+    tables = {}
+    with SectionWriter(path) as w:
+        w.write(Section().emitln("<html>").emitln("<body>"))
+        w.indent()
+        for tbl_id, txt in (("1", "a"), ("2", "b€"), ("1", "dup")):
+            s = Section()
+            s.emitln(f"<table id='{tbl_id}'>").indent()
+            s.emitln(f"<tr><td>{txt}</td></tr>")
+            s.dedent().emitln("</table>")
+            tables.setdefault(tbl_id, w.write(s))
+        w.dedent()
+        w.write(Section().emitln("</body>").emitln("</html>"))
+    return write_index(path, tables)
+
+
+@pytest.mark.parametrize("fname", ["spec.html", "spec.html.gz"])
+def test_figure_lookup(tmp_path, fname):
+    html_path = tmp_path / fname
+    assert write_doc(html_path) == index_path(html_path) == tmp_path / "spec.html.idx"
+
+    index = FigureIndex.load(html_path)
+    assert index.fig_ids == ["1", "2"]
+    assert "3" not in index
+    assert index.read("2").decode("utf-8").startswith("<table id='2'>")
+    assert index.read("2").endswith(b"</table>")
+    assert index.figure("1").findtext("tr/td") == "a"
+    assert index.figure("2").findtext("tr/td") == "b€"
+    with pytest.raises(KeyError):
+        index.figure("3")
+
+    with open_file(html_path, "rb") as fh:
+        tbl = etree.parse(fh).find("body/table[@id='2']")
+    tbl.tail = None
+    assert etree.tostring(index.figure("2")) == etree.tostring(tbl)
+
+
+def test_stale_index_rejected(tmp_path):
+    html_path = tmp_path / "spec.html"
+    write_doc(html_path)
+    html_path.write_text(html_path.read_text() + "\n")
+
+    with pytest.raises(ValueError):
+        FigureIndex.load(html_path)
+    with pytest.raises(FileNotFoundError):
+        FigureIndex.load(tmp_path / "other.html")
+
+
+def test_replaced_html_of_same_size_rejected(tmp_path):
+    html_path = tmp_path / "spec.html"
+    write_doc(html_path)
+    FigureIndex.load(html_path)
+    html_path.write_text(html_path.read_text().replace("b€", "c€"))
+    st = html_path.stat()
+    os.utime(html_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    with pytest.raises(ValueError):
+        FigureIndex.load(html_path)
+
+
+def test_erroneous_figures_fall_back_on_bad_offsets(tmp_path):
+    html_path = tmp_path / "spec.html"
+    idx_path = write_doc(html_path)
+    assert "b€" in get_erroneous_figures(["2_1"], html_path)["2_1"]
+
+    # index matching the HTML model, but with wrong offsets
+    data = json.loads(idx_path.read_text())
+    data["tables"]["2"][0] -= 5
+    idx_path.write_text(json.dumps(data))
+
+    assert "b€" in get_erroneous_figures(["2_1"], html_path)["2_1"]
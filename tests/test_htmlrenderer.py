@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from spex.compression import open_file
+from spex.htmlspec.htmlrenderer import SpexHtmlRenderer
+from spex.jsonspec.parse import tree_to_spec_doc
+from spex.jsonspec.parserargs import ParserArgs
+from spex.xml import etree
+
+from .utility import docx_p, docx_run, docx_tbl, write_docx
+
+# renders a .docx specification, printing by how many KiB peak RSS grew
+RENDER_RSS_GROWTH = """
+import resource, sys, tempfile
+from pathlib import Path
+from spex.htmlspec.htmlrenderer import SpexHtmlRenderer
+
+with tempfile.TemporaryDirectory() as d:
+    with SpexHtmlRenderer(Path(sys.argv[1]), Path(d), streaming=True) as r:
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        for _ in r.generate():
+            pass
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+"""
+
+
+def write_spec(path, num_tables, num_rows=1):
+    row = [docx_p(docx_run("31:00")), docx_p(docx_run("Field: description"))]
+    body = "".join(
+        docx_tbl([docx_p(docx_run(f"Figure {n}: Table {n}"))], *([row] * num_rows))
+        for n in range(1, num_tables + 1)
+    )
+    return write_docx(path, body)
+
+
+def test_html_tree_matches_written_html(tmp_path):
+    spec = write_spec(tmp_path / "spec.docx", 3)
+    with SpexHtmlRenderer(spec, tmp_path, build_tree=True) as r:
+        gen = r.generate(yield_progress=True)
+        next(gen)
+        with pytest.raises(RuntimeError):
+            # incomplete
+            r.html_tree
+        for _ in gen:
+            pass
+        tree = r.html_tree
+
+    with open_file(r.html_path, "rb") as fh:
+        written = etree.parse(fh)
+    assert etree.tostring(tree.find("body")) == etree.tostring(written.find("body"))
+
+
+def test_html_tree_not_built_by_default(tmp_path):
+    spec = write_spec(tmp_path / "spec.docx", 3)
+    with SpexHtmlRenderer(spec, tmp_path, streaming=True) as r:
+        for _ in r.generate():
+            pass
+        with pytest.raises(RuntimeError):
+            r.html_tree
+
+    assert r.html_path.exists()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="ru_maxrss is in KiB on Linux")
+def test_rendering_memory_independent_of_table_count(tmp_path):
+    def rss_growth_kib(num_tables):
+        spec = write_spec(tmp_path / f"spec{num_tables}.docx", num_tables, 20)
+        res = subprocess.run(
+            [sys.executable, "-c", RENDER_RSS_GROWTH, str(spec)],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return int(res.stdout)
+
+    # holding the HTML tree of the additional 900 tables takes some 35 MiB
+    assert rss_growth_kib(1000) - rss_growth_kib(100) < 8 * 1024
+
+
+def test_compact_html_extracts_as_indented(tmp_path):
+    # grey shading marks header cells
+    th = '<w:tcPr><w:shd w:fill="D9D9D9"/></w:tcPr>'
+    spec = write_docx(
+        tmp_path / "spec.docx",
+        docx_tbl(
+            [docx_p(docx_run("Figure 1: Some Register"))],
+            [th + docx_p(docx_run("Bits")), th + docx_p(docx_run("Description"))],
+            [
+                docx_p(docx_run("31:16")),
+                docx_p(docx_run("Field One (FO): first")) + docx_p(docx_run("more")),
+            ],
+            [docx_p(docx_run("15:00")), docx_p(docx_run("Field Two (FT): second"))],
+        ),
+    )
+
+    def extract(compact):
+        out_dir = tmp_path / ("compact" if compact else "indented")
+        out_dir.mkdir()
+        with SpexHtmlRenderer(spec, out_dir, compact=compact) as r:
+            for _ in r.generate():
+                pass
+        with open_file(r.html_path, "rb") as fh:
+            doc = etree.parse(fh)
+        body = etree.tostring(doc.find("body"))
+        sdoc = tree_to_spec_doc(doc)
+        # the document is not rewritten before extraction
+        assert etree.tostring(sdoc.tree.find("body")) == body
+        return list(sdoc.get_parser(ParserArgs(output_dir=out_dir)).parse())
+
+    entities = extract(compact=False)
+    assert [f["label"] for f in entities[0]["fields"]] == ["ft", "fo"]
+    assert extract(compact=True) == entities
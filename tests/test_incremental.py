@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+from pathlib import Path
+from typing import cast
+
+from spex.jsonspec.defs import JSON
+from spex.jsonspec.document import DocumentParser
+from spex.jsonspec.incremental import (
+    FIGURES_META_KEY,
+    FigureRecord,
+    PreviousModel,
+    figure_record,
+)
+from spex.jsonspec.lint import Code, LintEntry, LintErr
+from spex.jsonspec.parallel import FigureResult
+from spex.jsonspec.parserargs import ParserArgs
+from spex.parse import parse_spec
+from spex.writer import S2Model
+
+SPEC = Path(
+    "example/stage1/"
+    "NVM Express NVM Command Set Specification 1.0c 2022.10.03 Ratified.html"
+)
+
+
+def run(spec: Path, out_dir: Path, **kwargs) -> dict:
+    out_dir.mkdir()
+    args = ParserArgs(output_dir=out_dir, skip_fig_on_error=True, **kwargs)
+    gen = parse_spec(spec, args)
+    try:
+        while True:
+            next(gen)
+    except StopIteration as e:
+        return json.loads(e.value.read_text())
+
+
+def test_incremental_reuses_unchanged_figures(tmp_path: Path, monkeypatch):
+    old = run(SPEC, tmp_path / "old", record_fingerprints=True)
+    assert len(old["meta"]["figures"]) > 0
+
+    # new revision, changing the title of figure 9 only
+    new_spec = tmp_path / SPEC.name
+    new_spec.write_text(
+        SPEC.read_text().replace(
+            "Protection Information Field Definition", "Protection Information"
+        )
+    )
+    expected = run(new_spec, tmp_path / "full", record_fingerprints=True)
+
+    parsed = []
+    on_parse_fig = DocumentParser._on_parse_fig
+
+    def spy(self, entity, tbl):
+        if "parent_fig_id" not in entity:
+            parsed.append(entity["fig_id"])
+        return on_parse_fig(self, entity, tbl)
+
+    monkeypatch.setattr(DocumentParser, "_on_parse_fig", spy)
+    old_json = tmp_path / "old" / f"{SPEC.stem}.json"
+    incr = run(new_spec, tmp_path / "incr", incremental_from=old_json)
+
+    assert parsed == ["9"]
+    assert incr == expected
+    assert incr["entities"][0]["title"] == "Figure 9: Protection Information"
+
+
+def test_incremental_keeps_ignored_lint_entries(tmp_path: Path):
+    expected = run(SPEC, tmp_path / "full", record_fingerprints=True)
+    assert len(expected["meta"]["lint"]) > 0
+
+    # lint entries of the previous model's meta block are filtered by
+    # `lint_codes_ignore`, those of its figure records are not.
+    run(SPEC, tmp_path / "old", record_fingerprints=True, lint_codes_ignore=list(Code))
+    old_json = tmp_path / "old" / f"{SPEC.stem}.json"
+    incr = run(SPEC, tmp_path / "incr", incremental_from=old_json)
+
+    assert incr["meta"]["lint"] == expected["meta"]["lint"]
+
+
+def test_previous_model_skips_failed_figures():
+    def record(fig_id: str, failed: bool) -> FigureRecord:
+        lint = [LintEntry(LintErr.TBL_PARSE_ERR, fig_id)] if failed else []
+        res = FigureResult(entities=[], lint_entries=lint)
+        return figure_record(fig_id, f"key{fig_id}", res)
+
+    model: S2Model = {
+        "meta": {
+            # parse error ignored by `lint_codes_ignore`
+            "lint": [],
+            FIGURES_META_KEY: cast(JSON, [record("1", False), record("2", True)]),
+        },
+        "entities": [],
+    }
+    prev = PreviousModel(model)
+
+    assert prev.figure("1", "key1") == FigureResult(entities=[], lint_entries=[])
+    assert prev.figure("1", "key2") is None
+    assert prev.figure("2", "key2") is None
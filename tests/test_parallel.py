@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from pathlib import Path
+from typing import List
+
+from spex.htmlspec.docx import Document
+from spex.htmlspec.parallel import CHUNKSIZE, MAX_PENDING_CHUNKS, render_tables
+from spex.htmlspec.parser import SpexParser, Table
+from spex.htmlspec.tablerenderer import TableRenderer
+from spex.jsonspec.parse import open_doc
+from spex.jsonspec.parserargs import ParserArgs
+
+from .utility import docx_p, docx_run, docx_tbl, write_docx
+
+SPEC = Path(
+    "example/stage1/"
+    "NVM Express NVM Command Set Specification 1.0c 2022.10.03 Ratified.html"
+)
+
+
+def parse(tmp_path: Path, jobs: int):
+    args = ParserArgs(output_dir=tmp_path, skip_fig_on_error=True, jobs=jobs)
+    # quirks parser for this spec overrides figure extractors
+    parser = open_doc(SPEC).get_parser(args)
+    entities = list(parser.parse())
+    return entities, [entry.to_json() for entry in parser.linter.lint_entries()]
+
+
+def test_parallel_extraction_matches_serial(tmp_path: Path):
+    entities, lint = parse(tmp_path, jobs=1)
+    p_entities, p_lint = parse(tmp_path, jobs=2)
+
+    assert len(entities) > 0 and len(lint) > 0
+    assert p_entities == entities
+    assert p_lint == lint
+
+
+def test_parallel_rendering_bounds_tables_in_flight(tmp_path: Path):
+    body = "".join(
+        docx_tbl([docx_p(docx_run(f"Figure {n}: Table {n}"))], [docx_p(docx_run("x"))])
+        for n in range(1, 61)
+    )
+    doc = Document(write_docx(tmp_path / "spec.docx", body), streaming=True)
+    serial = [
+        TableRenderer.render_fragment(tbl).table for tbl in SpexParser(doc).parse()
+    ]
+
+    read = 0
+    iter_tables = doc.iter_top_level_tables
+
+    def counting_iter():
+        nonlocal read
+        for tbl in iter_tables():
+            read += 1
+            yield tbl
+
+    doc.iter_top_level_tables = counting_iter  # type: ignore
+    bound = 2 * MAX_PENDING_CHUNKS * CHUNKSIZE + CHUNKSIZE
+    tables: List[Table] = []
+    for frag in render_tables(doc, jobs=2):
+        assert read - len(tables) <= bound
+        tables.append(frag.table)
+    doc.close()
+
+    assert read == 60
+    assert tables == serial
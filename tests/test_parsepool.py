@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from spex.jsonspec.parserargs import ParserArgs
+from spexsrv.application.app import env_num_workers
+from spexsrv.application.parsepool import ParsePool
+
+from .utility import docx_p, docx_run, docx_tbl, write_docx
+
+
+class ExitOnUnpickle:
+    """kills the worker process unpickling it."""
+
+    def __reduce__(self):
+        return (os._exit, (1,))
+
+
+class NoDefaultExecutor(ThreadPoolExecutor):
+    """default executor of the event loop, which the server needs for file I/O."""
+
+    def submit(self, *args, **kwargs):
+        raise AssertionError("default executor used")
+
+
+def write_spec(path: Path) -> Path:
+    body = docx_tbl(
+        [docx_p(docx_run("Figure 1: Identify"))],
+        [docx_p(docx_run("Bits")), docx_p(docx_run("Description"))],
+        [docx_p(docx_run("31:00")), docx_p(docx_run("NSID: Namespace ID"))],
+    )
+    return write_docx(path, body)
+
+
+def test_parse_pool(tmp_path):
+    spec = write_spec(tmp_path / "spec.docx")
+    args = ParserArgs(output_dir=tmp_path, skip_fig_on_error=True)
+
+    async def run():
+        asyncio.get_running_loop().set_default_executor(NoDefaultExecutor())
+        pool = ParsePool(max_workers=1)
+        try:
+            job = pool.submit(spec, args)
+            updates = [status async for status in job.progress()]
+            return updates, await job.result()
+        finally:
+            pool.shutdown()
+
+    updates, result = asyncio.run(run())
+
+    assert result == tmp_path / "spec.json"
+    assert result.exists()
+    assert updates == [("html", 0, 1), ("json", 0, 1)]
+
+
+def test_parse_pool_recovers_from_dead_worker(tmp_path):
+    spec = write_spec(tmp_path / "spec.docx")
+    args = ParserArgs(output_dir=tmp_path, skip_fig_on_error=True)
+
+    async def run():
+        pool = ParsePool(max_workers=1)
+        try:
+            job = pool.submit(cast(Path, ExitOnUnpickle()), args)
+            with pytest.raises(BrokenProcessPool):
+                await job.result()
+            return await pool.submit(spec, args).result()
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(run()) == tmp_path / "spec.json"
+
+
+def test_parse_pool_queued_job_progress(tmp_path):
+    spec = write_spec(tmp_path / "spec.docx")
+    args = ParserArgs(output_dir=tmp_path, skip_fig_on_error=True)
+
+    async def run():
+        asyncio.get_running_loop().set_default_executor(NoDefaultExecutor())
+        pool = ParsePool(max_workers=1)
+        try:
+            jobs = [pool.submit(spec, args) for _ in range(3)]
+
+            async def updates(job):
+                return [status async for status in job.progress()]
+
+            # more jobs than workers relay progress concurrently
+            return await asyncio.gather(*(updates(job) for job in jobs))
+        finally:
+            pool.shutdown()
+
+    for updates in asyncio.run(run()):
+        assert updates == [("html", 0, 1), ("json", 0, 1)]
+
+
+def test_env_num_workers(monkeypatch):
+    monkeypatch.delenv("SPEX_WORKERS", raising=False)
+    assert env_num_workers("SPEX_WORKERS", 3) == 3
+    monkeypatch.setenv("SPEX_WORKERS", "2")
+    assert env_num_workers("SPEX_WORKERS", 3) == 2
+
+    for val in ("0", "-1", "two", ""):
+        monkeypatch.setenv("SPEX_WORKERS", val)
+        with pytest.raises(RuntimeError, match="SPEX_WORKERS"):
+            env_num_workers("SPEX_WORKERS", 3)
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from spex.htmlspec.docx import Document
+from spex.htmlspec.parser import Paragraph, SpexParser
+
+from .utility import docx_p, docx_run, docx_tbl, write_docx
+
+BOLD = "<w:b/>"
+
+
+def parse_paragraph(tmp_path, paragraph):
+    body = docx_tbl([docx_p(docx_run("Figure 1: Spans"))], [paragraph])
+    doc = Document(write_docx(tmp_path / "spec.docx", body))
+    try:
+        (tbl,) = SpexParser(doc).parse()
+    finally:
+        doc.close()
+    (p,) = tbl.rows[1][0].elems
+    assert isinstance(p, Paragraph)
+    return p
+
+
+def test_spans_merge_runs_of_equal_formatting(tmp_path):
+    p = parse_paragraph(
+        tmp_path,
+        docx_p(
+            docx_run("Namespace ", BOLD),
+            docx_run("Identifier", BOLD),
+            docx_run(" (NSID)"),
+            docx_run(": "),
+        ),
+    )
+
+    assert [s.text for s in p.spans] == ["Namespace Identifier", " (NSID): "]
+    assert p.spans[0].style != p.spans[1].style
+
+
+def test_spans_keep_runs_of_different_formatting(tmp_path):
+    p = parse_paragraph(
+        tmp_path,
+        docx_p(docx_run("a", BOLD), docx_run("b"), docx_run("c", BOLD)),
+    )
+
+    assert [s.text for s in p.spans] == ["a", "b", "c"]
+    assert p.spans[0].style == p.spans[2].style
+
+
+def test_spans_merge_across_empty_runs(tmp_path):
+    # runs without text produce no span, and do not separate their neighbours
+    p = parse_paragraph(
+        tmp_path,
+        docx_p(docx_run("Re", BOLD), docx_run(""), docx_run("served", BOLD)),
+    )
+
+    assert [s.text for s in p.spans] == ["Reserved"]
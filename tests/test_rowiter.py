@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+
+from spex.jsonspec.exceptions import XPathElementNotFoundException
+from spex.jsonspec.rowiter import row_iter
+from spex.xml import etree
+
+TBL = """<table>
+<tr><th>Bits</th><th>Type</th><th>Description</th></tr>
+<tr><td rowspan="3">7:0</td><td colspan="2">first</td></tr>
+<tr><td>RO</td><td>second</td></tr>
+<tr><td>RW</td><td>third</td></tr>
+<tr><td>15:8</td><td>RO</td><td>fourth</td></tr>
+</table>"""
+
+
+def test_row_iter_carries_rowspan_cells():
+    tbl = etree.fromstring(TBL)
+    rows = list(row_iter(tbl))
+
+    assert [r.is_header for r in rows] == [True, False, False, False, False]
+    assert [r.elem for r in rows] == tbl.findall("tr")
+
+    span_cell = tbl.find("tr[2]/td[1]")
+    for row in rows[1:4]:
+        # the rowspan cell is referenced, not copied
+        assert row.cell(0) is span_cell
+    assert [c.col for c in rows[2].cells] == [0, 1, 2]
+    assert [c.carried for c in rows[2].cells] == [True, False, False]
+    assert rows[2].text == "7:0\nRO\nsecond"
+    assert rows[4].text == "15:8\nRO\nfourth"
+    assert rows[4].cell(0).text == "15:8"
+
+    # table is unchanged
+    assert [len(tr) for tr in tbl.findall("tr")] == [3, 2, 2, 2, 3]
+
+
+def test_row_cell_missing():
+    rows = list(row_iter(etree.fromstring(TBL)))
+
+    with pytest.raises(XPathElementNotFoundException):
+        rows[1].cell(2)
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import gzip
+import io
+
+import pytest
+from gcgen.api import Section
+from gcgen.emitter import Emitter
+
+from spex.htmlspec.sectionwriter import SectionWriter
+
+
+def sections():
+    head = Section()
+    head.emitln("<html>").indent().emit("<body>").indent()
+    head.dedent().dedent()
+    yield head
+    for ndx in range(3):
+        s = Section()
+        s.ensure_padding_lines(1)
+        s.emit("<p>").indent().emit(f"{ndx}").dedent().emit("</p>").freshline()
+        yield s
+    tail = Section()
+    tail.emitln("</html>").newline()
+    yield tail
+
+
+def test_section_writer_matches_emitter(tmp_path):
+    whole = Section()
+    for s in sections():
+        whole.add_section(s)
+    buf = io.StringIO()
+    Emitter(prefix="").emit(whole, buf)
+
+    path = tmp_path / "out.html"
+    with SectionWriter(path) as w:
+        for s in sections():
+            # add_section inserts a freshline before each section
+            w.write(Section().freshline())
+            w.write(s)
+        assert not path.exists()
+
+    assert path.read_text() == buf.getvalue()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_section_writer_discards_on_error(tmp_path):
+    path = tmp_path / "out.html"
+    path.write_text("previous")
+    with pytest.raises(RuntimeError):
+        with SectionWriter(path) as w:
+            w.indent()
+            w.write(Section().emitln("partial"))
+            raise RuntimeError("failed")
+
+    assert path.read_text() == "previous"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_section_writer_compresses_by_suffix(tmp_path):
+    path = tmp_path / "out.html.gz"
+    with SectionWriter(path) as w:
+        w.write(Section().emitln("<html>").emitln("</html>"))
+
+    with gzip.open(path, "rt") as fh:
+        assert fh.read() == "<html>\n</html>\n"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import pytest
+
+from spex.htmlspec.docx.styles import StyleResolver
+from spex.xml import etree
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+STYLES = f"""<w:styles xmlns:w="{W}">
+<w:style w:type="character" w:styleId="Base">
+  <w:rPr><w:b/><w:color w:val="FF0000"/></w:rPr>
+</w:style>
+<w:style w:type="character" w:styleId="Derived">
+  <w:aliases w:val="Alias1, Alias2"/>
+  <w:basedOn w:val="Base"/>
+  <w:rPr><w:i/><w:color w:val="00FF00"/></w:rPr>
+</w:style>
+<w:style w:type="character" w:styleId="Orphan">
+  <w:basedOn w:val="Missing"/>
+</w:style>
+<w:style w:type="character" w:styleId="Loop1"><w:basedOn w:val="Loop2"/></w:style>
+<w:style w:type="character" w:styleId="Loop2"><w:basedOn w:val="Loop1"/></w:style>
+<w:style w:type="paragraph" w:styleId="Base"/>
+</w:styles>"""
+
+
+def test_style_resolver_resolves_based_on():
+    resolver = StyleResolver(etree.fromstring(STYLES), "character")
+
+    rpr = resolver.get_style("Derived")
+    assert rpr is not None
+    assert rpr.css_attrs == {
+        "font-weight": "bold",
+        "font-style": "italic",
+        "color": "#00FF00",
+    }
+    assert resolver.get_style("Alias2") is rpr
+    assert resolver.get_style("Base") is not None
+
+
+def test_style_resolver_broken_styles():
+    resolver = StyleResolver(etree.fromstring(STYLES), "character")
+
+    with pytest.raises(KeyError):
+        resolver.get_style("Orphan")
+    with pytest.raises(ValueError):
+        resolver.get_style("Loop1")
+    with pytest.raises(KeyError):
+        resolver.get_style("Unknown")
+    assert (
+        StyleResolver(etree.fromstring(STYLES), "paragraph").get_style("Base") is None
+    )
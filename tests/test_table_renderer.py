@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import io
+
+from gcgen.api import Section
+from gcgen.emitter import Emitter
+from lxml import etree
+
+from spex.htmlspec.docx import RunProperties
+from spex.htmlspec.parser import Paragraph, Span, Table, TableCell, TcPr
+from spex.htmlspec.tablerenderer import TableRenderer
+from spex.htmlspec.treebuilder import HtmlTreeBuilder
+from spex.xml import XmlUtils
+
+
+def rpr(**kwargs) -> RunProperties:
+    props = dict(
+        bold=None,
+        italics=None,
+        underline=None,
+        strikethrough=None,
+        vert_align=None,
+        size=None,
+        color=None,
+    )
+    props.update(kwargs)
+    return RunProperties(**props)
+
+
+def table(*cells) -> Table:
+    return Table(
+        rows=[
+            [
+                TableCell(
+                    tag="td",
+                    elems=[Paragraph(spans=[Span(style=style, text=txt)])],
+                    colspan=1,
+                    rowspan=1,
+                    left=ndx,
+                    top=0,
+                    tc_pr=TcPr(shd_fill=fill) if fill else None,
+                )
+                for ndx, (style, txt, fill) in enumerate(cells)
+            ]
+        ]
+    )
+
+
+def to_str(s: Section) -> str:
+    buf = io.StringIO()
+    Emitter(prefix="").emit(s, buf)
+    return buf.getvalue()
+
+
+def test_merged_fragments_match_serial_rendering():
+    tbls = [
+        table((rpr(bold=True), "a", None), (rpr(italics=True), "b", "D9D9D9")),
+        table((rpr(color="FF0000"), "c", "BFBFBF"), (rpr(bold=True), "d", None)),
+        table((rpr(italics=True), 'e "class="txtfmt0"', "D9D9D9")),
+    ]
+
+    serial = TableRenderer()
+    s_serial = Section().indent()
+    for tbl in tbls:
+        serial.render_table(s_serial, tbl)
+
+    merged = TableRenderer()
+    s_merged = Section().indent()
+    for tbl in tbls:
+        merged.merge(s_merged, TableRenderer.render_fragment(tbl))
+
+    assert to_str(s_merged) == to_str(s_serial)
+    rules = []
+    for r in (serial, merged):
+        s = Section()
+        r.txtfmt_cache.emit_rules(s)
+        r.tcell_cache.emit_rules(s)
+        rules.append(to_str(s))
+    assert rules[0] == rules[1]
+
+
+def tables() -> list[Table]:
+    nested = table((None, "x", None), (rpr(bold=True), "y", "D9D9D9"))
+    return [
+        table((rpr(bold=True), "Figure 1: a & <b>", None), (None, "c\nd", "D9D9D9")),
+        Table(
+            id="2",
+            rows=[
+                [
+                    TableCell(
+                        tag="th",
+                        elems=[
+                            Paragraph(
+                                spans=[Span(style=None, text="e"), Span(None, "f")]
+                            ),
+                            nested,
+                            Paragraph(spans=[]),
+                        ],
+                        colspan=2,
+                        rowspan=1,
+                        left=0,
+                        top=0,
+                        tc_pr=None,
+                    ),
+                    TableCell("th", [], 2, 1, 0, 0, None),
+                ]
+            ],
+        ),
+    ]
+
+
+def test_tree_matches_parsed_rendering():
+    tbls = tables()
+    r = TableRenderer()
+    s = Section().indent()
+    builder = HtmlTreeBuilder(
+        title="spec",
+        revision=None,
+        fname="spec",
+        txtfmt_cache=r.txtfmt_cache,
+        tcell_cache=r.tcell_cache,
+    )
+    for tbl in tbls:
+        r.render_table(s, tbl)
+        builder.add_table(tbl)
+
+    rendered = etree.fromstring(f"<body>\n{to_str(s)}</body>")
+    built = builder.tree.find("body")
+    assert etree.tostring(built).strip() == etree.tostring(rendered)
+
+
+def test_compact_rendering_text_matches_tree():
+    tbls = tables()
+    tbls.append(table((None, "", None), (rpr(bold=True), "", None)))
+    tbls.append(
+        Table(
+            rows=[
+                [
+                    TableCell(
+                        tag="td",
+                        elems=[
+                            Paragraph(
+                                spans=[
+                                    Span(rpr(bold=True), "a"),
+                                    Span(rpr(bold=True, size=None), "b"),
+                                    Span(None, " c "),
+                                    Span(rpr(italics=True), "d"),
+                                    Span(None, "e"),
+                                ]
+                            )
+                        ],
+                        colspan=1,
+                        rowspan=1,
+                        left=0,
+                        top=0,
+                        tc_pr=None,
+                    )
+                ]
+            ]
+        )
+    )
+
+    r = TableRenderer(compact=True)
+    s = Section().indent()
+    builder = HtmlTreeBuilder(
+        title="spec",
+        revision=None,
+        fname="spec",
+        txtfmt_cache=r.txtfmt_cache,
+        tcell_cache=r.tcell_cache,
+    )
+    for tbl in tbls:
+        r.render_table(s, tbl)
+        builder.add_table(tbl)
+
+    compact = "".join(e for e in s.iterator() if isinstance(e, str))
+    assert "\n" not in compact
+    # same-class spans merged, unformatted text not wrapped
+    assert (
+        '<span class="txtfmt0">ab</span> c <span class="txtfmt1">d</span>e' in compact
+    )
+
+    doc = etree.ElementTree(etree.fromstring(f"<html><body>{compact}</body></html>"))
+
+    def cell_texts(body):
+        return [XmlUtils.to_text(c) for c in body.iter("td", "th")]
+
+    assert cell_texts(doc.find("body")) == cell_texts(builder.tree.find("body"))
+    assert XmlUtils.to_text(doc.find("body")) == XmlUtils.to_text(
+        builder.tree.find("body")
+    )
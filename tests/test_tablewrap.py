@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from spex.htmlspec.docx import TableWrap
+from spex.xml import etree
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def test_grid_resolves_spans_and_shading():
+    tbl = etree.fromstring(f"""<w:tbl xmlns:w="{W}">
+        <w:tr>
+          <w:tc><w:tcPr>
+            <w:vMerge w:val="restart"/><w:shd w:fill="D9D9D9"/>
+          </w:tcPr></w:tc>
+          <w:tc><w:tcPr><w:gridSpan w:val="2"/></w:tcPr></w:tc>
+        </w:tr>
+        <w:tr>
+          <w:tc><w:tcPr><w:vMerge/></w:tcPr></w:tc>
+          <w:tc/>
+          <w:tc><w:tcPr><w:shd w:fill="auto"/></w:tcPr></w:tc>
+        </w:tr>
+        </w:tbl>""")
+    grid = TableWrap(tbl).grid()
+
+    assert [len(row) for row in grid] == [3, 3]
+    merged = grid[0][0]
+    assert grid[1][0] is merged
+    assert (merged.rowspan, merged.colspan, merged.shd_fill) == (2, 1, "D9D9D9")
+    assert grid[0][1] is grid[0][2]
+    assert grid[0][1].colspan == 2
+    assert grid[1][1].shd_fill is None
+    assert grid[1][2].shd_fill == "auto"
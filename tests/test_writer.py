@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+
+import pytest
+
+from spex.binmodel import BinaryModelReader
+from spex.compression import compression_of, suffix
+from spex.writer import BinaryWriter, FileWriter, JsonlWriter, read_jsonl, read_model
+
+
+@pytest.mark.parametrize("num_entities", [0, 1, 3])
+def test_file_writer_output(tmp_path, num_entities):
+    entities = [
+        {"fig_id": str(ndx), "fields": [{"range": [0, ndx], "label": "a\nb€"}]}
+        for ndx in range(num_entities)
+    ]
+    with FileWriter(tmp_path, tmp_path / "spec.html") as w:
+        w.write_meta("specification", "spec")
+        for entity in entities:
+            w.write_entity(entity)
+        w.write_meta("lint", [])
+
+    doc = {"entities": entities, "meta": {"specification": "spec", "lint": []}}
+    txt = (tmp_path / "spec.json").read_text()
+    assert json.loads(txt) == doc
+    assert txt == json.dumps(doc, indent=2, ensure_ascii=False)
+
+
+def test_jsonl_writer_roundtrip(tmp_path):
+    entities = [{"fig_id": str(ndx), "label": "a\nb€"} for ndx in range(3)]
+    with JsonlWriter(tmp_path, tmp_path / "spec.html") as w:
+        w.write_meta("specification", "spec")
+        for entity in entities:
+            w.write_entity(entity)
+        w.write_meta("lint", [])
+
+    path = tmp_path / "spec.jsonl"
+    assert len(path.read_text().splitlines()) == len(entities) + 1
+    assert read_jsonl(path) == {
+        "meta": {"specification": "spec", "lint": []},
+        "entities": entities,
+    }
+
+
+def test_binary_writer_lazy_reader(tmp_path):
+    entities = [{"fig_id": str(ndx), "label": "a\nb€"} for ndx in range(3)]
+    with BinaryWriter(tmp_path, tmp_path / "spec.html") as w:
+        for entity in entities:
+            w.write_entity(entity)
+        w.write_meta("lint", [])
+
+    with BinaryModelReader(tmp_path / "spec.s2b") as r:
+        assert len(r) == 3
+        assert r.fig_ids == ["0", "1", "2"]
+        assert r.entity("1") == entities[1]
+        assert "3" not in r
+        with pytest.raises(KeyError):
+            r.entity("3")
+        assert list(r.entities()) == entities
+        assert r.meta == {"lint": []}
+
+
+def test_binary_reader_duplicate_fig_ids(tmp_path):
+    entities = [{"fig_id": "1", "n": 0}, {"fig_id": "2"}, {"fig_id": "1", "n": 1}]
+    with BinaryWriter(tmp_path, tmp_path / "spec.html") as w:
+        for entity in entities:
+            w.write_entity(entity)
+
+    with BinaryModelReader(tmp_path / "spec.s2b") as r:
+        # all entities are retained, look-ups by ID return the first
+        assert list(r.entities()) == entities
+        assert r.fig_ids == ["1", "2", "1"]
+        assert r.entity("1") == entities[0]
+
+
+def test_binary_reader_rejects_truncated(tmp_path):
+    with BinaryWriter(tmp_path, tmp_path / "spec.html") as w:
+        w.write_entity({"fig_id": "1"})
+    path = tmp_path / "spec.s2b"
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        BinaryModelReader(path)
+
+
+@pytest.mark.parametrize("compress", ["gzip", "zstd"])
+@pytest.mark.parametrize(
+    "writer_cls, fname", [(FileWriter, "spec.json"), (JsonlWriter, "spec.jsonl")]
+)
+def test_compressed_model_roundtrip(tmp_path, compress, writer_cls, fname):
+    if compress == "zstd":
+        pytest.importorskip("zstandard")
+    entities = [{"fig_id": str(ndx), "label": "a\nb€"} for ndx in range(3)]
+    # outputs are named after the uncompressed source
+    with writer_cls(tmp_path, tmp_path / "spec.html.gz", compress) as w:
+        for entity in entities:
+            w.write_entity(entity)
+        w.write_meta("lint", [])
+
+    path = tmp_path / f"{fname}{suffix(compress)}"
+    assert w.path == path
+    assert compression_of(path) == compress
+    assert not path.read_bytes().startswith(b"{")
+    assert read_model(path) == {"meta": {"lint": []}, "entities": entities}
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2024 Samsung Electronics Co., Ltd
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from spex.xml import Xpath, etree
+
+
+def test_xpath_cache_reuses_compiled_query():
+    doc = etree.fromstring("<table><tr><td>1</td><td>2</td></tr></table>")
+    Xpath.cache_clear()
+
+    assert len(Xpath.elems(doc, "./tr/td")) == 2
+    assert len(Xpath.elems(doc, "./tr/td")) == 2
+    assert Xpath.attrs(doc, "./tr/td/@colspan") == []
+
+    info = Xpath.cache_info()
+    assert info.misses == 2
+    assert info.hits == 1
+
+
+def test_xpath_cache_keyed_on_namespaces():
+    w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    doc_w = etree.fromstring(f'<w:tbl xmlns:w="{w}"><w:tr/></w:tbl>')
+    doc_x = etree.fromstring('<w:tbl xmlns:w="urn:other"><w:tr/><w:tr/></w:tbl>')
+    Xpath.cache_clear()
+
+    assert len(Xpath.elems(doc_w, "./w:tr")) == 1
+    assert len(Xpath.elems(doc_x, "./w:tr")) == 2
+    assert Xpath.cache_info().misses == 2
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 import json
 import re
+import zipfile
 from pathlib import Path
 from typing import Callable, List
 
@@ -157,3 +158,48 @@ HTML_DOC_TEMPLATE = """
 </body>
 </html>
 """
+
+
+DOCX_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+DOCX_STYLES = f"""<?xml version="1.0" encoding="UTF-8"?>
+<w:styles {DOCX_NS}>
+<w:style w:type="paragraph" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+</w:styles>"""
+
+DOCX_HEADER = (
+    f'<?xml version="1.0" encoding="UTF-8"?><w:hdr {DOCX_NS}>'
+    "<w:p><w:r><w:t>Spex Test Specification, Revision 1.0</w:t></w:r></w:p></w:hdr>"
+)
+
+
+def write_docx(path: Path, body: str) -> Path:
+    """write minimal docx document to `path`, with `body` as its w:body contents."""
+    doc = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<w:document {DOCX_NS}><w:body>{body}<w:sectPr/></w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", "<Types/>")
+        z.writestr("word/document.xml", doc)
+        z.writestr("word/styles.xml", DOCX_STYLES)
+        z.writestr("word/header1.xml", DOCX_HEADER)
+    return path
+
+
+def docx_run(text: str, rpr: str = "") -> str:
+    """run of `text`, `rpr` being the contents of its run properties (w:rPr)."""
+    rpr = f"<w:rPr>{rpr}</w:rPr>" if rpr else ""
+    return f"<w:r>{rpr}<w:t>{text}</w:t></w:r>"
+
+
+def docx_p(*runs: str) -> str:
+    return f"<w:p>{''.join(runs)}</w:p>"
+
+
+def docx_tbl(*rows: List[str]) -> str:
+    """table of cells, each cell given as its (block-level) contents."""
+    trs = "".join(
+        "<w:tr>" + "".join(f"<w:tc>{c}</w:tc>" for c in row) + "</w:tr>" for row in rows
+    )
+    return f"<w:tbl><w:tblPr/>{trs}</w:tbl>"